@@ -0,0 +1,266 @@
+import datetime
+import json
+
+from django.core.exceptions import ValidationError
+from django.http import HttpResponse, HttpResponseNotAllowed, JsonResponse
+
+from .exporters import make_row_encoder
+from .importers import ENTITIES
+from .pagination import get_sort, paginate_queryset
+from .views import (
+    CLIENT_FILTERABLE,
+    CLIENT_SORTABLE,
+    MEDICINE_FILTERABLE,
+    MEDICINE_SORTABLE,
+    PET_FILTERABLE,
+    PET_SORTABLE,
+    PRODUCT_FILTERABLE,
+    PRODUCT_SORTABLE,
+    VET_FILTERABLE,
+    VET_SORTABLE,
+)
+from .writes import run_write
+
+# Parámetros de las listas que no son filtros.
+RESERVED_PARAMS = ("fields", "sort", "page_size", "after", "before")
+
+# Columnas por las que se puede ordenar y filtrar cada entidad: las mismas
+# columnas con índice que en los repositorios, más la clave primaria para
+# los filtros, así que la API tampoco recorre la tabla entera.
+SORTABLE = {
+    "clients": CLIENT_SORTABLE,
+    "medicines": MEDICINE_SORTABLE,
+    "pets": PET_SORTABLE,
+    "products": PRODUCT_SORTABLE,
+    "vets": VET_SORTABLE,
+}
+FILTERABLE = {
+    "clients": CLIENT_FILTERABLE,
+    "medicines": MEDICINE_FILTERABLE,
+    "pets": PET_FILTERABLE,
+    "products": PRODUCT_FILTERABLE,
+    "vets": VET_FILTERABLE,
+}
+
+# Búsquedas permitidas en los filtros (`?campo__busqueda=valor`): las que
+# pueden resolverse con el índice de la columna.
+LOOKUPS = ("exact", "gt", "gte", "lt", "lte")
+
+
+class _ApiError(Exception):
+    """
+    Clase de error de la API: se responde como JSON con el estado indicado.
+    """
+
+    def __init__(self, status, body):
+        super().__init__(body)
+        self.status = status
+        self.body = body
+
+
+def _json_response(body, status=200):
+    return HttpResponse(body, status=status, content_type="application/json")
+
+
+def _get_entity(entity):
+    if entity not in ENTITIES:
+        raise _ApiError(404, {"error": f"No existe la entidad {entity}"})
+    return ENTITIES[entity]
+
+
+def _get_fields(request, model):
+    fields = model._meta.concrete_fields
+    requested = request.GET.get("fields", "")
+    if requested == "":
+        return list(fields)
+
+    by_name = {field.attname: field for field in fields}
+    names = [name.strip() for name in requested.split(",") if name.strip()]
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise _ApiError(400, {"error": f"Campos desconocidos: {', '.join(unknown)}"})
+    return [by_name[name] for name in names]
+
+
+def _get_filters(request, entity, model):
+    names = {model._meta.pk.attname, *dict(FILTERABLE[entity])}
+    filters = {}
+    for key, value in request.GET.items():
+        if key in RESERVED_PARAMS:
+            continue
+        name, _, lookup = key.partition("__")
+        if name not in names or (lookup and lookup not in LOOKUPS):
+            raise _ApiError(400, {"error": f"Filtro no soportado: {key}"})
+        filters[key] = value
+    return filters
+
+
+def _read_payload(request):
+    try:
+        payload = json.loads(request.body or b"{}")
+    except ValueError:
+        raise _ApiError(400, {"error": "El cuerpo debe ser JSON"}) from None
+
+    if not isinstance(payload, dict):
+        raise _ApiError(400, {"error": "El cuerpo debe ser un objeto JSON"})
+
+    # Igual que en la importación, los valores se validan como texto.
+    return {key: "" if value is None else str(value) for key, value in payload.items()}
+
+
+def _as_text(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+def _detail_response(model, pk, fields, status=200):
+    row = model.objects.filter(pk=pk).values_list(*[field.attname for field in fields]).first()
+    if row is None:
+        raise _ApiError(404, {"error": "No existe el registro"})
+    return _json_response(make_row_encoder(fields)(row), status)
+
+
+def _list(request, entity, model):
+    fields = _get_fields(request, model)
+    filters = _get_filters(request, entity, model)
+    pk_name = model._meta.pk.attname
+    sortable = SORTABLE[entity]
+    if request.GET.get("sort", sortable[0]).lstrip("-") not in sortable:
+        raise _ApiError(400, {"error": f"Orden no soportado: {request.GET['sort']}"})
+    sort_field = get_sort(request, sortable).lstrip("-")
+
+    # Además de los campos pedidos se leen la clave primaria y la columna de
+    # orden, que hacen falta para los cursores pero no se envían.
+    columns = [field.attname for field in fields]
+    select = columns + [
+        name for name in dict.fromkeys((pk_name, sort_field))
+        if name != "pk" and name not in columns
+    ]
+    index = {name: position for position, name in enumerate(select)}
+
+    def cursor_key(row, field):
+        pk = row[index[pk_name]]
+        return [pk if field == "pk" else row[index[field]], pk]
+
+    params = dict(filters)
+    if "fields" in request.GET:
+        params["fields"] = request.GET["fields"]
+
+    try:
+        queryset = model.objects.filter(**filters).values_list(*select)
+        page = paginate_queryset(request, queryset, sortable, params, cursor_key, strict=True)
+    except (ValueError, ValidationError) as error:
+        raise _ApiError(400, {"error": f"Filtro inválido: {error}"}) from None
+
+    encode = make_row_encoder(fields)
+    links = {
+        "next": page.next_url and request.path + page.next_url,
+        "previous": page.previous_url and request.path + page.previous_url,
+    }
+    return _json_response(
+        '{"results":[' + ",".join([encode(row) for row in page.items]) + "],"
+        + json.dumps(links)[1:],
+    )
+
+
+def _create(request, model, schema, columns, values):
+    data = _read_payload(request)
+    errors = schema.validate(data)
+    if errors:
+        raise _ApiError(400, {"errors": errors})
+
+    instance = run_write(model.objects.create, **dict(zip(columns, values(data))))
+    return _detail_response(model, instance.pk, model._meta.concrete_fields, status=201)
+
+
+def _update(request, instance, schema, columns, values):
+    data = _read_payload(request)
+    if request.method == "PATCH":
+        current = {
+            field.attname: _as_text(getattr(instance, field.attname))
+            for field in instance._meta.concrete_fields
+        }
+        data = {**current, **data}
+
+    errors = schema.validate(data)
+    if errors:
+        raise _ApiError(400, {"errors": errors})
+
+    for name, value in zip(columns, values(data)):
+        setattr(instance, name, value)
+    run_write(instance.save, update_fields=columns)
+    return _detail_response(type(instance), instance.pk, instance._meta.concrete_fields)
+
+
+def api_list(request, entity):
+    """
+    Lista o crea registros de una entidad.
+
+    GET devuelve una página de registros en JSON, paginada por cursor
+    (`after`, `before`, `page_size`), ordenada por `sort` y filtrada por
+    `?campo=valor` o `?campo__busqueda=valor`, sólo sobre las columnas con
+    índice (ver SORTABLE y FILTERABLE). `fields` elige las columnas a
+    devolver (por ejemplo `?fields=id,name`). POST crea un registro a partir
+    de un objeto JSON, con las mismas validaciones que los formularios.
+
+    Igual que los formularios, las escrituras exigen el token CSRF (en el
+    encabezado `X-CSRFToken`), así que otro sitio no puede modificar datos
+    con la sesión del usuario.
+
+    Args:
+        request: Objeto de solicitud HTTP.
+        entity: Nombre de la entidad ("clients", "pets", "products", "medicines" o "vets").
+
+    Returns:
+        HttpResponse: La página de registros o el registro creado, en JSON.
+    """
+    try:
+        model, schema, columns, values = _get_entity(entity)
+        if request.method == "GET":
+            return _list(request, entity, model)
+        if request.method == "POST":
+            return _create(request, model, schema, columns, values)
+    except _ApiError as error:
+        return JsonResponse(error.body, status=error.status)
+
+    return HttpResponseNotAllowed(["GET", "POST"])
+
+
+def api_detail(request, entity, id):
+    """
+    Obtiene, actualiza o elimina un registro de una entidad.
+
+    GET devuelve el registro (admite `fields`), PUT lo reemplaza, PATCH
+    actualiza sólo los campos enviados y DELETE lo elimina. Las escrituras
+    exigen el token CSRF, como en `api_list`.
+
+    Args:
+        request: Objeto de solicitud HTTP.
+        entity: Nombre de la entidad.
+        id: ID del registro.
+
+    Returns:
+        HttpResponse: El registro en JSON, o una respuesta vacía si se eliminó.
+    """
+    try:
+        model, schema, columns, values = _get_entity(entity)
+        if request.method == "GET":
+            return _detail_response(model, id, _get_fields(request, model))
+
+        if request.method not in ("PUT", "PATCH", "DELETE"):
+            return HttpResponseNotAllowed(["GET", "PUT", "PATCH", "DELETE"])
+
+        instance = model.objects.filter(pk=id).first()
+        if instance is None:
+            raise _ApiError(404, {"error": "No existe el registro"})
+
+        if request.method == "DELETE":
+            run_write(instance.delete)
+            return HttpResponse(status=204)
+
+        return _update(request, instance, schema, columns, values)
+    except _ApiError as error:
+        return JsonResponse(error.body, status=error.status)
@@ -10,3 +10,8 @@ class AppConfig(AppConfig):
     
     default_auto_field = "django.db.models.BigAutoField"
     name = "app"
+
+    def ready(self):
+        from . import signals
+
+        signals.connect()
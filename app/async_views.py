@@ -0,0 +1,236 @@
+from asgiref.sync import sync_to_async
+from django.contrib import messages
+from django.http import Http404
+from django.shortcuts import aget_object_or_404, redirect, render, reverse
+
+from .cache import aget_or_build
+from .models import CacheVersion, Client, Medicine, Pet, Product, Vet
+from .pagination import apaginate_queryset, order_queryset
+from .streaming import astream_repository
+from .views import (
+    CLIENT_FILTERABLE,
+    CLIENT_PETS,
+    CLIENT_SORTABLE,
+    FORM_WRITES,
+    MEDICINE_FILTERABLE,
+    MEDICINE_SORTABLE,
+    PET_FILTERABLE,
+    PET_RELATED,
+    PET_SORTABLE,
+    PRODUCT_FILTERABLE,
+    PRODUCT_SORTABLE,
+    REPOSITORY_DEPENDENCIES,
+    VET_FILTERABLE,
+    VET_SORTABLE,
+    _filter_repository,
+    _out_of_stock_message,
+    _render_repository,
+    _render_rows,
+    _repository_key,
+    _stock_amount,
+    save_form,
+)
+
+# Versiones asíncronas de las vistas de repositorios, formularios y stock de
+# app/views.py. Se usan en lugar de aquellas cuando ASYNC_VIEWS está activo
+# (por defecto al servir la aplicación con ASGI, ver vetsoft/asgi.py): toda la
+# espera de la base de datos pasa por el ORM asíncrono (o, para las
+# escrituras, por los mismos métodos de los modelos que usan las vistas
+# sincrónicas, con `sync_to_async`), así que una solicitud lenta no ocupa un
+# hilo del servidor.
+
+
+async def _repository_page(request, entity, queryset, sortable, filterable=()):
+    """
+    Versión asíncrona de `views._repository_page`.
+
+    Args:
+        request: Objeto de solicitud HTTP.
+        entity: Nombre del repositorio (carpeta de templates y variable de contexto).
+        queryset: Queryset con las filas del repositorio.
+        sortable: Columnas por las que se permite ordenar el repositorio.
+        filterable: Pares (columna, etiqueta) de las columnas por las que se
+            permite filtrar el repositorio.
+
+    Returns:
+        HttpResponse: La página del repositorio pedida.
+    """
+    queryset, controls = _filter_repository(request, queryset, sortable, filterable)
+
+    if request.GET.get("stream") == "1":
+        return astream_repository(request, entity, order_queryset(queryset, controls["sort"]))
+
+    async def build():
+        params = {"filter": controls["filter_params"]}
+        page = await apaginate_queryset(request, queryset, sortable, params)
+        return page, _render_rows(entity, page)
+
+    versions = await CacheVersion.aget_tokens(
+        queryset.model, *REPOSITORY_DEPENDENCIES.get(entity, ()),
+    )
+    key = _repository_key(request, entity, versions, queryset.model, sortable, controls)
+    page, rows_html = await aget_or_build(key, build)
+    return _render_repository(request, entity, page, rows_html, controls)
+
+
+async def _form_page(request, entity, id, name, repo, warn=False, related=()):
+    """
+    Maneja el formulario de creación y actualización de una entidad.
+
+    Guarda con `views.save_form`, igual que las vistas sincrónicas: los
+    métodos `save_*` y `update_*` del modelo validan y escriben con
+    `coordinated_write`, así que una actualización se comporta igual con
+    las dos clases de vistas.
+
+    Args:
+        request: Objeto de solicitud HTTP.
+        entity: Nombre de la entidad, que es también la carpeta de templates.
+        id: ID opcional del registro a editar.
+        name: Nombre del registro en el contexto del template.
+        repo: Nombre de la URL del repositorio al que se vuelve al guardar.
+        warn: Si es True, los errores también se muestran como mensaje.
+        related: Relaciones que muestra el formulario, que se leen junto con
+            el registro (en una vista asíncrona no se pueden leer después).
+
+    Returns:
+        HttpResponse: Redirige al repositorio si se guarda con éxito, o
+        renderiza el formulario con los errores o con el registro a editar.
+    """
+    model = FORM_WRITES[entity][0]
+    template = f"{entity}/form.html"
+
+    if request.method == "POST":
+        saved, errors = await sync_to_async(save_form)(entity, request.POST)
+        if saved:
+            return redirect(reverse(repo))
+
+        if warn:
+            messages.warning(request, f"{errors}")
+
+        return render(request, template, {"errors": errors, name: request.POST})
+
+    instance = None
+    if id is not None:
+        queryset = model.objects.select_related(*related) if related else model
+        instance = await aget_object_or_404(queryset, pk=id)
+
+    return render(request, template, {name: instance})
+
+
+async def clients_repository(request):
+    """
+    Muestra los clientes del repositorio, paginados por cursor.
+    """
+    return await _repository_page(
+        request, "clients", Client.objects.prefetch_related(CLIENT_PETS),
+        CLIENT_SORTABLE, CLIENT_FILTERABLE,
+    )
+
+
+async def clients_form(request, id=None):
+    """
+    Maneja el formulario de creación y actualización de clientes.
+    """
+    return await _form_page(request, "clients", id, "client", "clients_repo", warn=True)
+
+
+async def medicines_repository(request):
+    """
+    Muestra los medicamentos del repositorio, paginados por cursor.
+    """
+    return await _repository_page(
+        request, "medicines", Medicine.objects.all(), MEDICINE_SORTABLE, MEDICINE_FILTERABLE,
+    )
+
+
+async def medicines_form(request, id=None):
+    """
+    Maneja el formulario de creación y actualización de medicamentos.
+    """
+    return await _form_page(request, "medicines", id, "medicine", "medicines_repo")
+
+
+async def products_repository(request):
+    """
+    Muestra los productos del repositorio, paginados por cursor.
+    """
+    return await _repository_page(
+        request, "products", Product.objects.all(), PRODUCT_SORTABLE, PRODUCT_FILTERABLE,
+    )
+
+
+async def products_form(request, id=None):
+    """
+    Maneja el formulario de creación y actualización de productos.
+    """
+    return await _form_page(request, "products", id, "product", "products_repo")
+
+
+async def increase_stock(request):
+    """
+    Aumenta el stock de un producto según el ID y la cantidad opcional `amount`
+    proporcionados en la solicitud POST.
+    """
+    if request.method == "POST":
+        product_id = request.POST.get("product_id")
+        amount = _stock_amount(request)
+        if amount is None:
+            messages.warning(request, "La cantidad debe ser un número entero positivo.")
+            return redirect("products_repo")
+
+        if not await Product.aincrease_stock(product_id, amount):
+            raise Http404("No existe el producto.")
+
+        return redirect("products_repo")
+
+
+async def decrease_stock(request):
+    """
+    Disminuye el stock de un producto según el ID y la cantidad opcional `amount`
+    proporcionados en la solicitud POST.
+    """
+    if request.method == "POST":
+        product_id = request.POST.get("product_id")
+        amount = _stock_amount(request)
+        if amount is None:
+            messages.warning(request, "La cantidad debe ser un número entero positivo.")
+            return redirect("products_repo")
+
+        if not await Product.adecrease_stock(product_id, amount):
+            messages.warning(request, _out_of_stock_message(request))
+
+        return redirect("products_repo")
+
+
+async def pets_repository(request):
+    """
+    Muestra las mascotas del repositorio, paginadas por cursor.
+    """
+    return await _repository_page(
+        request, "pets", Pet.objects.select_related(*PET_RELATED), PET_SORTABLE, PET_FILTERABLE,
+    )
+
+
+async def pets_form(request, id=None):
+    """
+    Maneja el formulario de creación y actualización de mascotas.
+    """
+    return await _form_page(
+        request, "pets", id, "pet", "pets_repo", warn=True, related=PET_RELATED,
+    )
+
+
+async def vet_repository(request):
+    """
+    Muestra los veterinarios del repositorio, paginados por cursor.
+    """
+    return await _repository_page(
+        request, "vets", Vet.objects.all(), VET_SORTABLE, VET_FILTERABLE,
+    )
+
+
+async def vet_form(request, id=None):
+    """
+    Maneja el formulario de creación y actualización de veterinarios.
+    """
+    return await _form_page(request, "vets", id, "vet", "vet_repo")
@@ -0,0 +1,25 @@
+from django.db.backends.sqlite3 import base
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    Clase de conexión a SQLite que puede abrir las transacciones con
+    BEGIN IMMEDIATE.
+
+    Con BEGIN (DEFERRED) una transacción toma el lock de escritura recién en
+    su primera escritura, y si otra conexión lo tiene, SQLite no puede esperar
+    y falla con "database is locked". Con BEGIN IMMEDIATE el lock se pide al
+    comenzar, donde sí se respeta busy_timeout.
+
+    Atributos:
+        immediate_transactions: Si es True, las transacciones que se abran
+            usan BEGIN IMMEDIATE (ver `app.writes.run_write`).
+    """
+
+    immediate_transactions = False
+
+    def _start_transaction_under_autocommit(self):
+        if self.immediate_transactions:
+            self.cursor().execute("BEGIN IMMEDIATE")
+        else:
+            super()._start_transaction_under_autocommit()
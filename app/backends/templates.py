@@ -0,0 +1,34 @@
+import time
+
+from django.template.backends import django
+
+from app.instrumentation import record_template
+
+
+class Template(django.Template):
+    """
+    Clase de template de Django que mide su tiempo de renderizado para las
+    métricas de la solicitud (ver `app.middleware.RequestTimingMiddleware`).
+
+    Sólo se miden los templates que se renderizan desde el código; los
+    `include` y `extends` forman parte del template que los usa.
+    """
+
+    def render(self, context=None, request=None):
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            record_template(time.perf_counter() - start)
+
+
+class DjangoTemplates(django.DjangoTemplates):
+    """
+    Clase del motor de templates de Django que devuelve templates medidos.
+    """
+
+    def from_string(self, template_code):
+        return Template(super().from_string(template_code).template, self)
+
+    def get_template(self, template_name):
+        return Template(super().get_template(template_name).template, self)
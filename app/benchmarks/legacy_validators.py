@@ -0,0 +1,176 @@
+import re
+from datetime import datetime
+
+# Copia de las validaciones anteriores a app/validation.py, usada como
+# referencia por el comando bench_validation y por los tests de paridad.
+
+
+def validate_client(data):
+    """
+    Valida los datos del cliente.
+
+    Args:
+        data: Diccionario con los datos del cliente.
+
+    Returns:
+        dict: Un diccionario con errores de validación si los hay.
+    """
+    errors = {}
+
+    name = data.get("name", "")
+    phone = data.get("phone", "")
+    email = data.get("email", "")
+
+    if name == "":
+        errors["name"] = "Por favor ingrese un nombre"
+    elif not re.match(r"^[a-zA-ZÁÉÍÓÚáéíóúüÜ\s]+$", name):
+        errors["name"] = "El nombre solo debe contener letras y espacios"
+
+    if phone == "":
+        errors["phone"] = "Por favor ingrese un teléfono"
+    elif not re.match("^[0-9]+$", phone):
+        errors["phone"] = "El teléfono sólo puede contener números"
+    elif not re.match("^54", phone):
+        errors["phone"] = "El teléfono debe comenzar con '54'"
+
+    if email == "":
+        errors["email"] = "Por favor ingrese un email"
+    elif not email.endswith("@vetsoft.com"):
+        errors["email"] = "El correo electrónico debe terminar en @vetsoft.com"
+    elif email.count("@") == 0:
+        errors["email"] = "Por favor ingrese un email válido"
+
+    return errors
+
+
+def validate_pet(data):
+    """
+    Valida los datos de la mascota.
+
+    Args:
+        data: Diccionario con los datos de la mascota.
+
+    Returns:
+        dict: Un diccionario con errores de validación si los hay.
+    """
+    errors = {}
+
+    name = data.get("name", "")
+    breed = data.get("breed", "")
+    birthday = data.get("birthday", "")
+
+    if name == "":
+        errors["name"] = "Por favor ingrese un nombre"
+
+    if breed == "":
+        errors["breed"] = "Por favor ingrese la raza"
+
+    if birthday == "":
+        errors["birthday"] = "Por favor ingrese una fecha"
+    elif datetime.strptime(birthday, "%Y-%m-%d").date() > datetime.now().date():
+        errors["birthday"] = "La fecha de cumpleaños no puede ser mayor al dia actual"
+
+    return errors
+
+
+def validate_medicines(data):
+    """
+    Valida los datos de la medicina.
+
+    Args:
+        data: Diccionario con los datos de la medicina.
+
+    Returns:
+        dict: Un diccionario con errores de validación si los hay.
+    """
+    errors = {}
+    name = data.get("name", "")
+    description = data.get("description", "")
+    dose = data.get("dose", "")
+
+    if name == "":
+        errors["name"] = "Por favor, ingrese un nombre para la medicina"
+
+    if description == "":
+        errors["description"] = "Por favor, ingrese una descripcion"
+
+    if dose == "":
+        errors["dose"] = "Por favor, ingrese una dosis para la medicina"
+    try:
+        dose = int(dose)
+        if (dose < 1) or (dose > 10):
+            errors["dose"] = "La dosis debe ser entre 1 y 10"
+    except ValueError:
+        errors["dose"] = "La dosis debe ser un número entero"
+
+    return errors
+
+
+def validate_products(data):
+    """
+    Valida los datos del producto.
+
+    Args:
+        data: Diccionario con los datos del producto.
+
+    Returns:
+        dict: Un diccionario con errores de validación si los hay.
+    """
+    errors = {}
+    name = data.get("name", "")
+    type = data.get("type", "")
+    price = data.get("price", "")
+    stock = data.get("stock", "")
+
+    if name == "":
+        errors["name"] = "Ingrese el nombre del producto"
+
+    if type == "":
+        errors["type"] = "Ingrese el tipo de producto"
+
+    if price == "" :
+        errors["price"] = "Ingrese el precio del producto"
+    try:
+        price = float(price)
+        if price < 0:
+            errors["price"] = "El precio no puede ser negativo"
+    except ValueError:
+        errors["price"] = "El precio debe ser un número valido"
+
+    try:
+        stock = int(stock)
+        if stock < 0:
+            errors["stock"] = "El stock no puede ser negativo"
+    except ValueError:
+        errors["stock"] = "El stock debe ser un número entero"
+
+    return errors
+
+
+def validate_vet(data):
+    """
+    Valida los datos del veterinario.
+
+    Args:
+        data: Diccionario con los datos del veterinario.
+
+    Returns:
+        dict: Un diccionario con errores de validación si los hay.
+    """
+    errors = {}
+    name = data.get("name", "")
+    email = data.get("email", "")
+    phone = data.get("phone", "")
+
+    if name == "":
+        errors["name"] = "Por favor, ingrese el nombre del veterinario/a"
+
+    if email == "":
+        errors["email"] = "Por favor ingrese un email del veterinario/a"
+    elif email.count("@") == 0:
+        errors["email"] = "Por favor ingrese un email válido del veterinario/a"
+
+    if phone == "":
+        errors["phone"] = "Por favor, ingrese el telefono del veterinario/a"
+
+    return errors
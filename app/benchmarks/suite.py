@@ -0,0 +1,318 @@
+import io
+import math
+import time
+
+from django.test import Client as HttpClient
+from django.urls import reverse
+
+from app import urls, warmup
+from app.models import (
+    Client,
+    Medicine,
+    Pet,
+    Product,
+    Vet,
+    validate_client,
+    validate_medicines,
+    validate_pet,
+    validate_products,
+    validate_vet,
+)
+
+# Escenarios que recorren una tabla entera: se miden con menos iteraciones.
+HEAVY = ("url:export_data",)
+
+CLIENT_DATA = {"name": "Juan Perez", "phone": "54221555232", "email": "juan@vetsoft.com", "address": "Calle 1"}
+PRODUCT_DATA = {"name": "Collar", "type": "Accesorio", "price": "300", "stock": "10"}
+PET_DATA = {"name": "Firulais", "breed": "Labrador", "birthday": "2020-01-01"}
+MEDICINE_DATA = {"name": "Amoxicilina", "description": "Antibiótico", "dose": "5"}
+VET_DATA = {"name": "Ana Gomez", "email": "ana@vetsoft.com", "phone": "54221555000"}
+
+
+def percentile(ordered, fraction):
+    """
+    Percentil por rango más cercano de una lista ordenada.
+
+    Args:
+        ordered: Valores ordenados de menor a mayor.
+        fraction: Percentil pedido, entre 0 y 1.
+
+    Returns:
+        float: El valor del percentil.
+    """
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarize(latencies):
+    """
+    Resume las latencias de un escenario.
+
+    Args:
+        latencies: Duración de cada iteración, en segundos.
+
+    Returns:
+        dict: Iteraciones, p50/p95/p99 en milisegundos y operaciones por segundo.
+    """
+    ordered = sorted(latencies)
+    return {
+        "iterations": len(ordered),
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "ops_per_sec": round(len(ordered) / sum(ordered), 1) if sum(ordered) else None,
+    }
+
+
+def measure(operation, iterations, warmup=0, prepare=None):
+    """
+    Mide una operación varias veces.
+
+    Args:
+        operation: Función a medir; recibe lo que devuelve `prepare`.
+        iterations: Cantidad de iteraciones medidas.
+        warmup: Iteraciones previas que no se miden.
+        prepare: Función opcional que prepara cada iteración (por ejemplo,
+            crea la fila a eliminar) y no se incluye en la medición.
+
+    Returns:
+        dict: El resumen de `summarize`.
+    """
+    latencies = []
+    for index in range(warmup + iterations):
+        args = prepare() if prepare is not None else ()
+        start = time.perf_counter()
+        operation(*args)
+        elapsed = time.perf_counter() - start
+        if index >= warmup:
+            latencies.append(elapsed)
+    return summarize(latencies)
+
+
+def _middle_pk(model):
+    pks = model.objects.order_by("pk").values_list("pk", flat=True)
+    count = model.objects.count()
+    return pks[count // 2] if count else None
+
+
+class Context:
+    """
+    Clase de datos compartidos por los escenarios: el cliente HTTP y filas
+    existentes de cada modelo.
+    """
+
+    def __init__(self):
+        self.http = HttpClient()
+        self.ids = {
+            model: _middle_pk(model) for model in (Client, Medicine, Pet, Product, Vet)
+        }
+        # Producto propio para los cambios de stock, para no quedarse sin stock.
+        self.stock_product = Product.objects.create(
+            name="Producto de benchmark", type="Benchmark", price=1, stock=10**9,
+        )
+        # Y otro sin stock, para medir la baja rechazada.
+        self.empty_product = Product.objects.create(
+            name="Producto de benchmark sin stock", type="Benchmark", price=1, stock=0,
+        )
+
+    def get(self, path, data=None):
+        return lambda: self.check(self.http.get(path, data))
+
+    def post(self, path, data):
+        return lambda: self.check(self.http.post(path, data))
+
+    def delete_new(self, path, model, field, values):
+        """
+        Escenario que elimina, en cada iteración, una fila creada antes de medir.
+        """
+        def prepare():
+            return (model.objects.create(**values).pk,)
+
+        def operation(pk):
+            self.check(self.http.post(path, {field: pk}))
+
+        return operation, prepare
+
+    @staticmethod
+    def check(response):
+        if response.status_code >= 400:
+            raise AssertionError(f"{response.request['PATH_INFO']}: estado {response.status_code}")
+        if response.streaming:
+            for _ in response.streaming_content:
+                pass
+
+
+def _import_file():
+    lines = ["name,phone,email,address"]
+    lines += [f"Cliente Importado,5422155{index:04d},imp{index}@vetsoft.com,Calle 2" for index in range(100)]
+    upload = io.BytesIO("\n".join(lines).encode())
+    upload.name = "clientes.csv"
+    return upload
+
+
+def _warmed_up():
+    # Las solicitudes del benchmark no pasan por vetsoft.wsgi, que calienta el
+    # proceso y lo marca como listo.
+    warmup.READY.set()
+    return ()
+
+
+def url_scenarios(context):
+    """
+    Arma un escenario por cada URL de `app/urls.py`, con el nombre de la URL.
+
+    Las URL sin parámetros que no tienen un escenario propio se miden con un
+    GET; si una URL con parámetros no tiene escenario se informa un error, para
+    que las URL nuevas no queden fuera del benchmark. Los casos de una URL que
+    siguen otro camino se agregan con un nombre propio (por ejemplo,
+    `decrease_stock_out_of_stock`).
+
+    Args:
+        context: Contexto de los escenarios.
+
+    Returns:
+        dict: Escenarios por nombre, como función o par (función, preparación).
+    """
+    ids = context.ids
+    product = context.stock_product.pk
+    # Se busca el nombre de una fila existente, para que la búsqueda tenga
+    # resultados (y cargue sus relaciones) con cualquier cantidad de datos.
+    client_name = Client.objects.get(pk=ids[Client]).name.split()[0]
+    pet_name = Pet.objects.get(pk=ids[Pet]).name
+    specific = {
+        "clients_search": context.get(reverse("clients_search"), {"q": client_name}),
+        "clients_edit": context.get(reverse("clients_edit", args=[ids[Client]])),
+        "clients_delete": context.delete_new(
+            reverse("clients_delete"), Client, "client_id", CLIENT_DATA,
+        ),
+        "medicines_edit": context.get(reverse("medicines_edit", args=[ids[Medicine]])),
+        "medicines_delete": context.delete_new(
+            reverse("medicines_delete"), Medicine, "medicine_id", {**MEDICINE_DATA, "dose": 5},
+        ),
+        "products_edit": context.get(reverse("products_edit", args=[ids[Product]])),
+        "products_delete": context.delete_new(
+            reverse("products_delete"), Product, "product_id",
+            {**PRODUCT_DATA, "price": 300, "stock": 10},
+        ),
+        "increase_stock": context.post(reverse("increase_stock"), {"product_id": product}),
+        "decrease_stock": context.post(
+            reverse("decrease_stock"),
+            {"product_id": product, "product_name": context.stock_product.name},
+        ),
+        "pets_search": context.get(reverse("pets_search"), {"q": pet_name}),
+        "pets_edit": context.get(reverse("pets_edit", args=[ids[Pet]])),
+        "pets_delete": context.delete_new(reverse("pets_delete"), Pet, "pet_id", PET_DATA),
+        "vet_edit": context.get(reverse("vet_edit", args=[ids[Vet]])),
+        "vet_delete": context.delete_new(reverse("vet_delete"), Vet, "vet_id", VET_DATA),
+        "import_data": (
+            lambda upload: context.check(
+                context.http.post(reverse("import_data"), {"entity": "clients", "file": upload}),
+            ),
+            lambda: (_import_file(),),
+        ),
+        "export_data": context.get(reverse("export_data", args=["clients"])),
+        "api_list": context.get(reverse("api_list", args=["clients"])),
+        "api_detail": context.get(reverse("api_detail", args=["clients", ids[Client]])),
+        "ready": (context.get(reverse("ready")), _warmed_up),
+    }
+
+    scenarios, missing = {}, []
+    for pattern in urls.urlpatterns:
+        if pattern.name in specific:
+            scenarios[pattern.name] = specific[pattern.name]
+        elif not pattern.pattern.converters:
+            scenarios[pattern.name] = context.get(reverse(pattern.name))
+        else:
+            missing.append(pattern.name)
+
+    if missing:
+        raise ValueError(f"URL sin escenario de benchmark: {', '.join(missing)}")
+
+    scenarios["decrease_stock_out_of_stock"] = context.post(
+        reverse("decrease_stock"),
+        {"product_id": context.empty_product.pk, "product_name": context.empty_product.name},
+    )
+    return scenarios
+
+
+def model_scenarios(context):
+    """
+    Arma los escenarios de las operaciones de los modelos: altas,
+    modificaciones, validaciones y cambios de stock.
+
+    Args:
+        context: Contexto de los escenarios.
+
+    Returns:
+        dict: Escenarios por nombre.
+    """
+    product = Product.objects.get(pk=context.ids[Product])
+    client = Client.objects.get(pk=context.ids[Client])
+    stock_product = context.stock_product.pk
+    return {
+        "save_client": lambda: Client.save_client(CLIENT_DATA),
+        "update_client": lambda: client.update_client(CLIENT_DATA),
+        "save_product": lambda: Product.save_product(PRODUCT_DATA),
+        "update_product": lambda: product.update_product(PRODUCT_DATA),
+        "increase_stock": lambda: Product.increase_stock(stock_product),
+        "decrease_stock": lambda: Product.decrease_stock(stock_product),
+        "validate_client": lambda: validate_client(CLIENT_DATA),
+        "validate_pet": lambda: validate_pet(PET_DATA),
+        "validate_products": lambda: validate_products(PRODUCT_DATA),
+        "validate_medicines": lambda: validate_medicines(MEDICINE_DATA),
+        "validate_vet": lambda: validate_vet(VET_DATA),
+    }
+
+
+def run(iterations, warmup=3, only=None):
+    """
+    Ejecuta los escenarios de URL (`url:<nombre>`) y de modelos
+    (`model:<nombre>`) sobre la base de datos actual.
+
+    Args:
+        iterations: Iteraciones medidas por escenario.
+        warmup: Iteraciones previas que no se miden.
+        only: Nombres de escenarios a ejecutar (por defecto todos).
+
+    Returns:
+        dict: El resumen de cada escenario, por nombre.
+    """
+    context = Context()
+    scenarios = {
+        **{f"url:{name}": scenario for name, scenario in url_scenarios(context).items()},
+        **{f"model:{name}": scenario for name, scenario in model_scenarios(context).items()},
+    }
+
+    results = {}
+    for name, scenario in scenarios.items():
+        if only and name not in only:
+            continue
+        operation, prepare = scenario if isinstance(scenario, tuple) else (scenario, None)
+        count = min(iterations, 5) if name in HEAVY else iterations
+        results[name] = measure(operation, count, min(warmup, count), prepare)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compara los resultados con una línea de base.
+
+    Un escenario es una regresión si su p95 supera al de la línea de base en
+    más de `threshold` (por ejemplo, 0.2 es un 20 % más lento).
+
+    Args:
+        results: Resumen de cada escenario (ver `run`).
+        baseline: Resultados guardados de una ejecución anterior.
+        threshold: Aumento relativo del p95 que se tolera.
+
+    Returns:
+        list: Tuplas (escenario, p95 de base, p95 actual, cambio relativo,
+        es regresión), de los escenarios presentes en ambos.
+    """
+    rows = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if not before or not before["p95_ms"]:
+            continue
+        change = result["p95_ms"] / before["p95_ms"] - 1
+        rows.append((name, before["p95_ms"], result["p95_ms"], change, change > threshold))
+    return rows
@@ -0,0 +1,149 @@
+import asyncio
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .metrics import record_cache
+
+_MISSING = object()
+
+# Locks por proceso, repartidos por hash de la clave, para que sólo un hilo de
+# cada proceso reconstruya una misma clave a la vez.
+_LOCKS = [threading.Lock() for _ in range(64)]
+
+
+def get_cache():
+    """
+    Obtiene el backend de caché configurado para los repositorios.
+
+    Returns:
+        BaseCache: El backend de REPOSITORY_CACHE_ALIAS.
+    """
+    return caches[settings.REPOSITORY_CACHE_ALIAS]
+
+
+def make_key(prefix, versions, params):
+    """
+    Arma una clave de caché a partir de las versiones y los parámetros de la solicitud.
+
+    Args:
+        prefix: Prefijo de la clave (por ejemplo, el nombre del repositorio).
+        versions: Versiones de los modelos de los que depende el valor
+            (ver `CacheVersion.get_tokens`).
+        params: QueryDict o diccionario con los parámetros que cambian el valor.
+
+    Returns:
+        str: La clave de caché.
+    """
+    if hasattr(params, "lists"):
+        items = sorted(params.lists())
+    else:
+        items = sorted(params.items())
+    digest = hashlib.sha1(repr(items).encode()).hexdigest()
+    return f"{prefix}:{versions}:{digest}"
+
+
+def get_or_build(key, build, timeout=None):
+    """
+    Devuelve el valor cacheado de `key` o lo construye con `build`.
+
+    Si la clave no está, sólo una solicitud la reconstruye: dentro de cada
+    proceso se serializa con un lock, y entre procesos se toma un lock en la
+    caché con `add()`; el resto espera a que el valor aparezca (hasta
+    REPOSITORY_CACHE_LOCK_TIMEOUT segundos) en lugar de repetir la consulta.
+
+    Args:
+        key: Clave de caché.
+        build: Función sin argumentos que calcula el valor.
+        timeout: Duración del valor en la caché (por defecto REPOSITORY_CACHE_TIMEOUT).
+
+    Returns:
+        object: El valor cacheado o recién construido.
+    """
+    cache = get_cache()
+    timeout = settings.REPOSITORY_CACHE_TIMEOUT if timeout is None else timeout
+
+    name = key.split(":", 1)[0]
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        record_cache(name, hit=True)
+        return value
+
+    with _LOCKS[hash(key) % len(_LOCKS)]:
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            record_cache(name, hit=True)
+            return value
+
+        lock_key = f"{key}:lock"
+        lock_timeout = settings.REPOSITORY_CACHE_LOCK_TIMEOUT
+        locked = cache.add(lock_key, 1, lock_timeout)
+        if not locked:
+            deadline = time.monotonic() + lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.01)
+                value = cache.get(key, _MISSING)
+                if value is not _MISSING:
+                    record_cache(name, hit=True)
+                    return value
+
+        record_cache(name, hit=False)
+        try:
+            value = build()
+            cache.set(key, value, timeout)
+        finally:
+            if locked:
+                cache.delete(lock_key)
+
+    return value
+
+
+async def aget_or_build(key, build, timeout=None):
+    """
+    Versión asíncrona de `get_or_build`, para las vistas asíncronas.
+
+    Usa la API asíncrona de la caché y sólo el lock en la caché (que también
+    coordina las solicitudes del mismo proceso); mientras espera el valor
+    libera el event loop en lugar de bloquear un hilo.
+
+    Args:
+        key: Clave de caché.
+        build: Función asíncrona sin argumentos que calcula el valor.
+        timeout: Duración del valor en la caché (por defecto REPOSITORY_CACHE_TIMEOUT).
+
+    Returns:
+        object: El valor cacheado o recién construido.
+    """
+    cache = get_cache()
+    timeout = settings.REPOSITORY_CACHE_TIMEOUT if timeout is None else timeout
+
+    name = key.split(":", 1)[0]
+    value = await cache.aget(key, _MISSING)
+    if value is not _MISSING:
+        record_cache(name, hit=True)
+        return value
+
+    lock_key = f"{key}:lock"
+    lock_timeout = settings.REPOSITORY_CACHE_LOCK_TIMEOUT
+    locked = await cache.aadd(lock_key, 1, lock_timeout)
+    if not locked:
+        deadline = time.monotonic() + lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+            value = await cache.aget(key, _MISSING)
+            if value is not _MISSING:
+                record_cache(name, hit=True)
+                return value
+
+    record_cache(name, hit=False)
+    try:
+        value = await build()
+        await cache.aset(key, value, timeout)
+    finally:
+        if locked:
+            await cache.adelete(lock_key)
+
+    return value
@@ -4,6 +4,7 @@ links = [
     {"label": "Home", "href": reverse("home"), "icon": "bi bi-house-door"},
     {"label": "Clientes", "href": reverse("clients_repo"), "icon": "bi bi-people"},
     {"label": "Mascotas", "href": reverse("pets_repo"), "icon":"bi bi-heart-pulse"},
+    {"label": "Importar", "href": reverse("import_data"), "icon": "bi bi-upload"},
 ]
 
 
@@ -0,0 +1,153 @@
+import datetime
+
+from django.db.models import Count, F, Q, Sum
+
+from .models import (
+    Client,
+    Medicine,
+    Pet,
+    PetBirthdayCount,
+    Product,
+    SummaryCounter,
+    Vet,
+)
+from .writes import coordinated_write
+
+# Modelos que se cuentan en el tablero; el contador de cada uno lleva el
+# nombre del modelo ("client", "pet", ...).
+COUNTED_MODELS = (Client, Pet, Medicine, Product, Vet)
+
+OUT_OF_STOCK = "product_out_of_stock"
+
+# Rangos de edad de las mascotas: (desde, hasta) en años cumplidos, sin
+# incluir el límite superior.
+PET_AGE_BUCKETS = (
+    ("Menos de 1 año", 0, 1),
+    ("1 a 3 años", 1, 4),
+    ("4 a 7 años", 4, 8),
+    ("8 años o más", 8, None),
+)
+
+
+def _years_before(day, years):
+    """
+    Fecha `years` años antes de `day`; el 29 de febrero pasa al 28 si el año
+    no es bisiesto.
+    """
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+
+def _age_filter(low, high, today):
+    # Una mascota tiene al menos `n` años si nació el día `_years_before(today, n)` o antes.
+    condition = Q()
+    if low:
+        condition &= Q(birthday__lte=_years_before(today, low))
+    if high is not None:
+        condition &= Q(birthday__gt=_years_before(today, high))
+    return condition
+
+
+def get_dashboard(today=None):
+    """
+    Arma los datos del tablero de inicio a partir de las tablas de resumen,
+    sin recorrer las tablas de los modelos: dos consultas sobre unas pocas
+    filas, sin importar cuántos clientes, mascotas o productos haya.
+
+    Args:
+        today: Fecha con la que se calculan las edades (por defecto, hoy).
+
+    Returns:
+        dict: Cantidad de filas por modelo (`counts`), valor del inventario
+        (`inventory_value`), productos sin stock (`out_of_stock`) y mascotas
+        por rango de edad (`pet_ages`, pares de etiqueta y cantidad).
+    """
+    today = today or datetime.date.today()
+    counters = {counter.name: counter for counter in SummaryCounter.objects.all()}
+
+    def count(name):
+        return counters[name].count if name in counters else 0
+
+    ages = PetBirthdayCount.objects.aggregate(**{
+        str(index): Sum("count", filter=_age_filter(low, high, today), default=0)
+        for index, (_, low, high) in enumerate(PET_AGE_BUCKETS)
+    })
+    return {
+        "counts": {model._meta.model_name: count(model._meta.model_name) for model in COUNTED_MODELS},
+        "inventory_value": counters["product"].total if "product" in counters else 0,
+        "out_of_stock": count(OUT_OF_STOCK),
+        "pet_ages": [
+            (label, ages[str(index)]) for index, (label, _, _) in enumerate(PET_AGE_BUCKETS)
+        ],
+    }
+
+
+def compute_summary():
+    """
+    Calcula los contadores del tablero recorriendo las tablas de los modelos.
+
+    Returns:
+        tuple: Contadores, como diccionario de nombre a (cantidad, total), y
+        cantidad de mascotas por fecha de nacimiento.
+    """
+    counters = {
+        model._meta.model_name: (model.objects.count(), 0)
+        for model in COUNTED_MODELS if model is not Product
+    }
+    products = Product.objects.aggregate(
+        count=Count("id"),
+        value=Sum(F("price") * F("stock"), default=0),
+        out_of_stock=Count("id", filter=Q(stock__lte=0)),
+    )
+    counters["product"] = (products["count"], products["value"])
+    counters[OUT_OF_STOCK] = (products["out_of_stock"], 0)
+
+    birthdays = dict(
+        Pet.objects.order_by().values("birthday").annotate(count=Count("id"))
+        .values_list("birthday", "count"),
+    )
+    return counters, birthdays
+
+
+@coordinated_write
+def rebuild_summary():
+    """
+    Vuelve a calcular las tablas de resumen desde las tablas de los modelos,
+    para corregirlas si quedaron desfasadas (por ejemplo, después de cargar
+    datos con los triggers desactivados o en una base que no es SQLite).
+
+    Returns:
+        list: Contadores corregidos, como tuplas (nombre, valor anterior,
+        valor nuevo); vacía si el resumen estaba al día.
+    """
+    counters, birthdays = compute_summary()
+
+    stored = {
+        name: (count, total)
+        for name, count, total in SummaryCounter.objects.values_list("name", "count", "total")
+    }
+    stored_birthdays = dict(PetBirthdayCount.objects.values_list("birthday", "count"))
+
+    changes = [
+        (name, stored.get(name), value) for name, value in counters.items()
+        if stored.get(name) is None
+        or stored[name][0] != value[0]
+        or abs(stored[name][1] - value[1]) > 0.005
+    ]
+    changes += [(name, stored[name], None) for name in stored.keys() - counters.keys()]
+    if stored_birthdays != birthdays:
+        changes.append(("pet_birthday", sum(stored_birthdays.values()), sum(birthdays.values())))
+
+    SummaryCounter.objects.all().delete()
+    SummaryCounter.objects.bulk_create(
+        SummaryCounter(name=name, count=count, total=total)
+        for name, (count, total) in counters.items()
+    )
+    PetBirthdayCount.objects.all().delete()
+    PetBirthdayCount.objects.bulk_create(
+        (PetBirthdayCount(birthday=birthday, count=count) for birthday, count in birthdays.items()),
+        batch_size=1000,
+    )
+    return changes
@@ -0,0 +1,283 @@
+import csv
+import io
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from .models import PET_LINKED_SCHEMA, CacheVersion, Client, Medicine, Pet, Product, Vet
+from .search import deferred_indexing
+from .validation import (
+    CLIENT_SCHEMA,
+    MEDICINE_SCHEMA,
+    PRODUCT_SCHEMA,
+    VET_SCHEMA,
+    parse_date,
+)
+from .writes import run_write
+
+FORMATS = ("csv", "json", "jsonl")
+
+
+def _client_values(row):
+    return (row["name"], row["phone"], row["email"], row.get("address", ""))
+
+
+def _optional_id(value):
+    return int(value) if value else None
+
+
+def _pet_values(row):
+    return (
+        row["name"], row["breed"], parse_date(row["birthday"]).isoformat(),
+        _optional_id(row.get("owner_id")), _optional_id(row.get("vet_id")),
+    )
+
+
+def _product_values(row):
+    return (row["name"], row["type"], float(row["price"]), int(row["stock"]))
+
+
+def _medicine_values(row):
+    return (row["name"], row["description"], int(row["dose"]))
+
+
+def _vet_values(row):
+    return (row["name"], row["email"], row["phone"])
+
+
+# Entidades importables: modelo, esquema de validación de las filas, columnas a
+# insertar y conversión de la fila validada a los valores de esas columnas. Las
+# mascotas van al final para que, al generar datos (ver app/seeding.py), ya
+# estén cargados los clientes y veterinarios con los que se vinculan.
+ENTITIES = {
+    "clients": (Client, CLIENT_SCHEMA, ("name", "phone", "email", "address"), _client_values),
+    "products": (Product, PRODUCT_SCHEMA, ("name", "type", "price", "stock"), _product_values),
+    "medicines": (Medicine, MEDICINE_SCHEMA, ("name", "description", "dose"), _medicine_values),
+    "vets": (Vet, VET_SCHEMA, ("name", "email", "phone"), _vet_values),
+    "pets": (
+        Pet, PET_LINKED_SCHEMA, ("name", "breed", "birthday", "owner_id", "vet_id"), _pet_values,
+    ),
+}
+
+
+class ImportResult:
+    """
+    Clase de resultado de una importación: cuenta las filas creadas y las
+    rechazadas, y guarda los errores de las primeras filas rechazadas.
+
+    Atributos:
+        created: Cantidad de filas insertadas.
+        failed: Cantidad de filas rechazadas.
+        errors: Lista de (número de fila, errores) de hasta `max_errors` filas.
+    """
+
+    def __init__(self, max_errors):
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+        self.max_errors = max_errors
+
+    def add_error(self, number, errors):
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((number, errors))
+
+
+def _iter_json_array(stream, chunk_size=64 * 1024):
+    """
+    Recorre un arreglo JSON de objetos leyendo el archivo por bloques, sin
+    cargarlo completo en memoria.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    started = False
+    eof = False
+
+    while True:
+        buffer = buffer.lstrip().lstrip(",").lstrip()
+
+        if not started and buffer:
+            if buffer[0] != "[":
+                raise ValueError("El archivo JSON debe contener un arreglo de objetos")
+            buffer = buffer[1:]
+            started = True
+            continue
+
+        if started and buffer.startswith("]"):
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer)
+        except ValueError:
+            if eof:
+                if buffer:
+                    raise
+                return
+            chunk = stream.read(chunk_size)
+            eof = chunk == ""
+            buffer += chunk
+            continue
+
+        # Un número o literal al final del bloque puede estar cortado.
+        if end == len(buffer) and not eof:
+            chunk = stream.read(chunk_size)
+            eof = chunk == ""
+            buffer += chunk
+            continue
+
+        buffer = buffer[end:]
+        yield item
+
+
+def _iter_json_lines(stream):
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def iter_rows(stream, format):
+    """
+    Recorre las filas de un archivo CSV, JSON (arreglo) o JSON Lines.
+
+    Args:
+        stream: Archivo de texto abierto.
+        format: "csv", "json" o "jsonl".
+
+    Returns:
+        iterator: Diccionarios con los valores de cada fila como texto.
+    """
+    if format == "csv":
+        rows = csv.DictReader(stream)
+    elif format == "json":
+        rows = _iter_json_array(stream)
+    elif format == "jsonl":
+        rows = _iter_json_lines(stream)
+    else:
+        raise ValueError(f"Formato no soportado: {format}")
+
+    for row in rows:
+        if not isinstance(row, dict):
+            yield {}
+            continue
+        yield {
+            key: "" if value is None else str(value)
+            for key, value in row.items()
+            if key is not None
+        }
+
+
+def guess_format(filename):
+    """
+    Deduce el formato de un archivo a partir de su extensión.
+
+    Args:
+        filename: Nombre del archivo.
+
+    Returns:
+        str: "csv", "json" o "jsonl" (por defecto "csv").
+    """
+    extension = filename.rsplit(".", 1)[-1].lower()
+    return extension if extension in FORMATS else "csv"
+
+
+def bulk_insert(model, fields, rows):
+    """
+    Inserta filas ya validadas con un único INSERT preparado que se ejecuta con
+    `executemany`, dentro de una transacción.
+
+    Cumple el rol de `bulk_create`, pero sin crear una instancia del modelo ni
+    compilar cada valor por separado, que en SQLite es lo que limita la
+    velocidad de carga. Igual que `bulk_create`, no envía señales ni llama a
+    `save()`. El índice de búsqueda de las filas nuevas se arma al final del
+    bloque (ver `deferred_indexing`).
+
+    Args:
+        model: Modelo en cuya tabla se inserta.
+        fields: Nombres de las columnas a insertar.
+        rows: Lista de tuplas con los valores de cada fila, en el orden de `fields`.
+    """
+    table = connection.ops.quote_name(model._meta.db_table)
+    columns = ", ".join(
+        connection.ops.quote_name(model._meta.get_field(field).column) for field in fields
+    )
+    placeholders = ", ".join(["%s"] * len(fields))
+    sql = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+
+    with transaction.atomic(), deferred_indexing(model), connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
+        CacheVersion.bump(model)
+
+
+def import_rows(entity, rows, chunk_size=None, max_errors=None, on_error=None):
+    """
+    Valida e inserta filas de una entidad en bloques.
+
+    Las filas se leen en bloques de `chunk_size`; cada bloque se valida con
+    `validate_many` (las mismas reglas que los formularios) y sus filas válidas
+    se insertan con `bulk_insert` en su propia transacción, de modo que la
+    memoria usada no depende del tamaño del archivo.
+
+    Args:
+        entity: Nombre de la entidad ("clients", "pets", "products", "medicines" o "vets").
+        rows: Iterable de diccionarios con los valores de cada fila.
+        chunk_size: Cantidad de filas por bloque (por defecto IMPORT_CHUNK_SIZE).
+        max_errors: Cantidad máxima de errores a guardar en el resultado.
+        on_error: Función opcional que recibe (número de fila, errores) de cada fila rechazada.
+
+    Returns:
+        ImportResult: Cantidad de filas creadas y rechazadas, y sus errores.
+    """
+    model, schema, fields, values = ENTITIES[entity]
+    chunk_size = chunk_size or settings.IMPORT_CHUNK_SIZE
+    result = ImportResult(
+        settings.IMPORT_MAX_ERRORS if max_errors is None else max_errors,
+    )
+
+    numbered = enumerate(rows, start=1)
+    while True:
+        batch = list(islice(numbered, chunk_size))
+        if not batch:
+            break
+
+        chunk = []
+        batch_errors = schema.validate_many(row for _, row in batch)
+        for (number, row), errors in zip(batch, batch_errors):
+            if not errors:
+                try:
+                    chunk.append(values(row))
+                except (KeyError, ValueError) as error:
+                    errors = {"row": f"Fila inválida: {error}"}
+
+            if errors:
+                result.add_error(number, errors)
+                if on_error is not None:
+                    on_error(number, errors)
+
+        if chunk:
+            run_write(bulk_insert, model, fields, chunk)
+            result.created += len(chunk)
+
+    return result
+
+
+def import_file(entity, file, format, **kwargs):
+    """
+    Importa un archivo binario (por ejemplo un archivo subido) de una entidad.
+
+    Args:
+        entity: Nombre de la entidad a importar.
+        file: Archivo abierto en modo binario.
+        format: "csv", "json" o "jsonl".
+        **kwargs: Opciones de `import_rows`.
+
+    Returns:
+        ImportResult: El resultado de la importación.
+    """
+    stream = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        return import_rows(entity, iter_rows(stream, format), **kwargs)
+    finally:
+        stream.detach()
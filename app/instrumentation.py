@@ -0,0 +1,111 @@
+import contextvars
+import time
+from collections import Counter
+
+# Métricas de la solicitud en curso. Es una variable de contexto, así que
+# también se ve desde los hilos de `sync_to_async` que usan las vistas
+# asíncronas para consultar la base de datos.
+_current = contextvars.ContextVar("vetsoft_request_metrics", default=None)
+
+
+class RequestMetrics:
+    """
+    Clase de métricas de una solicitud: consultas SQL y tiempos de la base de
+    datos y de los templates.
+
+    Atributos:
+        request: Solicitud medida.
+        queries: Cantidad de consultas ejecutadas.
+        db_seconds: Tiempo total de las consultas.
+        template_seconds: Tiempo total de renderizado de templates.
+        statements: Cantidad de veces que se ejecutó cada SQL (sin parámetros).
+    """
+
+    def __init__(self, request=None):
+        self.request = request
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.template_seconds = 0.0
+        self.statements = Counter()
+
+    def add_query(self, sql, seconds):
+        self.queries += 1
+        self.db_seconds += seconds
+        self.statements[sql] += 1
+
+    def repeated_queries(self, limit):
+        """
+        Devuelve las consultas que se repitieron al menos `limit` veces con
+        distintos parámetros, el síntoma de un problema N+1.
+
+        Args:
+            limit: Repeticiones a partir de las que se informa una consulta.
+
+        Returns:
+            list: Pares (sql, repeticiones), de la más repetida a la menos.
+        """
+        return [(sql, count) for sql, count in self.statements.most_common() if count >= limit]
+
+
+def start_request(request=None):
+    """
+    Empieza a medir la solicitud en curso.
+
+    Args:
+        request: Objeto de solicitud HTTP.
+
+    Returns:
+        tuple: Las métricas de la solicitud y el token para `finish_request`.
+    """
+    metrics = RequestMetrics(request)
+    return metrics, _current.set(metrics)
+
+
+def finish_request(token):
+    """
+    Deja de medir la solicitud iniciada con `start_request`.
+
+    Args:
+        token: Token devuelto por `start_request`.
+    """
+    _current.reset(token)
+
+
+def current_request():
+    """
+    Obtiene la solicitud que se está midiendo.
+
+    Returns:
+        HttpRequest: La solicitud en curso, o None fuera de una solicitud
+        (por ejemplo, en un comando de administración).
+    """
+    metrics = _current.get()
+    return None if metrics is None else metrics.request
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Envoltorio de ejecución de la base de datos (ver `connection.execute_wrappers`)
+    que suma cada consulta a las métricas de la solicitud en curso.
+    """
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.add_query(sql, time.perf_counter() - start)
+
+
+def record_template(seconds):
+    """
+    Suma el tiempo de renderizado de un template a la solicitud en curso.
+
+    Args:
+        seconds: Duración del renderizado.
+    """
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.template_seconds += seconds
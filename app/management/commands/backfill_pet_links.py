@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app.models import CacheVersion, Pet
+from app.pet_links import LINK_COLUMNS, backfill_links, read_links
+
+
+class Command(BaseCommand):
+    """
+    Comando que vincula las mascotas existentes con su dueño y su veterinario
+    a partir de un archivo CSV, por bloques.
+    """
+
+    help = f"Vincula mascotas con su dueño y veterinario desde un CSV ({', '.join(LINK_COLUMNS)})."
+
+    def add_arguments(self, parser):
+        parser.add_argument("file", help="Archivo CSV con los vínculos.")
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.PET_LINKS_BATCH_SIZE,
+            help="Mascotas por bloque.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            updated = backfill_links(
+                read_links(options["file"]), options["batch_size"],
+                on_batch=lambda updated: self.stderr.write(f"{updated} mascotas vinculadas..."),
+            )
+        except (OSError, ValueError) as error:
+            raise CommandError(str(error)) from error
+        finally:
+            CacheVersion.bump(Pet)
+
+        self.stdout.write(self.style.SUCCESS(f"Se vincularon {updated} mascotas."))
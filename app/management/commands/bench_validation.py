@@ -0,0 +1,91 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from app.benchmarks import legacy_validators
+from app.importers import ENTITIES
+
+LEGACY = {
+    "clients": legacy_validators.validate_client,
+    "pets": legacy_validators.validate_pet,
+    "products": legacy_validators.validate_products,
+    "medicines": legacy_validators.validate_medicines,
+    "vets": legacy_validators.validate_vet,
+}
+
+# Filas de ejemplo de cada entidad: la mayoría válidas y algunas con errores,
+# como en una importación real.
+SAMPLES = {
+    "clients": [
+        {"name": "Juan Sebastián Veron", "phone": "54221555232", "email": "brujita75@vetsoft.com"},
+        {"name": "Guido Carrillo", "phone": "54221232555", "email": "goleador@vetsoft.com"},
+        {"name": "Juan 3", "phone": "221555232", "email": "juan@gmail.com"},
+    ],
+    "pets": [
+        {"name": "Firulais", "breed": "Labrador", "birthday": "2020-01-01"},
+        {"name": "Michi", "breed": "Siames", "birthday": "2021-12-31"},
+        {"name": "", "breed": "Caniche", "birthday": "2999-01-01"},
+    ],
+    "products": [
+        {"name": "Alimento", "type": "Perro", "price": "1500.5", "stock": "10"},
+        {"name": "Collar", "type": "Gato", "price": "300", "stock": "0"},
+        {"name": "Correa", "type": "", "price": "-1", "stock": "x"},
+    ],
+    "medicines": [
+        {"name": "Paracetamol", "description": "Analgésico", "dose": "5"},
+        {"name": "Ibuprofeno", "description": "Antiinflamatorio", "dose": "10"},
+        {"name": "Amoxicilina", "description": "", "dose": "20"},
+    ],
+    "vets": [
+        {"name": "Ana Gómez", "email": "ana@vetsoft.com", "phone": "54221555000"},
+        {"name": "Luis Pérez", "email": "luis@vetsoft.com", "phone": "54221555001"},
+        {"name": "Sin email", "email": "sin-arroba", "phone": ""},
+    ],
+}
+
+
+def _rate(count, function):
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+class Command(BaseCommand):
+    """
+    Comando que compara la velocidad de las validaciones anteriores con la de
+    los esquemas de app/validation.py, en registros por segundo.
+    """
+
+    help = "Mide registros/s de las validaciones anteriores y de los esquemas compilados."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100000)
+        parser.add_argument(
+            "--entity", action="append", choices=sorted(ENTITIES),
+            help="Entidad a medir (se puede repetir; por defecto todas).",
+        )
+
+    def handle(self, *args, **options):
+        count = options["rows"]
+        entities = options["entity"] or sorted(ENTITIES)
+
+        self.stdout.write(
+            f"{'entidad':<10} {'anterior':>12} {'validate':>12} {'validate_many':>14} {'mejora':>7}",
+        )
+        for entity in entities:
+            sample = SAMPLES[entity]
+            rows = [dict(sample[i % len(sample)]) for i in range(count)]
+            legacy = LEGACY[entity]
+            schema = ENTITIES[entity][1]
+
+            for row in rows[:len(sample)]:
+                if legacy(row) != schema.validate(row):
+                    raise AssertionError(f"{entity}: resultados distintos para {row}")
+
+            old = _rate(count, lambda: [legacy(row) for row in rows])
+            single = _rate(count, lambda: [schema.validate(row) for row in rows])
+            many = _rate(count, lambda: schema.validate_many(rows))
+
+            self.stdout.write(
+                f"{entity:<10} {old:>12,.0f} {single:>12,.0f} {many:>14,.0f} {many / old:>6.1f}x",
+            )
@@ -0,0 +1,143 @@
+import contextlib
+import json
+import os
+import platform
+import sqlite3
+import tempfile
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+
+from app.benchmarks.suite import compare, run
+from app.importers import ENTITIES
+from app.seeding import bulk_load, parse_size, seed_entity
+
+NO_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+
+class Command(BaseCommand):
+    """
+    Comando que mide la latencia (p50/p95/p99) y el throughput de cada URL de
+    app/urls.py y de las operaciones de los modelos, sobre una base de datos
+    aparte cargada con la cantidad de filas pedida.
+    """
+
+    help = "Mide la latencia y el throughput de las vistas y operaciones de los modelos."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size", default="1k", help="Filas por modelo: 1k, 100k, 1m o un número.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument(
+            "--scenario", action="append",
+            help="Escenario a medir, por ejemplo url:clients_repo (se puede repetir).",
+        )
+        parser.add_argument(
+            "--database",
+            help="Archivo de la base de benchmark (por defecto, uno temporal por tamaño).",
+        )
+        parser.add_argument(
+            "--keepdb", action="store_true",
+            help="Conserva la base de benchmark para reutilizarla en la próxima ejecución.",
+        )
+        parser.add_argument(
+            "--no-cache", action="store_true", help="Mide sin la caché de repositorios.",
+        )
+        parser.add_argument("--output", help="Archivo JSON donde guardar los resultados.")
+        parser.add_argument("--baseline", help="Archivo JSON de resultados con el cual comparar.")
+        parser.add_argument(
+            "--threshold", type=float, default=0.2,
+            help="Aumento del p95 respecto de la base que se considera regresión (0.2 = 20%%).",
+        )
+
+    def handle(self, *args, **options):
+        size = parse_size(options["size"])
+        database = options["database"] or os.path.join(
+            tempfile.gettempdir(), f"vetsoft-benchmark-{size}.sqlite3",
+        )
+
+        connection.settings_dict.setdefault("TEST", {})["NAME"] = database
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, keepdb=options["keepdb"], serialize=False,
+        )
+        try:
+            self.seed(size, options["seed"])
+            with contextlib.ExitStack() as stack:
+                # El cliente HTTP de Django usa el host "testserver".
+                stack.enter_context(
+                    override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]),
+                )
+                if options["no_cache"]:
+                    stack.enter_context(override_settings(CACHES=NO_CACHE))
+                results = run(options["iterations"], options["warmup"], options["scenario"])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=options["keepdb"])
+
+        report = {
+            "size": size,
+            "seed": options["seed"],
+            "cache": not options["no_cache"],
+            "environment": {
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "sqlite": sqlite3.sqlite_version,
+            },
+            "results": results,
+        }
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                json.dump(report, file, indent=2)
+
+        comparison = {}
+        if options["baseline"]:
+            with open(options["baseline"]) as file:
+                baseline = json.load(file)
+            if baseline.get("size") != size:
+                self.stderr.write(
+                    self.style.WARNING(f"La base de comparación usa {baseline.get('size')} filas."),
+                )
+            comparison = {
+                row[0]: row for row in compare(results, baseline["results"], options["threshold"])
+            }
+
+        self.write_table(results, comparison)
+
+        regressions = [name for name, row in comparison.items() if row[4]]
+        if regressions:
+            raise CommandError(
+                f"{len(regressions)} escenarios superan el umbral de "
+                f"{options['threshold']:.0%}: {', '.join(regressions)}",
+            )
+
+    def seed(self, size, seed):
+        with bulk_load():
+            for entity, (model, *_) in ENTITIES.items():
+                existing = model.objects.count()
+                if existing < size:
+                    self.stderr.write(f"Cargando {size - existing} filas de {entity}...")
+                    seed_entity(entity, size - existing, seed + existing)
+
+    def write_table(self, results, comparison):
+        header = f"{'escenario':<28} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'ops/s':>10}"
+        if comparison:
+            header += f" {'base p95':>9} {'cambio':>8}"
+        self.stdout.write(header)
+
+        for name, result in results.items():
+            line = (
+                f"{name:<28} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+                f"{result['p99_ms']:>9.2f} {result['ops_per_sec'] or 0:>10,.1f}"
+            )
+            if name in comparison:
+                _, before, _, change, regression = comparison[name]
+                line += f" {before:>9.2f} {change:>+8.0%}"
+                if regression:
+                    line = self.style.ERROR(line)
+            self.stdout.write(line)
+
@@ -0,0 +1,44 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand
+
+from app.exporters import FORMATS, export_entity
+from app.importers import ENTITIES
+
+
+class Command(BaseCommand):
+    """
+    Comando que exporta todas las filas de una entidad en CSV o JSON Lines.
+    """
+
+    help = "Exporta clientes, mascotas, productos, medicinas o veterinarios en CSV o JSON Lines."
+
+    def add_arguments(self, parser):
+        parser.add_argument("entity", choices=sorted(ENTITIES))
+        parser.add_argument("--format", choices=FORMATS, default="csv")
+        parser.add_argument("--gzip", action="store_true", help="Comprime la salida en gzip.")
+        parser.add_argument(
+            "--output", default="-", help="Archivo de salida ('-' para la salida estándar).",
+        )
+
+    def handle(self, *args, **options):
+        blocks = export_entity(options["entity"], options["format"], options["gzip"])
+
+        start = time.perf_counter()
+        size = 0
+        if options["output"] == "-":
+            for block in blocks:
+                sys.stdout.buffer.write(block)
+                size += len(block)
+            sys.stdout.buffer.flush()
+        else:
+            with open(options["output"], "wb") as file:
+                for block in blocks:
+                    file.write(block)
+                    size += len(block)
+
+            self.stderr.write(
+                f"Se exportaron {size} bytes a {options['output']} "
+                f"en {time.perf_counter() - start:.2f}s",
+            )
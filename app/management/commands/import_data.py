@@ -0,0 +1,72 @@
+import csv
+import json
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.importers import ENTITIES, FORMATS, guess_format, import_file
+
+
+class Command(BaseCommand):
+    """
+    Comando que importa clientes, mascotas, productos, medicinas o veterinarios
+    desde un archivo CSV, JSON o JSON Lines.
+    """
+
+    help = "Importa filas desde un archivo CSV, JSON o JSON Lines validando cada fila."
+
+    def add_arguments(self, parser):
+        parser.add_argument("entity", choices=sorted(ENTITIES))
+        parser.add_argument("path", help="Archivo a importar ('-' para la entrada estándar).")
+        parser.add_argument("--format", choices=FORMATS, help="Por defecto se deduce de la extensión.")
+        parser.add_argument("--chunk-size", type=int, help="Filas por bloque de inserción.")
+        parser.add_argument(
+            "--errors", help="Archivo CSV donde escribir el reporte de filas rechazadas.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        format = options["format"] or guess_format(path)
+
+        report = None
+        writer = None
+        if options["errors"]:
+            report = open(options["errors"], "w", newline="", encoding="utf-8")
+            writer = csv.writer(report)
+            writer.writerow(["fila", "errores"])
+
+        def on_error(number, errors):
+            if writer is not None:
+                writer.writerow([number, json.dumps(errors, ensure_ascii=False)])
+
+        start = time.perf_counter()
+        try:
+            if path == "-":
+                result = self._import(options, sys.stdin.buffer, format, on_error)
+            else:
+                with open(path, "rb") as file:
+                    result = self._import(options, file, format, on_error)
+        except (OSError, ValueError) as error:
+            raise CommandError(f"No se pudo importar {path}: {error}") from error
+        finally:
+            if report is not None:
+                report.close()
+        elapsed = time.perf_counter() - start
+
+        for number, errors in result.errors[:20]:
+            self.stderr.write(f"Fila {number}: {errors}")
+        if result.failed > 20:
+            self.stderr.write(f"... y {result.failed - 20} filas más con errores")
+
+        rate = result.created / elapsed if elapsed > 0 else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"Se importaron {result.created} filas ({result.failed} con errores) "
+            f"en {elapsed:.2f}s ({rate:.0f} filas/s)",
+        ))
+
+    def _import(self, options, file, format, on_error):
+        return import_file(
+            options["entity"], file, format,
+            chunk_size=options["chunk_size"], on_error=on_error,
+        )
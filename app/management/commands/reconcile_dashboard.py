@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from app.dashboard import rebuild_summary
+
+
+class Command(BaseCommand):
+    """
+    Comando que vuelve a calcular los contadores del tablero de inicio desde
+    las tablas de los modelos e informa los que estaban desfasados.
+    """
+
+    help = "Reconstruye los contadores del tablero de inicio."
+
+    def handle(self, *args, **options):
+        changes = rebuild_summary()
+        for name, before, after in changes:
+            self.stdout.write(self.style.WARNING(f"{name}: {before} -> {after}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"Tablero reconstruido ({len(changes)} contadores corregidos).",
+        ))
@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app.slow_queries import aggregate, log_files, plan_warnings
+
+SORT_KEYS = {
+    "total": lambda shape: shape["total_ms"],
+    "max": lambda shape: shape["max_ms"],
+    "count": lambda shape: shape["count"],
+}
+
+
+class Command(BaseCommand):
+    """
+    Comando que resume el log de consultas lentas: las formas de consulta que
+    más tiempo consumieron, con su origen y su plan de ejecución.
+    """
+
+    help = "Muestra las consultas lentas más costosas del log de SLOW_QUERY_LOG."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--file", default=str(settings.SLOW_QUERY_LOG))
+        parser.add_argument("--top", type=int, default=10)
+        parser.add_argument("--sort", choices=sorted(SORT_KEYS), default="total")
+
+    def handle(self, *args, **options):
+        paths = log_files(options["file"])
+        if not paths:
+            raise CommandError(f"No existe el log {options['file']}")
+
+        lines = []
+        for path in paths:
+            with open(path) as file:
+                lines.extend(file)
+
+        shapes = sorted(aggregate(lines), key=SORT_KEYS[options["sort"]], reverse=True)
+        for position, shape in enumerate(shapes[: options["top"]], start=1):
+            views = ", ".join(f"{view} ({count})" for view, count in shape["views"].most_common(3))
+            self.stdout.write(
+                f"{position}. [{shape['shape']}] {shape['count']} veces, "
+                f"total {shape['total_ms']:.1f} ms, máximo {shape['max_ms']:.1f} ms",
+            )
+            self.stdout.write(f"   origen: {views}")
+            self.stdout.write(f"   sql: {shape['sql']}")
+            for line in shape["plan"] or ["(sin plan)"]:
+                self.stdout.write(f"   plan: {line}")
+            for warning in plan_warnings(shape["plan"]):
+                self.stdout.write(self.style.WARNING(f"   ! {warning}"))
@@ -0,0 +1,442 @@
+import atexit
+import bisect
+import json
+import os
+import threading
+import time
+import weakref
+
+from django.conf import settings
+
+from .writes import STATS
+
+# Límites (en segundos) de los buckets del histograma de latencia.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Tipo y descripción de cada métrica expuesta en /metrics.
+METRICS = {
+    "vetsoft_request_duration_seconds": (
+        "histogram", "Duración de las solicitudes por nombre de URL.",
+    ),
+    "vetsoft_requests_total": ("counter", "Solicitudes por nombre de URL y estado HTTP."),
+    "vetsoft_db_queries_total": ("counter", "Consultas SQL por nombre de URL."),
+    "vetsoft_db_query_seconds_total": (
+        "counter", "Tiempo total de las consultas SQL por nombre de URL.",
+    ),
+    "vetsoft_cache_requests_total": (
+        "counter", "Lecturas de la caché de repositorios por resultado (hit o miss).",
+    ),
+    "vetsoft_cache_hit_ratio": (
+        "gauge", "Proporción de lecturas de la caché de repositorios servidas desde la caché.",
+    ),
+    "vetsoft_writes_total": ("counter", "Escrituras coordinadas por resultado."),
+    "vetsoft_write_retries_total": ("counter", "Reintentos de escrituras por bloqueo."),
+    "vetsoft_write_backoff_seconds_total": (
+        "counter", "Tiempo total esperado entre reintentos de escrituras.",
+    ),
+}
+
+
+class _Shard:
+    """
+    Clase de acumulador de un hilo: sólo lo modifica su hilo, así que se
+    actualiza sin locks.
+    """
+
+    __slots__ = ("counters", "histograms")
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+
+    def merge(self, other):
+        # Copias: el hilo dueño de `other` puede seguir registrando.
+        for key, value in other.counters.copy().items():
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, buckets in other.histograms.copy().items():
+            _add_buckets(self.histograms, key, list(buckets))
+
+
+class _ShardHolder:
+    """
+    Clase del objeto guardado en el `threading.local` de cada hilo: cuando el
+    hilo termina se libera, y eso retira su acumulador (ver `Registry`).
+    """
+
+    __slots__ = ("shard", "__weakref__")
+
+    def __init__(self, shard):
+        self.shard = shard
+
+
+class Registry:
+    """
+    Clase de registro de métricas del proceso.
+
+    Cada hilo acumula en su propio `_Shard`, sin locks; al leer las métricas
+    (`collect`) se suman los acumuladores de todos los hilos. El lock sólo se
+    toma la primera vez que un hilo registra algo, al leer y cuando termina
+    un hilo: sus datos se suman a un acumulador de hilos terminados y su
+    `_Shard` se descarta, así que los hilos de corta vida de los servidores
+    con hilos o de `sync_to_async` no hacen crecer la lista.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._retired = _Shard()
+        # Reentrante: un hilo puede terminar (y retirarse) mientras otro
+        # código del mismo hilo tiene el lock tomado durante el GC.
+        self._lock = threading.RLock()
+
+    def _shard(self):
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            shard = _Shard()
+            holder = self._local.holder = _ShardHolder(shard)
+            with self._lock:
+                self._shards.append(shard)
+            finalizer = weakref.finalize(holder, self._retire, shard)
+            finalizer.atexit = False
+        return holder.shard
+
+    def _retire(self, shard):
+        with self._lock:
+            self._shards.remove(shard)
+            self._retired.merge(shard)
+
+    def inc(self, name, labels=(), amount=1):
+        """
+        Suma `amount` a un contador.
+
+        Args:
+            name: Nombre de la métrica.
+            labels: Tupla de pares (etiqueta, valor).
+            amount: Cantidad a sumar.
+        """
+        counters = self._shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + amount
+
+    def observe(self, name, value, labels=()):
+        """
+        Registra una observación en un histograma de LATENCY_BUCKETS.
+
+        Args:
+            name: Nombre de la métrica.
+            value: Valor observado, en segundos.
+            labels: Tupla de pares (etiqueta, valor).
+        """
+        histograms = self._shard().histograms
+        key = (name, labels)
+        buckets = histograms.get(key)
+        if buckets is None:
+            # Una cuenta por bucket, otra para +Inf y la suma de los valores.
+            buckets = histograms[key] = [0] * (len(LATENCY_BUCKETS) + 1) + [0.0]
+        buckets[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        buckets[-1] += value
+
+    def collect(self):
+        """
+        Suma los acumuladores de todos los hilos del proceso.
+
+        Returns:
+            dict: Los contadores y los histogramas del proceso, con claves
+            (nombre, etiquetas).
+        """
+        total = _Shard()
+        with self._lock:
+            shards = list(self._shards)
+            total.merge(self._retired)
+
+        for shard in shards:
+            total.merge(shard)
+        counters, histograms = total.counters, total.histograms
+
+        writes = STATS.snapshot()
+        for result, field in (("ok", "writes"), ("failed", "failures")):
+            counters[("vetsoft_writes_total", (("result", result),))] = writes[field]
+        counters[("vetsoft_write_retries_total", ())] = writes["retries"]
+        counters[("vetsoft_write_backoff_seconds_total", ())] = writes["backoff_seconds"]
+
+        return {"counters": counters, "histograms": histograms}
+
+
+def _add_buckets(histograms, key, buckets):
+    current = histograms.get(key)
+    if current is None:
+        histograms[key] = buckets
+    else:
+        for index, value in enumerate(buckets):
+            current[index] += value
+
+
+REGISTRY = Registry()
+
+# Identifica el archivo de métricas del proceso: el pid solo podría repetirse
+# en un proceso nuevo y pisar el archivo de uno anterior.
+_STARTED = int(time.time() * 1000)
+
+
+def _process_file():
+    return os.path.join(settings.METRICS_DIR, f"{os.getpid()}-{_STARTED}.json")
+
+
+RETIRED_FILE = "retired.json"
+
+
+def _write(path, collected):
+    data = {
+        kind: [[name, labels, value] for (name, labels), value in values.items()]
+        for kind, values in collected.items()
+    }
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as file:
+        json.dump(data, file)
+    os.replace(temporary, path)
+
+
+def _read(path, into):
+    try:
+        with open(path) as file:
+            data = json.load(file)
+    except (OSError, ValueError):
+        return
+
+    for name, labels, value in data["counters"]:
+        key = (name, tuple(tuple(label) for label in labels))
+        into["counters"][key] = into["counters"].get(key, 0) + value
+    for name, labels, buckets in data["histograms"]:
+        key = (name, tuple(tuple(label) for label in labels))
+        _add_buckets(into["histograms"], key, buckets)
+
+
+def write_process_metrics():
+    """
+    Guarda las métricas del proceso en su archivo de METRICS_DIR, para que
+    /metrics las sume aunque la solicitud la atienda otro proceso.
+    """
+    if not settings.METRICS_DIR:
+        return
+
+    _write(_process_file(), REGISTRY.collect())
+
+
+def retire_process_metrics(pid, directory=None):
+    """
+    Suma las métricas de un proceso que terminó al archivo acumulado de los
+    procesos terminados (RETIRED_FILE) y borra su archivo, para que los
+    workers que gunicorn recicla no llenen METRICS_DIR. Se llama desde el
+    maestro cuando termina un worker.
+
+    Args:
+        pid: PID del proceso que terminó.
+        directory: Directorio de métricas (por defecto, METRICS_DIR).
+
+    Returns:
+        int: Cantidad de archivos sumados al acumulado.
+    """
+    directory = directory or settings.METRICS_DIR
+    if not directory or not os.path.isdir(directory):
+        return 0
+
+    prefix = f"{pid}-"
+    filenames = [filename for filename in os.listdir(directory) if filename.startswith(prefix)]
+    finished = [filename for filename in filenames if filename.endswith(".json")]
+    if finished:
+        retired = os.path.join(directory, RETIRED_FILE)
+        collected = {"counters": {}, "histograms": {}}
+        _read(retired, collected)
+        for filename in finished:
+            _read(os.path.join(directory, filename), collected)
+        _write(retired, collected)
+
+    for filename in filenames:
+        try:
+            os.remove(os.path.join(directory, filename))
+        except FileNotFoundError:
+            continue
+    return len(finished)
+
+
+def clear_process_metrics(directory=None):
+    """
+    Borra los archivos de métricas de los procesos de un arranque anterior,
+    para que /metrics no los siga sumando. Se llama al iniciar el servidor,
+    antes de crear los procesos que atienden solicitudes.
+
+    Args:
+        directory: Directorio de métricas (por defecto, METRICS_DIR). Si no
+            existe, se crea.
+
+    Returns:
+        int: Cantidad de archivos borrados.
+    """
+    directory = directory or settings.METRICS_DIR
+    if not directory:
+        return 0
+
+    os.makedirs(directory, exist_ok=True)
+    removed = 0
+    for filename in os.listdir(directory):
+        if filename.endswith((".json", ".json.tmp")):
+            try:
+                os.remove(os.path.join(directory, filename))
+            except FileNotFoundError:
+                continue
+            removed += 1
+    return removed
+
+
+class _Flusher:
+    """
+    Clase del hilo que guarda periódicamente las métricas del proceso cuando
+    METRICS_DIR está configurado.
+    """
+
+    def __init__(self):
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        if self._thread is not None or not settings.METRICS_DIR:
+            return
+        with self._lock:
+            if self._thread is None:
+                os.makedirs(settings.METRICS_DIR, exist_ok=True)
+                self._thread = threading.Thread(
+                    target=self._work, name="vetsoft-metrics", daemon=True,
+                )
+                self._thread.start()
+                atexit.register(write_process_metrics)
+
+    def _work(self):
+        while True:
+            time.sleep(settings.METRICS_FLUSH_INTERVAL)
+            try:
+                write_process_metrics()
+            except OSError:
+                # Se vuelve a intentar en el próximo intervalo.
+                pass
+
+
+FLUSHER = _Flusher()
+
+
+def record_request(url_name, status, seconds, queries, db_seconds):
+    """
+    Registra una solicitud atendida.
+
+    Args:
+        url_name: Nombre de la URL de `app/urls.py`, o "unmatched".
+        status: Código de estado HTTP de la respuesta.
+        seconds: Duración de la solicitud.
+        queries: Cantidad de consultas SQL.
+        db_seconds: Tiempo total de las consultas SQL.
+    """
+    FLUSHER.ensure_started()
+    view = (("view", url_name),)
+    REGISTRY.observe("vetsoft_request_duration_seconds", seconds, view)
+    REGISTRY.inc("vetsoft_requests_total", (("view", url_name), ("status", str(status))))
+    if queries:
+        REGISTRY.inc("vetsoft_db_queries_total", view, queries)
+        REGISTRY.inc("vetsoft_db_query_seconds_total", view, db_seconds)
+
+
+def record_cache(cache, hit):
+    """
+    Registra una lectura de la caché de repositorios.
+
+    Args:
+        cache: Nombre del valor cacheado (por ejemplo, el repositorio).
+        hit: True si el valor estaba en la caché.
+    """
+    REGISTRY.inc(
+        "vetsoft_cache_requests_total", (("cache", cache), ("result", "hit" if hit else "miss")),
+    )
+
+
+def collect_all():
+    """
+    Suma las métricas de este proceso y, si METRICS_DIR está configurado, las
+    guardadas por los demás procesos y el acumulado de los que terminaron.
+
+    Returns:
+        dict: Los contadores y los histogramas de todos los procesos.
+    """
+    collected = REGISTRY.collect()
+    if not settings.METRICS_DIR or not os.path.isdir(settings.METRICS_DIR):
+        return collected
+
+    own = os.path.basename(_process_file())
+    for filename in os.listdir(settings.METRICS_DIR):
+        if filename == own or not filename.endswith(".json"):
+            continue
+        _read(os.path.join(settings.METRICS_DIR, filename), collected)
+
+    return collected
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels, extra=()):
+    labels = (*labels, *extra)
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(collected):
+    """
+    Genera el texto de las métricas en el formato de exposición de Prometheus.
+
+    Args:
+        collected: Métricas devueltas por `collect_all`.
+
+    Returns:
+        str: El texto a devolver en /metrics.
+    """
+    counters = dict(collected["counters"])
+
+    hits, totals = {}, {}
+    for (name, labels), value in counters.items():
+        if name == "vetsoft_cache_requests_total":
+            cache = dict(labels)["cache"]
+            totals[cache] = totals.get(cache, 0) + value
+            if dict(labels)["result"] == "hit":
+                hits[cache] = hits.get(cache, 0) + value
+    for cache, total in totals.items():
+        counters[("vetsoft_cache_hit_ratio", (("cache", cache),))] = hits.get(cache, 0) / total
+
+    by_name = {}
+    for (name, labels), value in counters.items():
+        by_name.setdefault(name, []).append((labels, value))
+    for (name, labels), buckets in collected["histograms"].items():
+        by_name.setdefault(name, []).append((labels, buckets))
+
+    lines = []
+    for name, (kind, help_text) in METRICS.items():
+        if name not in by_name:
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in sorted(by_name[name]):
+            if kind != "histogram":
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                continue
+
+            cumulative = 0
+            for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), value[:-1]):
+                cumulative += count
+                le = (("le", bound if bound == "+Inf" else repr(bound)),)
+                lines.append(f"{name}_bucket{_format_labels(labels, le)} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(value[-1])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,126 @@
+import json
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .instrumentation import finish_request, start_request
+from .metrics import record_request
+
+logger = logging.getLogger("vetsoft.requests")
+
+
+class RequestTimingMiddleware:
+    """
+    Clase de middleware que mide cada solicitud: cantidad de consultas SQL,
+    tiempo de la base de datos, de los templates y de la vista.
+
+    Las medidas se envían en el encabezado `Server-Timing` (visible en las
+    herramientas de desarrollo del navegador) y en una línea de log en JSON
+    del logger "vetsoft.requests". Las solicitudes que superan
+    REQUEST_QUERY_BUDGET consultas o REQUEST_TIME_BUDGET_MS milisegundos, o
+    que repiten una misma consulta REQUEST_REPEATED_QUERY_LIMIT veces o más
+    (N+1), se registran como advertencia. Además, cada solicitud se suma a
+    las métricas de /metrics (ver `app.metrics`) bajo el nombre de su URL.
+
+    En las respuestas en streaming sólo se mide lo que ocurre antes de
+    empezar a enviar el contenido.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_TIMING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        metrics, token = start_request(request)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            finish_request(token)
+        return self.report(request, response, metrics, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        metrics, token = start_request(request)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            finish_request(token)
+        return self.report(request, response, metrics, time.perf_counter() - start)
+
+    def report(self, request, response, metrics, seconds):
+        """
+        Agrega el encabezado `Server-Timing` a la respuesta y registra la
+        línea de log de la solicitud.
+
+        Args:
+            request: Objeto de solicitud HTTP.
+            response: Respuesta de la vista.
+            metrics: Métricas de la solicitud (ver `RequestMetrics`).
+            seconds: Duración total de la vista, con los middlewares internos.
+
+        Returns:
+            HttpResponse: La misma respuesta, con el encabezado agregado.
+        """
+        view_ms = seconds * 1000
+        db_ms = metrics.db_seconds * 1000
+        template_ms = metrics.template_seconds * 1000
+        repeated = metrics.repeated_queries(settings.REQUEST_REPEATED_QUERY_LIMIT)
+
+        flags = []
+        if metrics.queries > settings.REQUEST_QUERY_BUDGET:
+            flags.append("query_budget")
+        if view_ms > settings.REQUEST_TIME_BUDGET_MS:
+            flags.append("time_budget")
+        if repeated:
+            flags.append("repeated_queries")
+
+        timing = (
+            f'db;dur={db_ms:.1f};desc="{metrics.queries} consultas", '
+            f"tpl;dur={template_ms:.1f}, view;dur={view_ms:.1f}"
+        )
+        if response.has_header("Server-Timing"):
+            timing = f"{response['Server-Timing']}, {timing}"
+        response["Server-Timing"] = timing
+
+        match = request.resolver_match
+        record_request(
+            getattr(match, "url_name", None) or "unmatched",
+            response.status_code, seconds, metrics.queries, metrics.db_seconds,
+        )
+
+        level = logging.WARNING if flags else logging.INFO
+        if not logger.isEnabledFor(level):
+            return response
+
+        line = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": metrics.queries,
+            "db_ms": round(db_ms, 1),
+            "template_ms": round(template_ms, 1),
+            "view_ms": round(view_ms, 1),
+        }
+        if flags:
+            line["flags"] = flags
+        if repeated:
+            line["repeated_queries"] = [
+                {"sql": sql[:200], "count": count} for sql, count in repeated[:3]
+            ]
+        logger.log(level, json.dumps(line))
+
+        return response
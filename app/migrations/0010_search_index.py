@@ -0,0 +1,69 @@
+from django.db import migrations
+
+# Índices de texto completo (FTS5) de clientes y mascotas. Son tablas de
+# contenido externo: guardan sólo el índice y los triggers las mantienen
+# sincronizadas con cualquier INSERT, UPDATE o DELETE sobre la tabla original.
+SEARCH_INDEXES = {
+    "app_client": ["name", "email", "phone", "address"],
+    "app_pet": ["name", "breed"],
+}
+
+
+def create_sql(table, columns):
+    fts = f"{table}_fts"
+    cols = ", ".join(columns)
+    new = ", ".join(f"new.{col}" for col in columns)
+    old = ", ".join(f"old.{col}" for col in columns)
+    delete = (
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old});"
+    )
+    insert = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new});"
+
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', "
+        f"content_rowid='id', tokenize='unicode61 remove_diacritics 2', "
+        f"prefix='2 3')",
+        f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN {insert} END",
+        f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN {delete} END",
+        f"CREATE TRIGGER {fts}_au AFTER UPDATE ON {table} BEGIN {delete} {insert} END",
+        f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+    ]
+
+
+def drop_sql(table):
+    fts = f"{table}_fts"
+    return [
+        f"DROP TRIGGER IF EXISTS {fts}_ai",
+        f"DROP TRIGGER IF EXISTS {fts}_ad",
+        f"DROP TRIGGER IF EXISTS {fts}_au",
+        f"DROP TABLE IF EXISTS {fts}",
+    ]
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for table, columns in SEARCH_INDEXES.items():
+        for sql in create_sql(table, columns):
+            schema_editor.execute(sql)
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for table in SEARCH_INDEXES:
+        for sql in drop_sql(table):
+            schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0009_alter_medicine_dose'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
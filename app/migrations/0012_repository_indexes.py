@@ -0,0 +1,65 @@
+# Generated by Django 5.0.4 on 2026-10-18 18:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0011_cache_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['name'], name='client_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['email'], name='client_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(fields=['phone'], name='client_phone_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='medicine',
+            index=models.Index(fields=['name'], name='medicine_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['name'], name='pet_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['breed'], name='pet_breed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['breed', 'name'], name='pet_breed_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(fields=['birthday'], name='pet_birthday_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['name'], name='product_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['type'], name='product_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['type', 'name'], name='product_type_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vet',
+            index=models.Index(fields=['name'], name='vet_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vet',
+            index=models.Index(fields=['email'], name='vet_email_idx'),
+        ),
+    ]
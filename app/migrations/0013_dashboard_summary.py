@@ -0,0 +1,134 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:08
+
+from django.db import migrations, models
+
+# Contadores del tablero de inicio (ver app/dashboard.py). Igual que los índices
+# de texto completo de 0010_search_index, los mantienen triggers, así que se
+# actualizan con cualquier escritura: formularios, vistas de stock,
+# importaciones y cargas masivas.
+COUNTED_TABLES = {
+    "app_client": "client",
+    "app_medicine": "medicine",
+    "app_pet": "pet",
+    "app_product": "product",
+    "app_vet": "vet",
+}
+
+
+def add_counter(name, count, total="0"):
+    return (
+        f"INSERT INTO app_summarycounter(name, count, total) VALUES ('{name}', {count}, {total}) "
+        f"ON CONFLICT(name) DO UPDATE SET count = count + excluded.count, total = total + excluded.total;"
+    )
+
+
+def add_birthday(birthday, count):
+    return (
+        f"INSERT INTO app_petbirthdaycount(birthday, count) VALUES ({birthday}, {count}) "
+        f"ON CONFLICT(birthday) DO UPDATE SET count = count + excluded.count;"
+    )
+
+
+REMOVE_EMPTY_BIRTHDAY = "DELETE FROM app_petbirthdaycount WHERE birthday = old.birthday AND count = 0;"
+
+
+def trigger_bodies(table, name):
+    """
+    Sentencias de los triggers de una tabla: (sufijo, evento, sentencias).
+    """
+    inserted = [add_counter(name, 1)]
+    deleted = [add_counter(name, -1)]
+    updated = []
+    if table == "app_product":
+        inserted = [
+            add_counter(name, 1, "new.price * new.stock"),
+            add_counter("product_out_of_stock", "new.stock <= 0"),
+        ]
+        deleted = [
+            add_counter(name, -1, "-old.price * old.stock"),
+            add_counter("product_out_of_stock", "-(old.stock <= 0)"),
+        ]
+        updated = [(
+            "AFTER UPDATE OF price, stock",
+            [
+                add_counter(name, 0, "new.price * new.stock - old.price * old.stock"),
+                add_counter("product_out_of_stock", "(new.stock <= 0) - (old.stock <= 0)"),
+            ],
+        )]
+    elif table == "app_pet":
+        inserted.append(add_birthday("new.birthday", 1))
+        deleted += [add_birthday("old.birthday", -1), REMOVE_EMPTY_BIRTHDAY]
+        updated = [(
+            "AFTER UPDATE OF birthday",
+            [add_birthday("old.birthday", -1), REMOVE_EMPTY_BIRTHDAY, add_birthday("new.birthday", 1)],
+        )]
+
+    triggers = [("ai", "AFTER INSERT", inserted), ("ad", "AFTER DELETE", deleted)]
+    triggers += [("au", event, body) for event, body in updated]
+    return triggers
+
+
+def fill_sql():
+    sql = [
+        f"INSERT INTO app_summarycounter(name, count, total) SELECT '{name}', COUNT(*), 0 FROM {table}"
+        for table, name in COUNTED_TABLES.items() if table != "app_product"
+    ]
+    return sql + [
+        "INSERT INTO app_summarycounter(name, count, total) "
+        "SELECT 'product', COUNT(*), COALESCE(SUM(price * stock), 0) FROM app_product",
+        "INSERT INTO app_summarycounter(name, count, total) "
+        "SELECT 'product_out_of_stock', COUNT(*), 0 FROM app_product WHERE stock <= 0",
+        "INSERT INTO app_petbirthdaycount(birthday, count) "
+        "SELECT birthday, COUNT(*) FROM app_pet GROUP BY birthday",
+    ]
+
+
+def create_summary_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for table, name in COUNTED_TABLES.items():
+        for suffix, event, body in trigger_bodies(table, name):
+            schema_editor.execute(
+                f"CREATE TRIGGER {table}_summary_{suffix} {event} ON {table} "
+                f"BEGIN {' '.join(body)} END",
+            )
+    for sql in fill_sql():
+        schema_editor.execute(sql)
+
+
+def drop_summary_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for table in COUNTED_TABLES:
+        for suffix in ("ai", "ad", "au"):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {table}_summary_{suffix}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0012_repository_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PetBirthdayCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('birthday', models.DateField(unique=True)),
+                ('count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SummaryCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('count', models.IntegerField(default=0)),
+                ('total', models.FloatField(default=0)),
+            ],
+        ),
+        migrations.RunPython(create_summary_triggers, drop_summary_triggers),
+    ]
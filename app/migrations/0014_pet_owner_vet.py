@@ -0,0 +1,104 @@
+# Generated by Django 5.0.4 on 2026-10-18 19:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# El trigger de 0010_search_index reindexa la mascota con cualquier UPDATE;
+# desde que la tabla tiene el dueño y el veterinario, sólo hace falta cuando
+# cambian las columnas indexadas (vincular mascotas por bloques, ver
+# app/pet_links.py, no toca el índice de búsqueda).
+REINDEX = (
+    "BEGIN "
+    "INSERT INTO app_pet_fts(app_pet_fts, rowid, name, breed) VALUES ('delete', old.id, old.name, old.breed); "
+    "INSERT INTO app_pet_fts(rowid, name, breed) VALUES (new.id, new.name, new.breed); "
+    "END"
+)
+
+
+def replace_update_trigger(schema_editor, event):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    schema_editor.execute("DROP TRIGGER IF EXISTS app_pet_fts_au")
+    schema_editor.execute(f"CREATE TRIGGER app_pet_fts_au {event} ON app_pet {REINDEX}")
+
+
+def reindex_on_search_columns(apps, schema_editor):
+    replace_update_trigger(schema_editor, "AFTER UPDATE OF name, breed")
+
+
+def reindex_on_any_update(apps, schema_editor):
+    replace_update_trigger(schema_editor, "AFTER UPDATE")
+
+
+# Al revertir, SQLite quita las columnas rehaciendo la tabla, lo que borra sus
+# triggers: se vuelven a crear los de 0010_search_index y 0013_dashboard_summary
+# tal como quedan en esas migraciones.
+COUNT_PET = (
+    "INSERT INTO app_summarycounter(name, count, total) VALUES ('pet', {count}, 0) "
+    "ON CONFLICT(name) DO UPDATE SET count = count + excluded.count, total = total + excluded.total;"
+)
+COUNT_BIRTHDAY = (
+    "INSERT INTO app_petbirthdaycount(birthday, count) VALUES ({birthday}, {count}) "
+    "ON CONFLICT(birthday) DO UPDATE SET count = count + excluded.count;"
+)
+REMOVE_EMPTY_BIRTHDAY = "DELETE FROM app_petbirthdaycount WHERE birthday = old.birthday AND count = 0;"
+
+PET_TRIGGERS = {
+    "app_pet_fts_ai": (
+        "AFTER INSERT",
+        "BEGIN INSERT INTO app_pet_fts(rowid, name, breed) VALUES (new.id, new.name, new.breed); END",
+    ),
+    "app_pet_fts_ad": (
+        "AFTER DELETE",
+        "BEGIN "
+        "INSERT INTO app_pet_fts(app_pet_fts, rowid, name, breed) VALUES ('delete', old.id, old.name, old.breed); "
+        "END",
+    ),
+    "app_pet_fts_au": ("AFTER UPDATE", REINDEX),
+    "app_pet_summary_ai": (
+        "AFTER INSERT",
+        f"BEGIN {COUNT_PET.format(count=1)} {COUNT_BIRTHDAY.format(birthday='new.birthday', count=1)} END",
+    ),
+    "app_pet_summary_ad": (
+        "AFTER DELETE",
+        f"BEGIN {COUNT_PET.format(count=-1)} {COUNT_BIRTHDAY.format(birthday='old.birthday', count=-1)} "
+        f"{REMOVE_EMPTY_BIRTHDAY} END",
+    ),
+    "app_pet_summary_au": (
+        "AFTER UPDATE OF birthday",
+        f"BEGIN {COUNT_BIRTHDAY.format(birthday='old.birthday', count=-1)} {REMOVE_EMPTY_BIRTHDAY} "
+        f"{COUNT_BIRTHDAY.format(birthday='new.birthday', count=1)} END",
+    ),
+}
+
+
+def recreate_pet_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for name, (event, body) in PET_TRIGGERS.items():
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        schema_editor.execute(f"CREATE TRIGGER {name} {event} ON app_pet {body}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0013_dashboard_summary'),
+    ]
+
+    operations = [
+        migrations.RunPython(migrations.RunPython.noop, recreate_pet_triggers),
+        migrations.AddField(
+            model_name='pet',
+            name='owner',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pets', to='app.client'),
+        ),
+        migrations.AddField(
+            model_name='pet',
+            name='vet',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pets', to='app.vet'),
+        ),
+        migrations.RunPython(reindex_on_search_columns, reindex_on_any_update),
+    ]
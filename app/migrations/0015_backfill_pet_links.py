@@ -0,0 +1,101 @@
+import csv
+import os
+import uuid
+
+from django.conf import settings
+from django.db import migrations, transaction
+
+# Archivo de vínculos (pet_id, owner_id, vet_id) junto a manage.py, con el
+# formato de `manage.py backfill_pet_links`. Si no está, las mascotas quedan
+# sin dueño ni veterinario hasta cargarlos con ese comando o el formulario.
+LINKS_FILE = "pet_links.csv"
+
+# Mascotas por bloque: cada bloque se guarda en su propia transacción, así que
+# en una tabla grande la base no queda bloqueada durante toda la carga.
+BATCH_SIZE = 5000
+
+
+def _optional_int(value):
+    value = (value or "").strip()
+    return int(value) if value else None
+
+
+def read_batches(path):
+    with open(path, newline="", encoding="utf-8") as file:
+        batch = []
+        for number, row in enumerate(csv.DictReader(file), start=2):
+            try:
+                batch.append(
+                    (int(row["pet_id"]), _optional_int(row["owner_id"]), _optional_int(row["vet_id"])),
+                )
+            except (KeyError, ValueError) as error:
+                raise ValueError(f"{LINKS_FILE}, fila {number}: {error}") from None
+            if len(batch) == BATCH_SIZE:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def link_batch(apps, schema_editor, batch):
+    # Igual que app/pet_links.py, con los modelos de esta migración: un UPDATE
+    # preparado por bloque, que ignora los dueños y veterinarios inexistentes y
+    # no cambia el vínculo actual si el ID está vacío.
+    db = schema_editor.connection.alias
+    Client = apps.get_model("app", "Client")
+    Pet = apps.get_model("app", "Pet")
+    Vet = apps.get_model("app", "Vet")
+
+    owners = set(
+        Client.objects.using(db)
+        .filter(pk__in={owner for _, owner, _ in batch if owner})
+        .values_list("pk", flat=True),
+    )
+    vets = set(
+        Vet.objects.using(db)
+        .filter(pk__in={vet for _, _, vet in batch if vet})
+        .values_list("pk", flat=True),
+    )
+    values = [
+        (owner if owner in owners else None, vet if vet in vets else None, pet)
+        for pet, owner, vet in batch
+    ]
+    owner_column = Pet._meta.get_field("owner").column
+    vet_column = Pet._meta.get_field("vet").column
+    with schema_editor.connection.cursor() as cursor:
+        cursor.executemany(
+            f"UPDATE {Pet._meta.db_table} SET {owner_column} = COALESCE(%s, {owner_column}), "
+            f"{vet_column} = COALESCE(%s, {vet_column}) WHERE id = %s",
+            values,
+        )
+        return cursor.rowcount
+
+
+def backfill_pet_links(apps, schema_editor):
+    path = os.path.join(settings.BASE_DIR, LINKS_FILE)
+    if not os.path.exists(path):
+        return
+
+    db = schema_editor.connection.alias
+    updated = 0
+    for batch in read_batches(path):
+        with transaction.atomic(using=db):
+            updated += link_batch(apps, schema_editor, batch)
+
+    if updated:
+        CacheVersion = apps.get_model("app", "CacheVersion")
+        CacheVersion.objects.using(db).update_or_create(name="pet", defaults={"token": uuid.uuid4().hex})
+
+
+class Migration(migrations.Migration):
+
+    # Cada bloque es una transacción propia (ver `backfill_pet_links`).
+    atomic = False
+
+    dependencies = [
+        ('app', '0014_pet_owner_vet'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_pet_links, migrations.RunPython.noop),
+    ]
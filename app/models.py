@@ -1,7 +1,18 @@
-import re
-from datetime import datetime
+import uuid
 
+from asgiref.sync import sync_to_async
 from django.db import models
+from django.db.models import F
+
+from .validation import (
+    CLIENT_SCHEMA,
+    MEDICINE_SCHEMA,
+    PET_SCHEMA,
+    PRODUCT_SCHEMA,
+    VET_SCHEMA,
+    RelatedSchema,
+)
+from .writes import coordinated_write
 
 
 def validate_client(data):
@@ -14,32 +25,7 @@ def validate_client(data):
     Returns:
         dict: Un diccionario con errores de validación si los hay.
     """
-    errors = {}
-
-    name = data.get("name", "")
-    phone = data.get("phone", "")
-    email = data.get("email", "")
-
-    if name == "":
-        errors["name"] = "Por favor ingrese un nombre"
-    elif not re.match("^[a-zA-ZÁÉÍÓÚáéíóúüÜ\s]+$", name):
-        errors["name"] = "El nombre solo debe contener letras y espacios"
-
-    if phone == "":
-        errors["phone"] = "Por favor ingrese un teléfono"
-    elif not re.match("^[0-9]+$", phone):
-        errors["phone"] = "El teléfono sólo puede contener números"
-    elif not re.match("^54", phone):
-        errors["phone"] = "El teléfono debe comenzar con '54'"
-    
-    if email == "":
-        errors["email"] = "Por favor ingrese un email"
-    elif not email.endswith("@vetsoft.com"):
-        errors["email"] = "El correo electrónico debe terminar en @vetsoft.com"
-    elif email.count("@") == 0:
-        errors["email"] = "Por favor ingrese un email válido"
-
-    return errors
+    return CLIENT_SCHEMA.validate(data)
 
 def validate_pet(data):
     """
@@ -51,24 +37,17 @@ def validate_pet(data):
     Returns:
         dict: Un diccionario con errores de validación si los hay.
     """
-    errors = {}
+    return PET_LINKED_SCHEMA.validate(data)
 
-    name = data.get("name", "")
-    breed = data.get("breed", "")
-    birthday = data.get("birthday", "")
 
-    if name == "":
-        errors["name"] = "Por favor ingrese un nombre"
-
-    if breed == "":
-        errors["breed"] = "Por favor ingrese la raza"
-
-    if birthday == "":
-        errors["birthday"] = "Por favor ingrese una fecha"
-    elif datetime.strptime(birthday, "%Y-%m-%d").date() > datetime.now().date():
-        errors["birthday"] = "La fecha de cumpleaños no puede ser mayor al dia actual"
+def _optional_id(value):
+    """
+    Convierte el ID de una relación opcional ingresado en un formulario.
 
-    return errors
+    Returns:
+        int: El ID, o None si el campo está vacío.
+    """
+    return int(value) if value not in ("", None) else None
 
 
 class Client(models.Model):
@@ -83,10 +62,18 @@ class Client(models.Model):
     email = models.EmailField()
     address = models.CharField(max_length=100, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["name"], name="client_name_idx"),
+            models.Index(fields=["email"], name="client_email_idx"),
+            models.Index(fields=["phone"], name="client_phone_idx"),
+        ]
+
     def _str_(self):
         return self.name
 
     @classmethod
+    @coordinated_write
     def save_client(cls, client_data):
         errors = validate_client(client_data)
 
@@ -97,13 +84,14 @@ class Client(models.Model):
             name=client_data.get("name"),
             phone=client_data.get("phone"),
             email=client_data.get("email"),
-            address=client_data.get("address"),
+            address=client_data.get("address", ""),
         
         )
 
         return True, None
     
    
+    @coordinated_write
     def update_client(self, client_data):
         errors = validate_client(client_data)
 
@@ -128,27 +116,7 @@ def validate_medicines(data):
         Returns:
             dict: Un diccionario con errores de validación si los hay.
         """
-        errors = {}
-        name = data.get("name", "")
-        description = data.get("description", "")
-        dose = data.get("dose", "")
-
-        if name == "":
-            errors["name"] = "Por favor, ingrese un nombre para la medicina"
-
-        if description == "":
-            errors["description"] = "Por favor, ingrese una descripcion"
-        
-        if dose == "":
-            errors["dose"] = "Por favor, ingrese una dosis para la medicina"
-        try:
-            dose = int(dose)
-            if (dose < 1) or (dose > 10):
-                errors["dose"] = "La dosis debe ser entre 1 y 10"
-        except ValueError:
-            errors["dose"] = "La dosis debe ser un número entero"
-
-        return errors
+        return MEDICINE_SCHEMA.validate(data)
 
 
 
@@ -163,10 +131,16 @@ class Medicine(models.Model):
     description = models.TextField()
     dose = models.IntegerField()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["name"], name="medicine_name_idx"),
+        ]
+
     def __str__(self):
         return self.name
         
     @classmethod
+    @coordinated_write
     def save_medicine(cls, medicine_data):
         errors = validate_medicines(medicine_data)
 
@@ -181,6 +155,7 @@ class Medicine(models.Model):
         
         return True, None
     
+    @coordinated_write
     def update_medicine(self, medicine_data):
         errors = validate_medicines(medicine_data)
 
@@ -203,35 +178,7 @@ def validate_products(data):
     Returns:
         dict: Un diccionario con errores de validación si los hay.
     """
-    errors = {}
-    name = data.get("name", "")
-    type = data.get("type", "")
-    price = data.get("price", "")
-    stock = data.get("stock", "")
-
-    if name == "":
-        errors["name"] = "Ingrese el nombre del producto"
-
-    if type == "":
-        errors["type"] = "Ingrese el tipo de producto"
-    
-    if price == "" :
-        errors["price"] = "Ingrese el precio del producto"
-    try:
-        price = float(price)
-        if price < 0:
-            errors["price"] = "El precio no puede ser negativo"
-    except ValueError:
-        errors["price"] = "El precio debe ser un número valido"       
-
-    try:
-        stock = int(stock)
-        if stock < 0:
-            errors["stock"] = "El stock no puede ser negativo"
-    except ValueError:
-        errors["stock"] = "El stock debe ser un número entero"
-
-    return errors
+    return PRODUCT_SCHEMA.validate(data)
 
 class Product(models.Model):
     """
@@ -245,10 +192,19 @@ class Product(models.Model):
     price = models.FloatField()
     stock = models.IntegerField(default=0)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["name"], name="product_name_idx"),
+            models.Index(fields=["type"], name="product_type_idx"),
+            # Filtrar por tipo y ordenar por nombre usa un único índice.
+            models.Index(fields=["type", "name"], name="product_type_name_idx"),
+        ]
+
     def __str__(self):
         return self.name
         
     @classmethod
+    @coordinated_write
     def save_product(cls, product_data):
         errors = validate_products(product_data)
 
@@ -264,6 +220,7 @@ class Product(models.Model):
         
         return True, None
     
+    @coordinated_write
     def update_product(self, product_data):
         errors = validate_products(product_data)
         if len(errors.keys()) > 0:
@@ -280,6 +237,61 @@ class Product(models.Model):
                 pass 
         self.save()
 
+    @classmethod
+    @coordinated_write
+    def increase_stock(cls, product_id, amount=1):
+        """
+        Suma `amount` unidades al stock con un único UPDATE atómico.
+
+        Returns:
+            bool: True si el producto existe y se actualizó.
+        """
+        updated = Product.objects.filter(pk=product_id).update(
+            stock=F("stock") + amount,
+        )
+        if updated:
+            CacheVersion.bump(Product)
+        return updated == 1
+
+    @classmethod
+    @coordinated_write
+    def decrease_stock(cls, product_id, amount=1):
+        """
+        Resta `amount` unidades al stock con un único UPDATE condicional, que
+        sólo se aplica si hay stock suficiente.
+
+        Returns:
+            bool: True si se descontó el stock; False si el producto no existe
+            o no tiene stock suficiente.
+        """
+        updated = Product.objects.filter(pk=product_id, stock__gte=amount).update(
+            stock=F("stock") - amount,
+        )
+        if updated:
+            CacheVersion.bump(Product)
+        return updated == 1
+
+    @classmethod
+    async def aincrease_stock(cls, product_id, amount=1):
+        """
+        Versión asíncrona de `increase_stock`.
+
+        Returns:
+            bool: True si el producto existe y se actualizó.
+        """
+        return await sync_to_async(cls.increase_stock)(product_id, amount)
+
+    @classmethod
+    async def adecrease_stock(cls, product_id, amount=1):
+        """
+        Versión asíncrona de `decrease_stock`.
+
+        Returns:
+            bool: True si se descontó el stock; False si el producto no existe
+            o no tiene stock suficiente.
+        """
+        return await sync_to_async(cls.decrease_stock)(product_id, amount)
+
 class Pet(models.Model):
     """
     Clase de mascota: almacena un valor y permite recuperarlo.
@@ -290,11 +302,26 @@ class Pet(models.Model):
     name = models.CharField(max_length=100)
     breed = models.CharField(max_length=300)
     birthday = models.DateField()
+    owner = models.ForeignKey(
+        Client, null=True, blank=True, on_delete=models.SET_NULL, related_name="pets",
+    )
+    vet = models.ForeignKey(
+        "Vet", null=True, blank=True, on_delete=models.SET_NULL, related_name="pets",
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["name"], name="pet_name_idx"),
+            models.Index(fields=["breed"], name="pet_breed_idx"),
+            models.Index(fields=["breed", "name"], name="pet_breed_name_idx"),
+            models.Index(fields=["birthday"], name="pet_birthday_idx"),
+        ]
 
     def __str__(self):
         return self.name
     
     @classmethod
+    @coordinated_write
     def save_pet(cls, pet_data):
         errors = validate_pet(pet_data)
 
@@ -305,16 +332,28 @@ class Pet(models.Model):
             name=pet_data.get("name"),
             breed=pet_data.get("breed"),
             birthday=pet_data.get("birthday"),
+            owner_id=_optional_id(pet_data.get("owner_id")),
+            vet_id=_optional_id(pet_data.get("vet_id")),
         )
 
         return True, None
 
+    @coordinated_write
     def update_pet(self, pet_data):
+        links = {field: pet_data[field] for field in ("owner_id", "vet_id") if field in pet_data}
+        errors = PET_LINKED_SCHEMA.validate(links)
+        errors = {field: errors[field] for field in links if field in errors}
+        if errors:
+            return False, errors
+
         self.name = pet_data.get("name", "") or self.name
         self.breed = pet_data.get("breed", "") or self.breed
         self.birthday = pet_data.get("birthday", "") or self.birthday
+        for field, value in links.items():
+            setattr(self, field, _optional_id(value))
 
         self.save()
+        return True, None
 
 def validate_vet(data):
         """
@@ -326,23 +365,7 @@ def validate_vet(data):
         Returns:
             dict: Un diccionario con errores de validación si los hay.
         """
-        errors = {}
-        name = data.get("name", "")
-        email = data.get("email", "")
-        phone = data.get("phone", "")
-
-        if name == "":
-            errors["name"] = "Por favor, ingrese el nombre del veterinario/a"
-
-        if email == "":
-            errors["email"] = "Por favor ingrese un email del veterinario/a"
-        elif email.count("@") == 0:
-            errors["email"] = "Por favor ingrese un email válido del veterinario/a"
-        
-        if phone == "":
-            errors["phone"] = "Por favor, ingrese el telefono del veterinario/a"
-
-        return errors
+        return VET_SCHEMA.validate(data)
 
 class Vet(models.Model):
     """
@@ -355,10 +378,17 @@ class Vet(models.Model):
     email = models.EmailField()
     phone = models.CharField(max_length=15)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["name"], name="vet_name_idx"),
+            models.Index(fields=["email"], name="vet_email_idx"),
+        ]
+
     def __str__(self):
         return self.name
     
     @classmethod
+    @coordinated_write
     def save_vet(cls, vet_data):
         errors = validate_vet(vet_data)
 
@@ -373,9 +403,117 @@ class Vet(models.Model):
 
         return True, None
 
+    @coordinated_write
     def update_vet(self, vet_data):
         self.name = vet_data.get("name", "") or self.name
         self.email = vet_data.get("email", "") or self.email
         self.phone = vet_data.get("phone", "") or self.phone
 
         self.save()
+
+# Esquema de las mascotas que además verifica que existan el dueño y el
+# veterinario indicados.
+PET_LINKED_SCHEMA = RelatedSchema(
+    PET_SCHEMA,
+    owner_id=(Client, "No existe el cliente indicado"),
+    vet_id=(Vet, "No existe el veterinario indicado"),
+)
+
+class CacheVersion(models.Model):
+    """
+    Clase de versión de caché: guarda un identificador por modelo que cambia
+    cada vez que se modifican sus filas.
+
+    Atributos:
+        name: Nombre del modelo.
+        token: Identificador de la última modificación.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    token = models.CharField(max_length=32)
+
+    def __str__(self):
+        return f"{self.name}: {self.token}"
+
+    @classmethod
+    def get_tokens(cls, *models):
+        """
+        Obtiene la versión actual de cada modelo.
+
+        Las versiones se guardan en la base de datos, así que se leen dentro de
+        la misma transacción que los datos: una escritura que se deshace también
+        deshace su cambio de versión.
+
+        Returns:
+            str: Las versiones de los modelos, en el orden pedido.
+        """
+        names = [model._meta.model_name for model in models]
+        tokens = dict(
+            CacheVersion.objects.filter(name__in=names).values_list("name", "token"),
+        )
+        return "-".join(tokens.get(name, "0") for name in names)
+
+    @classmethod
+    async def aget_tokens(cls, *models):
+        """
+        Versión asíncrona de `get_tokens`.
+
+        Returns:
+            str: Las versiones de los modelos, en el orden pedido.
+        """
+        names = [model._meta.model_name for model in models]
+        tokens = {
+            name: token
+            async for name, token in CacheVersion.objects.filter(
+                name__in=names,
+            ).values_list("name", "token")
+        }
+        return "-".join(tokens.get(name, "0") for name in names)
+
+    @classmethod
+    def bump(cls, *models):
+        """
+        Cambia la versión de cada modelo, invalidando lo cacheado a partir de él.
+
+        La nueva versión es un identificador único y no un contador, para que
+        una versión que se deshizo con un rollback nunca vuelva a usarse con
+        otros datos.
+        """
+        for model in models:
+            name = model._meta.model_name
+            token = uuid.uuid4().hex
+            if not CacheVersion.objects.filter(name=name).update(token=token):
+                CacheVersion.objects.update_or_create(name=name, defaults={"token": token})
+
+class SummaryCounter(models.Model):
+    """
+    Clase de contador del tablero de inicio: guarda un total que los
+    triggers de la migración 0013_dashboard_summary actualizan con cada
+    INSERT, UPDATE o DELETE (ver app/dashboard.py).
+
+    Atributos:
+        name: Nombre del contador ("client", "product", "product_out_of_stock", ...).
+        count: Cantidad de filas.
+        total: Suma asociada, como el valor del inventario en "product".
+    """
+    name = models.CharField(max_length=100, unique=True)
+    count = models.IntegerField(default=0)
+    total = models.FloatField(default=0)
+
+    def __str__(self):
+        return f"{self.name}: {self.count}"
+
+class PetBirthdayCount(models.Model):
+    """
+    Clase de cantidad de mascotas por fecha de nacimiento, que mantienen los
+    triggers de la migración 0013_dashboard_summary. Se guarda la fecha y no
+    la edad, que cambia con el paso del tiempo sin que cambien las filas.
+
+    Atributos:
+        birthday: Fecha de nacimiento.
+        count: Cantidad de mascotas nacidas ese día.
+    """
+    birthday = models.DateField(unique=True)
+    count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.birthday}: {self.count}"
@@ -0,0 +1,388 @@
+import base64
+import datetime
+import json
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+def encode_cursor(values):
+    """
+    Codifica los valores de la última fila de una página en un cursor opaco.
+
+    Args:
+        values: Lista con el valor de la columna de orden y la clave primaria.
+
+    Returns:
+        str: Cursor seguro para usar en una URL.
+    """
+    values = [
+        value.isoformat() if isinstance(value, datetime.date) else value
+        for value in values
+    ]
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    Decodifica un cursor generado por `encode_cursor`.
+
+    Args:
+        cursor: Cursor recibido en la URL.
+
+    Returns:
+        list: Los valores del cursor, o None si el cursor no es válido.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except ValueError:
+        return None
+
+    if not isinstance(values, list) or len(values) != 2:
+        return None
+
+    return values
+
+
+def get_page_size(request):
+    """
+    Obtiene el tamaño de página pedido, acotado por la configuración.
+
+    Args:
+        request: Objeto de solicitud HTTP con el parámetro opcional `page_size`.
+
+    Returns:
+        int: Cantidad de filas a mostrar por página.
+    """
+    try:
+        page_size = int(request.GET.get("page_size", settings.REPOSITORY_PAGE_SIZE))
+    except ValueError:
+        page_size = settings.REPOSITORY_PAGE_SIZE
+
+    return max(1, min(page_size, settings.REPOSITORY_MAX_PAGE_SIZE))
+
+
+def get_sort(request, sortable):
+    """
+    Obtiene la columna de orden pedida si está permitida.
+
+    Args:
+        request: Objeto de solicitud HTTP con el parámetro opcional `sort`.
+        sortable: Columnas por las que se permite ordenar; la primera es la por defecto.
+
+    Returns:
+        str: Columna de orden, con prefijo "-" si es descendente.
+    """
+    sort = request.GET.get("sort", "")
+    if sort.lstrip("-") in sortable:
+        return sort
+    return sortable[0]
+
+
+def get_filters(request, model, filterable):
+    """
+    Obtiene los filtros pedidos con `?filter=campo:valor` (uno o más) sobre
+    las columnas permitidas.
+
+    También acepta el par `filter_field` y `filter_value` que envía el
+    formulario de filtros de los repositorios. Se ignoran los filtros sobre
+    columnas no permitidas y los valores que no son válidos para la columna.
+
+    Args:
+        request: Objeto de solicitud HTTP con los parámetros de filtro.
+        model: Modelo de las filas a filtrar.
+        filterable: Columnas por las que se permite filtrar.
+
+    Returns:
+        list: Pares (columna, valor) de los filtros a aplicar.
+    """
+    requested = request.GET.getlist("filter")
+    field = request.GET.get("filter_field", "")
+    value = request.GET.get("filter_value", "").strip()
+    if field and value:
+        requested.append(f"{field}:{value}")
+
+    filters = []
+    for item in requested:
+        field, separator, value = item.partition(":")
+        if not separator or value == "" or field not in filterable:
+            continue
+        try:
+            model._meta.get_field(field).to_python(value)
+        except ValidationError:
+            continue
+        if (field, value) not in filters:
+            filters.append((field, value))
+
+    return filters
+
+
+def order_queryset(queryset, sort):
+    """
+    Ordena un queryset por la columna pedida, desempatando por la clave primaria.
+
+    Args:
+        queryset: Queryset a ordenar.
+        sort: Columna de orden, con prefijo "-" si es descendente.
+
+    Returns:
+        QuerySet: El queryset ordenado.
+    """
+    field = sort.lstrip("-")
+    prefix = "-" if sort.startswith("-") else ""
+
+    if field == "pk":
+        return queryset.order_by(f"{prefix}pk")
+
+    return queryset.order_by(f"{prefix}{field}", f"{prefix}pk")
+
+
+def convert_cursor(model, field, cursor):
+    """
+    Convierte los valores de un cursor al tipo de la columna de orden y de la
+    clave primaria, para que un cursor alterado o viejo no llegue a la consulta.
+
+    Args:
+        model: Modelo de las filas paginadas.
+        field: Columna de orden ("pk" para la clave primaria).
+        cursor: Valores decodificados con `decode_cursor`.
+
+    Returns:
+        list: El valor de la columna de orden y la clave primaria convertidos.
+
+    Raises:
+        ValueError: Si algún valor no es válido para su columna.
+    """
+    value, pk = cursor
+    try:
+        pk = int(pk)
+        if field != "pk":
+            value = model._meta.get_field(field).to_python(value)
+    except (TypeError, ValidationError) as error:
+        raise ValueError(f"Cursor inválido: {error}") from None
+
+    if value is None:
+        raise ValueError("Cursor inválido")
+    return [pk if field == "pk" else value, pk]
+
+
+def _keyset_filter(field, descending, value, pk):
+    """
+    Construye la condición que selecciona las filas posteriores al cursor.
+    """
+    op = "lt" if descending else "gt"
+
+    if field == "pk":
+        return Q(**{f"pk__{op}": pk})
+
+    return Q(**{f"{field}__{op}": value}) | Q(**{field: value, f"pk__{op}": pk})
+
+
+class KeysetPage:
+    """
+    Clase de página por cursor: contiene las filas de la página y los cursores
+    para navegar a la página siguiente y a la anterior.
+
+    Atributos:
+        items: Lista de objetos de la página.
+        has_next: Indica si existe una página siguiente.
+        has_previous: Indica si existe una página anterior.
+    """
+
+    def __init__(
+        self, items, sort, page_size, has_next, has_previous, params,
+        default_sort="pk", cursor_key=None,
+    ):
+        self.items = items
+        self.sort = sort
+        self.default_sort = default_sort
+        self.page_size = page_size
+        self.has_next = has_next and bool(items)
+        self.has_previous = has_previous and bool(items)
+        self.params = params
+
+        field = sort.lstrip("-")
+        key = cursor_key or self._cursor_values
+        self.next_cursor = encode_cursor(key(items[-1], field)) if self.has_next else None
+        self.previous_cursor = (
+            encode_cursor(key(items[0], field)) if self.has_previous else None
+        )
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    @staticmethod
+    def _cursor_values(item, field):
+        value = item.pk if field == "pk" else getattr(item, field)
+        return [value, item.pk]
+
+    def _url(self, **cursor):
+        params = {**self.params, **cursor}
+        if self.sort != self.default_sort:
+            params["sort"] = self.sort
+        if self.page_size != settings.REPOSITORY_PAGE_SIZE:
+            params["page_size"] = self.page_size
+        return "?" + urlencode(params, doseq=True)
+
+    @property
+    def next_url(self):
+        return self._url(after=self.next_cursor) if self.has_next else None
+
+    @property
+    def previous_url(self):
+        return self._url(before=self.previous_cursor) if self.has_previous else None
+
+
+def read_cursor(request):
+    """
+    Lee el cursor de navegación de la solicitud.
+
+    Args:
+        request: Objeto de solicitud HTTP con los parámetros `after` o `before`.
+
+    Returns:
+        tuple: El cursor decodificado (o None) y si se navega hacia atrás.
+    """
+    after = decode_cursor(request.GET.get("after", ""))
+    if after is not None:
+        return after, False
+
+    before = decode_cursor(request.GET.get("before", ""))
+    return before, before is not None
+
+
+def make_page(
+    rows, page_size, sort, cursor, backwards, params=None, default_sort="pk",
+    cursor_key=None,
+):
+    """
+    Arma una página a partir de las filas leídas con una fila de más.
+
+    Args:
+        rows: Filas leídas (hasta `page_size + 1`) en el orden de recorrido.
+        page_size: Cantidad de filas por página.
+        sort: Columna de orden de la página.
+        cursor: Cursor con el que se leyeron las filas, o None.
+        backwards: Indica si las filas se leyeron en orden inverso.
+        params: Parámetros adicionales a conservar en los enlaces de navegación.
+        default_sort: Columna de orden por defecto, que no se agrega a los enlaces.
+        cursor_key: Función opcional que recibe (fila, columna de orden) y
+            devuelve [valor de la columna, clave primaria], para filas que no
+            son instancias del modelo (por ejemplo, tuplas de `values_list`).
+
+    Returns:
+        KeysetPage: La página armada.
+    """
+    has_more = len(rows) > page_size
+    items = rows[:page_size]
+
+    if backwards:
+        items.reverse()
+        has_next, has_previous = True, has_more
+    else:
+        has_next, has_previous = has_more, cursor is not None
+
+    return KeysetPage(
+        items, sort, page_size, has_next, has_previous, params or {}, default_sort,
+        cursor_key,
+    )
+
+
+def read_page_params(request, model, sortable, strict=False):
+    """
+    Lee y normaliza los parámetros de paginación de la solicitud: el orden,
+    el tamaño de página y el cursor convertido al tipo de sus columnas.
+
+    Un cursor con valores inválidos se ignora (se sirve la primera página),
+    salvo con `strict`, en que se lanza ValueError.
+
+    Args:
+        request: Objeto de solicitud HTTP.
+        model: Modelo de las filas paginadas.
+        sortable: Columnas por las que se permite ordenar.
+        strict: Si es True, un cursor inválido lanza ValueError.
+
+    Returns:
+        tuple: Columna de orden, tamaño de página, cursor (o None) y si se
+        navega hacia atrás.
+    """
+    sort = get_sort(request, sortable)
+    page_size = get_page_size(request)
+    cursor, backwards = read_cursor(request)
+    if cursor is not None:
+        try:
+            cursor = convert_cursor(model, sort.lstrip("-"), cursor)
+        except ValueError:
+            if strict:
+                raise
+            cursor, backwards = None, False
+    return sort, page_size, cursor, backwards
+
+
+def _page_rows_queryset(request, queryset, sortable, strict=False):
+    """
+    Prepara la consulta de una página: ordena, aplica el cursor y limita a
+    `page_size + 1` filas. Devuelve la consulta y los datos para `make_page`.
+    """
+    sort, page_size, cursor, backwards = read_page_params(
+        request, queryset.model, sortable, strict,
+    )
+    field = sort.lstrip("-")
+
+    # Para retroceder se recorre el orden inverso y luego se da vuelta la página.
+    reverse = sort.startswith("-") != backwards
+    queryset = order_queryset(queryset, ("-" if reverse else "") + field)
+
+    if cursor is not None:
+        queryset = queryset.filter(_keyset_filter(field, reverse, *cursor))
+
+    return queryset[: page_size + 1], (page_size, sort, cursor, backwards)
+
+
+def paginate_queryset(
+    request, queryset, sortable=("pk",), params=None, cursor_key=None, strict=False,
+):
+    """
+    Pagina un queryset por cursor (keyset) sobre la columna de orden y la clave primaria.
+
+    No usa OFFSET ni COUNT(*): se lee una fila de más para saber si hay otra
+    página, por lo que el costo de cada página es constante sin importar el
+    tamaño de la tabla.
+
+    Args:
+        request: Objeto de solicitud HTTP con los parámetros `after`, `before`,
+            `sort` y `page_size`.
+        queryset: Queryset a paginar.
+        sortable: Columnas por las que se permite ordenar.
+        params: Parámetros adicionales a conservar en los enlaces de navegación.
+        cursor_key: Función para leer el cursor de cada fila (ver `make_page`).
+        strict: Si es True, un cursor inválido lanza ValueError en lugar de
+            servir la primera página.
+
+    Returns:
+        KeysetPage: La página pedida.
+    """
+    queryset, page_args = _page_rows_queryset(request, queryset, sortable, strict)
+    rows = list(queryset)
+    return make_page(rows, *page_args, params, sortable[0], cursor_key)
+
+
+async def apaginate_queryset(
+    request, queryset, sortable=("pk",), params=None, cursor_key=None, strict=False,
+):
+    """
+    Versión asíncrona de `paginate_queryset`: lee las filas con el ORM asíncrono.
+
+    Returns:
+        KeysetPage: La página pedida.
+    """
+    queryset, page_args = _page_rows_queryset(request, queryset, sortable, strict)
+    rows = [row async for row in queryset]
+    return make_page(rows, *page_args, params, sortable[0], cursor_key)
@@ -0,0 +1,112 @@
+import csv
+
+from django.db import connection
+
+from .writes import run_write
+
+# Columnas del archivo de vínculos: una fila por mascota, con el dueño y el
+# veterinario (cualquiera de los dos puede quedar vacío).
+LINK_COLUMNS = ("pet_id", "owner_id", "vet_id")
+
+
+def _optional_int(value):
+    value = (value or "").strip()
+    return int(value) if value else None
+
+
+def read_links(path):
+    """
+    Lee un archivo CSV de vínculos de mascotas con las columnas de
+    LINK_COLUMNS, sin cargarlo completo en memoria.
+
+    Args:
+        path: Ruta del archivo.
+
+    Returns:
+        iterator: Tuplas (pet_id, owner_id, vet_id); owner_id y vet_id son
+        None si están vacíos.
+
+    Raises:
+        ValueError: Si falta una columna o una fila tiene un ID inválido.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        reader = csv.DictReader(file)
+        missing = set(LINK_COLUMNS) - set(reader.fieldnames or ())
+        if missing:
+            raise ValueError(f"Faltan las columnas: {', '.join(sorted(missing))}")
+
+        for number, row in enumerate(reader, start=2):
+            try:
+                yield int(row["pet_id"]), _optional_int(row["owner_id"]), _optional_int(row["vet_id"])
+            except ValueError as error:
+                raise ValueError(f"Fila {number}: {error}") from None
+
+
+def _existing(cursor, table, ids):
+    ids = list(ids)
+    if not ids:
+        return set()
+    placeholders = ", ".join(["%s"] * len(ids))
+    cursor.execute(f"SELECT id FROM {table} WHERE id IN ({placeholders})", ids)
+    return {pk for pk, in cursor.fetchall()}
+
+
+def _link_batch(batch):
+    """
+    Aplica un bloque de vínculos con un único UPDATE preparado que se ejecuta
+    con `executemany`. Los dueños y veterinarios que no existen se ignoran.
+
+    Returns:
+        int: Cantidad de mascotas actualizadas.
+    """
+    with connection.cursor() as cursor:
+        owners = _existing(cursor, "app_client", {owner for _, owner, _ in batch if owner})
+        vets = _existing(cursor, "app_vet", {vet for _, _, vet in batch if vet})
+        values = [
+            (owner if owner in owners else None, vet if vet in vets else None, pet)
+            for pet, owner, vet in batch
+        ]
+        cursor.executemany(
+            "UPDATE app_pet SET owner_id = COALESCE(%s, owner_id), "
+            "vet_id = COALESCE(%s, vet_id) WHERE id = %s",
+            values,
+        )
+        return cursor.rowcount
+
+
+def backfill_links(links, batch_size=5000, on_batch=None):
+    """
+    Vincula mascotas existentes con su dueño y su veterinario, por bloques.
+
+    Cada bloque es una escritura corta y separada (ver `run_write`), así que
+    en una tabla grande la carga no bloquea la base durante todo el proceso:
+    las demás escrituras se intercalan entre bloques, y si el proceso se
+    interrumpe, los bloques ya aplicados quedan guardados y se puede volver a
+    ejecutar con el mismo archivo. Un ID vacío no cambia el vínculo actual.
+
+    No envía señales: quien la llama debe invalidar la caché de mascotas.
+
+    Args:
+        links: Iterable de tuplas (pet_id, owner_id, vet_id), como las de `read_links`.
+        batch_size: Mascotas por bloque.
+        on_batch: Función opcional que recibe la cantidad de mascotas
+            actualizadas hasta el momento después de cada bloque.
+
+    Returns:
+        int: Cantidad de mascotas actualizadas.
+    """
+    updated = 0
+    batch = []
+    for link in links:
+        batch.append(link)
+        if len(batch) == batch_size:
+            updated += run_write(_link_batch, batch)
+            batch = []
+            if on_batch is not None:
+                on_batch(updated)
+
+    if batch:
+        updated += run_write(_link_batch, batch)
+        if on_batch is not None:
+            on_batch(updated)
+    return updated
@@ -0,0 +1,213 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+
+# Modos de perfilado que se pueden pedir con `?_profile=` o con el encabezado
+# X-Vetsoft-Profile.
+MODES = ("cprofile", "sample")
+
+# Sólo puede haber un cProfile activo por proceso: desde Python 3.12,
+# `enable()` falla con ValueError si otro ya está activo (en otro hilo o en
+# otra vista asíncrona del mismo event loop).
+_CPROFILE_LOCK = threading.Lock()
+
+
+class StackSampler:
+    """
+    Clase de perfilador por muestreo: un hilo lee cada `interval` segundos la
+    pila del hilo perfilado y cuenta cuántas veces aparece cada pila.
+
+    El resultado se exporta en el formato de pilas colapsadas ("a;b;c 12")
+    que leen flamegraph.pl, speedscope y otras herramientas de flame graphs.
+    """
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="vetsoft-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def collapsed(self):
+        """
+        Devuelve las pilas muestreadas en el formato de pilas colapsadas.
+
+        Returns:
+            str: Una línea por pila, con la cantidad de muestras al final.
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def get_profile_mode(request):
+    """
+    Obtiene el modo de perfilado pedido, sólo si el usuario es staff.
+
+    Args:
+        request: Objeto de solicitud HTTP con `?_profile=` o el encabezado
+            X-Vetsoft-Profile.
+
+    Returns:
+        str: "cprofile", "sample" o None si no se pidió (o no se permite).
+    """
+    mode = request.GET.get("_profile") or request.headers.get("X-Vetsoft-Profile")
+    if mode not in MODES:
+        return None
+
+    user = getattr(request, "user", None)
+    if user is None or not user.is_staff:
+        return None
+
+    return mode
+
+
+def _save(request, extension, content):
+    if not settings.PROFILE_DIR:
+        return None
+
+    os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+    match = request.resolver_match
+    name = getattr(match, "url_name", None) or "unmatched"
+    filename = f"{time.strftime('%Y%m%d-%H%M%S')}-{name}-{os.getpid()}.{extension}"
+    path = os.path.join(settings.PROFILE_DIR, filename)
+    if isinstance(content, cProfile.Profile):
+        content.dump_stats(path)
+    else:
+        with open(path, "w") as file:
+            file.write(content)
+    return filename
+
+
+def _busy():
+    return HttpResponse(
+        "Ya se está perfilando otra solicitud con cProfile; reintente o use ?_profile=sample.\n",
+        status=409,
+        content_type="text/plain; charset=utf-8",
+    )
+
+
+class ProfilerMiddleware:
+    """
+    Clase de middleware que perfila una solicitud a pedido de un usuario staff.
+
+    Con PROFILING activo, `?_profile=cprofile` (o el encabezado
+    `X-Vetsoft-Profile: cprofile`) ejecuta la vista con cProfile y
+    `?_profile=sample` con un perfilador por muestreo (ver `StackSampler`). En
+    lugar de la página se devuelve el reporte: las funciones más costosas
+    (cProfile) o las pilas colapsadas (muestreo). Si PROFILE_DIR está
+    configurado, también se guardan los pstats (.prof) o las pilas
+    (.collapsed) y el archivo se indica en el encabezado X-Profile-File.
+    Mientras otra solicitud se perfila con cProfile se responde 409 sin
+    ejecutar la vista; el muestreo no tiene ese límite.
+
+    Sin PROFILING el middleware no se instala, así que no agrega ningún costo.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.PROFILING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        mode = get_profile_mode(request)
+        if mode is None:
+            return self.get_response(request)
+
+        profiler = self._start(mode)
+        if profiler is None:
+            return _busy()
+        try:
+            self.get_response(request)
+        finally:
+            self._stop(profiler)
+        return self._report(request, profiler)
+
+    async def __acall__(self, request):
+        mode = get_profile_mode(request)
+        if mode is None:
+            return await self.get_response(request)
+
+        # En las vistas asíncronas se perfila el hilo del event loop.
+        profiler = self._start(mode)
+        if profiler is None:
+            return _busy()
+        try:
+            await self.get_response(request)
+        finally:
+            self._stop(profiler)
+        return self._report(request, profiler)
+
+    def _start(self, mode):
+        if mode == "cprofile":
+            if not _CPROFILE_LOCK.acquire(blocking=False):
+                return None
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # Otra herramienta (por ejemplo, un depurador) ya perfila.
+                _CPROFILE_LOCK.release()
+                return None
+        else:
+            profiler = StackSampler(threading.get_ident(), settings.PROFILE_SAMPLE_INTERVAL)
+            profiler.start()
+        return profiler
+
+    def _stop(self, profiler):
+        if isinstance(profiler, cProfile.Profile):
+            profiler.disable()
+            _CPROFILE_LOCK.release()
+        else:
+            profiler.stop()
+
+    def _report(self, request, profiler):
+        if isinstance(profiler, cProfile.Profile):
+            stream = io.StringIO()
+            stats = pstats.Stats(profiler, stream=stream)
+            stats.sort_stats("cumulative").print_stats(settings.PROFILE_TOP)
+            report = stream.getvalue()
+            filename = _save(request, "prof", profiler)
+        else:
+            report = profiler.collapsed()
+            filename = _save(request, "collapsed", report)
+
+        response = HttpResponse(report, content_type="text/plain; charset=utf-8")
+        if filename:
+            response["X-Profile-File"] = filename
+        return response
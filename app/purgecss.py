@@ -0,0 +1,143 @@
+import fnmatch
+import re
+from pathlib import Path
+
+# Palabras de los archivos de contenido que pueden ser nombres de clases.
+TOKEN_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+# Nombres de clases de un selector.
+CLASS_RE = re.compile(r"\.(-?[A-Za-z_][\w-]*)")
+
+# Reglas @ cuyo contenido son otras reglas, que se filtran de forma recursiva.
+GROUPING_RULES = ("@media", "@supports", "@container", "@layer")
+
+
+def used_tokens(patterns, base_dir):
+    """
+    Reúne las palabras de los archivos de contenido (templates, código Python,
+    JavaScript) que pueden ser nombres de clases.
+
+    Se toma cada palabra como posible clase, igual que el extractor por defecto
+    de PurgeCSS: es preferible conservar una regla de más que perder una que
+    se usa.
+
+    Args:
+        patterns: Patrones glob de los archivos de contenido, relativos a `base_dir`.
+        base_dir: Directorio base de los patrones.
+
+    Returns:
+        set: Las palabras encontradas.
+    """
+    tokens = set()
+    for pattern in patterns:
+        for path in sorted(Path(base_dir).glob(pattern)):
+            tokens.update(TOKEN_RE.findall(path.read_text(encoding="utf-8")))
+    return tokens
+
+
+def _skip_string(css, index):
+    quote = css[index]
+    index += 1
+    while index < len(css) and css[index] != quote:
+        index += 2 if css[index] == "\\" else 1
+    return index + 1
+
+
+def _blocks(css):
+    """
+    Separa el CSS en bloques de primer nivel: pares (preludio, contenido),
+    donde el contenido es None en las sentencias sin llaves como `@charset` y
+    en los comentarios de licencia.
+    """
+    index, start, depth, body_start = 0, 0, 0, None
+    while index < len(css):
+        char = css[index]
+        if char in "\"'":
+            index = _skip_string(css, index)
+            continue
+        if css.startswith("/*", index):
+            end = css.find("*/", index + 2)
+            end = len(css) if end == -1 else end + 2
+            if depth == 0:
+                # Los comentarios /*! ... */ llevan la licencia y se conservan.
+                if css.startswith("/*!", index):
+                    yield css[index:end], None
+                start = end
+            index = end
+            continue
+
+        if char == "{":
+            if depth == 0:
+                body_start = index
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                yield css[start:body_start].strip(), css[body_start + 1:index]
+                start = index + 1
+        elif char == ";" and depth == 0:
+            yield css[start:index].strip(), None
+            start = index + 1
+        index += 1
+
+
+def _split_selectors(prelude):
+    selectors, depth, start = [], 0, 0
+    for index, char in enumerate(prelude):
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append(prelude[start:index])
+            start = index + 1
+    selectors.append(prelude[start:])
+    return selectors
+
+
+def _is_used(selector, used, safelist):
+    return all(
+        name in used or any(fnmatch.fnmatchcase(name, pattern) for pattern in safelist)
+        for name in CLASS_RE.findall(selector)
+    )
+
+
+def purge_css(css, used, safelist=()):
+    """
+    Quita del CSS las reglas cuyos selectores usan clases que no aparecen en
+    `used`.
+
+    De cada regla se conservan los selectores cuyas clases se usan todas; si
+    no queda ninguno, se quita la regla. Las reglas @media, @supports, etc. se
+    filtran por dentro y el resto de las reglas @ (@font-face, @keyframes, ...)
+    se conservan sin cambios.
+
+    Args:
+        css: Contenido del archivo CSS.
+        used: Nombres de clases usados (ver `used_tokens`).
+        safelist: Patrones fnmatch de clases que se conservan siempre, como
+            las que se arman dinámicamente en los templates ("alert-*").
+
+    Returns:
+        str: El CSS sin las reglas que no se usan.
+    """
+    output = []
+    for prelude, body in _blocks(css):
+        if prelude.startswith("/*"):
+            output.append(prelude)
+        elif body is None:
+            output.append(f"{prelude};")
+        elif prelude.startswith(GROUPING_RULES):
+            inner = purge_css(body, used, safelist)
+            if inner:
+                output.append(f"{prelude}{{{inner}}}")
+        elif prelude.startswith("@"):
+            output.append(f"{prelude}{{{body}}}")
+        else:
+            selectors = [
+                selector for selector in _split_selectors(prelude)
+                if _is_used(selector, used, safelist)
+            ]
+            if selectors:
+                output.append(f"{','.join(selectors)}{{{body}}}")
+    return "".join(output)
@@ -0,0 +1,166 @@
+import re
+from contextlib import contextmanager
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from .pagination import get_page_size, make_page, read_cursor
+
+# Columnas indexadas por la migración 0010_search_index para cada modelo.
+SEARCH_FIELDS = {
+    "app_client": ("name", "email", "phone", "address"),
+    "app_pet": ("name", "breed"),
+}
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def build_match_query(text):
+    """
+    Convierte el texto ingresado en una consulta FTS5 por prefijo.
+
+    Cada palabra se busca como prefijo ("vero" encuentra "Veron") y se cita para
+    que los caracteres especiales de FTS5 no generen errores de sintaxis.
+
+    Args:
+        text: Texto ingresado en el buscador.
+
+    Returns:
+        str: Consulta para el operador MATCH, o "" si no hay palabras.
+    """
+    return " ".join(f'"{token}"*' for token in TOKEN_RE.findall(text))
+
+
+@contextmanager
+def deferred_indexing(model):
+    """
+    Difiere la indexación de texto completo de las filas insertadas dentro del
+    bloque, para cargas masivas.
+
+    Indexar fila por fila desde el trigger es varias veces más lento que
+    indexar todas las filas nuevas con un único INSERT ... SELECT, así que
+    dentro de una transacción se quita el trigger de inserción, se indexan al
+    final las filas con id mayor al último existente y se vuelve a crear el
+    trigger con su definición original. Si algo falla, la transacción deshace
+    también el cambio del trigger.
+
+    Args:
+        model: Modelo en el que se van a insertar filas.
+    """
+    table = model._meta.db_table
+    fields = SEARCH_FIELDS.get(table)
+    if fields is None or connection.vendor != "sqlite":
+        yield
+        return
+
+    fts = f"{table}_fts"
+    columns = ", ".join(fields)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = %s",
+            [f"{fts}_ai"],
+        )
+        trigger = cursor.fetchone()
+        if trigger is None:
+            yield
+            return
+
+        cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+        last_id = cursor.fetchone()[0]
+        cursor.execute(f"DROP TRIGGER {fts}_ai")
+
+        yield
+
+        cursor.execute(
+            f"INSERT INTO {fts}(rowid, {columns}) "
+            f"SELECT id, {columns} FROM {table} WHERE id > %s",
+            [last_id],
+        )
+        cursor.execute(trigger[0])
+
+
+def _convert_cursor(cursor):
+    """
+    Convierte los valores de un cursor de búsqueda (relevancia e id), que se
+    pasan a la consulta SQL. Devuelve None si el cursor no es válido.
+    """
+    try:
+        return [float(cursor[0]), int(cursor[1])]
+    except (TypeError, ValueError):
+        return None
+
+
+def _fts_queryset(model, match, cursor, backwards, limit):
+    table = model._meta.db_table
+    fts = f"{table}_fts"
+    op, direction = ("<", "DESC") if backwards else (">", "ASC")
+
+    where = ""
+    params = [match]
+    if cursor is not None:
+        where = f"WHERE (s.score {op} %s OR (s.score = %s AND s.id {op} %s))"
+        params += [cursor[0], cursor[0], cursor[1]]
+
+    sql = (
+        f"SELECT t.*, s.score AS score FROM ("
+        f"SELECT rowid AS id, bm25({fts}) AS score FROM {fts} WHERE {fts} MATCH %s"
+        f") s JOIN {table} t ON t.id = s.id {where} "
+        f"ORDER BY s.score {direction}, s.id {direction} LIMIT %s"
+    )
+    return list(model.objects.raw(sql, params + [limit]))
+
+
+def _fallback_queryset(model, text, cursor, backwards, limit):
+    condition = Q()
+    for token in TOKEN_RE.findall(text):
+        token_condition = Q()
+        for field in SEARCH_FIELDS[model._meta.db_table]:
+            token_condition |= Q(**{f"{field}__icontains": token})
+        condition &= token_condition
+
+    queryset = model.objects.filter(condition).order_by("-pk" if backwards else "pk")
+    if cursor is not None:
+        op = "lt" if backwards else "gt"
+        queryset = queryset.filter(**{f"pk__{op}": cursor[1]})
+
+    items = list(queryset[:limit])
+    for item in items:
+        item.score = 0
+    return items
+
+
+def search(request, model, text):
+    """
+    Busca filas de un modelo por texto completo y devuelve una página de
+    resultados ordenados por relevancia (bm25).
+
+    La paginación es por cursor sobre (relevancia, id), igual que los
+    repositorios, por lo que pedir páginas siguientes no usa OFFSET.
+
+    Args:
+        request: Objeto de solicitud HTTP con los parámetros `after`, `before`
+            y `page_size`.
+        model: Modelo a buscar (Client o Pet).
+        text: Texto ingresado en el buscador.
+
+    Returns:
+        KeysetPage: La página de resultados.
+    """
+    page_size = get_page_size(request)
+    cursor, backwards = read_cursor(request)
+    if cursor is not None:
+        cursor = _convert_cursor(cursor)
+        backwards = backwards and cursor is not None
+
+    match = build_match_query(text)
+    if not match:
+        rows = []
+    elif connection.vendor == "sqlite":
+        rows = _fts_queryset(model, match, cursor, backwards, page_size + 1)
+    else:
+        rows = _fallback_queryset(model, text, cursor, backwards, page_size + 1)
+
+    return make_page(
+        rows, page_size, "score", cursor, backwards, {"q": text}, default_sort="score",
+    )
@@ -0,0 +1,288 @@
+import datetime
+import functools
+import random
+import unicodedata
+from contextlib import contextmanager, nullcontext
+from itertools import islice
+
+from django.db import connection, transaction
+from django.db.models import Max, Min
+
+from .importers import ENTITIES, bulk_insert
+from .models import Client, Vet
+from .search import deferred_indexing
+
+# Tamaños de datos con nombre que aceptan `seed --count` y `benchmark --size`.
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+# PRAGMA de SQLite durante una carga masiva: sin esperar a que cada commit
+# llegue al disco y con más caché de páginas. Si el proceso se corta a mitad de
+# la carga la base puede quedar inconsistente, así que sólo se usan para
+# generar datos de prueba.
+BULK_LOAD_PRAGMAS = {
+    "synchronous": "OFF",
+    "cache_size": "-262144",
+    "temp_store": "MEMORY",
+}
+
+FIRST_NAMES = (
+    "Juan", "María", "Lucía", "Martín", "Sofía", "Mateo", "Valentina", "Santiago",
+    "Camila", "Joaquín", "Julieta", "Tomás", "Agustina", "Benjamín", "Florencia",
+    "Nicolás", "Martina", "Facundo", "Paula", "Ignacio", "Rocío", "Franco", "Ana",
+    "Luciano", "Carla", "Ian", "Elena", "Diego", "Victoria", "Gonzalo",
+)
+
+LAST_NAMES = (
+    "González", "Rodríguez", "Gómez", "Fernández", "López", "Díaz", "Martínez",
+    "Pérez", "García", "Sánchez", "Romero", "Sosa", "Torres", "Álvarez", "Ruiz",
+    "Ramírez", "Flores", "Benítez", "Acosta", "Medina", "Herrera", "Suárez",
+    "Aguirre", "Pereyra", "Gutiérrez", "Giménez", "Molina", "Silva", "Castro", "Rojas",
+)
+
+STREETS = ("Calle", "Avenida", "Diagonal")
+
+PET_NAMES = (
+    "Firulais", "Michi", "Luna", "Toby", "Lola", "Rocky", "Nala", "Simba", "Coco",
+    "Milo", "Kira", "Max", "Frida", "Tango", "Pelusa", "Canela", "Bruno", "Mora",
+)
+
+BREEDS = (
+    "Labrador", "Caniche", "Siamés", "Bulldog", "Golden", "Persa", "Beagle",
+    "Ovejero Alemán", "Mestizo", "Border Collie", "Dachshund", "Maine Coon",
+)
+
+PRODUCTS = (
+    ("Alimento balanceado", "Alimento"), ("Collar", "Accesorio"), ("Correa", "Accesorio"),
+    ("Pipeta", "Antiparasitario"), ("Shampoo", "Higiene"), ("Rascador", "Juguete"),
+    ("Pelota", "Juguete"), ("Cucha", "Accesorio"), ("Piedras sanitarias", "Higiene"),
+    ("Snack dental", "Alimento"),
+)
+
+BRANDS = ("Pro", "Plus", "Premium", "Natural", "Max", "Vital", "Eco", "Junior")
+
+MEDICINES = (
+    ("Amoxicilina", "Antibiótico de amplio espectro"),
+    ("Meloxicam", "Antiinflamatorio no esteroide"),
+    ("Ivermectina", "Antiparasitario interno y externo"),
+    ("Metronidazol", "Antibiótico y antiprotozoario"),
+    ("Prednisolona", "Corticoide antiinflamatorio"),
+    ("Tramadol", "Analgésico"),
+    ("Enrofloxacina", "Antibiótico"),
+    ("Omeprazol", "Protector gástrico"),
+)
+
+# Fecha de referencia de los cumpleaños: fija para que los datos sólo dependan
+# de la semilla, y en el pasado para que pasen la validación.
+BIRTHDAY_REFERENCE = datetime.date(2024, 1, 1)
+
+
+def parse_size(value):
+    """
+    Convierte un tamaño de datos ("1k", "100k", "1m" o un número) en filas.
+
+    Args:
+        value: Tamaño pedido.
+
+    Returns:
+        int: Cantidad de filas por modelo.
+    """
+    return SIZES.get(value.lower()) or int(value)
+
+
+@functools.cache
+def _ascii(text):
+    return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode().lower()
+
+
+def _pick(rng, options):
+    # Más rápido que `rng.choice` para generar millones de filas.
+    return options[int(rng.random() * len(options))]
+
+
+def _between(rng, low, high):
+    # Más rápido que `rng.randrange(low, high)`.
+    return low + int(rng.random() * (high - low))
+
+
+def _person(rng, number):
+    first = _pick(rng, FIRST_NAMES)
+    last = _pick(rng, LAST_NAMES)
+    email = f"{_ascii(first)}.{_ascii(last).replace(' ', '')}{number}@vetsoft.com"
+    phone = f"54{_between(rng, 10**9, 10**10)}"
+    return f"{first} {last}", email, phone
+
+
+def _client_row(rng, number):
+    name, email, phone = _person(rng, number)
+    address = f"{_pick(rng, STREETS)} {_between(rng, 1, 200)} nro {_between(rng, 1, 3000)}"
+    return (name, phone, email, address)
+
+
+def _pet_row(rng, number):
+    birthday = BIRTHDAY_REFERENCE - datetime.timedelta(days=_between(rng, 1, 20 * 365))
+    return (_pick(rng, PET_NAMES), _pick(rng, BREEDS), birthday.isoformat())
+
+
+def _product_row(rng, number):
+    name, type = _pick(rng, PRODUCTS)
+    price = round(rng.uniform(100, 50000), 2)
+    return (f"{name} {_pick(rng, BRANDS)}", type, price, _between(rng, 0, 500))
+
+
+def _medicine_row(rng, number):
+    name, description = _pick(rng, MEDICINES)
+    return (f"{name} {_pick(rng, (5, 10, 20, 50, 100, 250))} mg", description, _between(rng, 1, 11))
+
+
+def _vet_row(rng, number):
+    name, email, phone = _person(rng, number)
+    return (name, email, phone)
+
+
+# Generadores de filas de cada entidad, con los valores en el orden de las
+# columnas de `importers.ENTITIES` (las mascotas, sin el dueño ni el
+# veterinario, que agrega `seed_entity`).
+GENERATORS = {
+    "clients": _client_row,
+    "pets": _pet_row,
+    "products": _product_row,
+    "medicines": _medicine_row,
+    "vets": _vet_row,
+}
+
+
+def generate_rows(entity, count, seed=0):
+    """
+    Genera filas válidas de una entidad de forma determinista.
+
+    La misma semilla siempre genera las mismas filas, y cada entidad usa su
+    propia secuencia, así que los datos no cambian al agregar otra entidad.
+
+    Args:
+        entity: Nombre de la entidad ("clients", "pets", "products",
+            "medicines" o "vets").
+        count: Cantidad de filas a generar.
+        seed: Semilla de los datos.
+
+    Returns:
+        iterator: Tuplas con los valores de las columnas de la entidad.
+    """
+    rng = random.Random(f"{entity}:{seed}")
+    row = GENERATORS[entity]
+    return (row(rng, number) for number in range(count))
+
+
+def _link_pets(rows, seed):
+    """
+    Agrega a cada mascota generada un dueño y un veterinario elegidos entre
+    los ya cargados, o None si no hay. Se eligen por rango de id, porque los
+    ids de los datos generados son consecutivos.
+    """
+    rng = random.Random(f"pet-links:{seed}")
+    ranges = [model.objects.aggregate(low=Min("pk"), high=Max("pk")) for model in (Client, Vet)]
+
+    def pick(ids):
+        return None if ids["low"] is None else _between(rng, ids["low"], ids["high"] + 1)
+
+    for row in rows:
+        yield (*row, *[pick(ids) for ids in ranges])
+
+
+@contextmanager
+def bulk_load():
+    """
+    Aplica los PRAGMA de `BULK_LOAD_PRAGMAS` a la conexión dentro del bloque y
+    restaura después los valores anteriores.
+
+    En SQLite, con el modo de journal por defecto, también se usa un journal
+    en memoria; una base en modo WAL se deja como está, porque salir de WAL
+    requiere acceso exclusivo. Dentro de una transacción los PRAGMA no se
+    pueden cambiar y el bloque se ejecuta sin cambios.
+    """
+    if connection.vendor != "sqlite" or connection.in_atomic_block:
+        yield
+        return
+
+    pragmas = dict(BULK_LOAD_PRAGMAS)
+    with connection.cursor() as cursor:
+        cursor.execute("PRAGMA journal_mode")
+        if cursor.fetchone()[0].lower() != "wal":
+            pragmas["journal_mode"] = "MEMORY"
+
+        previous = {}
+        for pragma, value in pragmas.items():
+            cursor.execute(f"PRAGMA {pragma}")
+            previous[pragma] = cursor.fetchone()[0]
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            for pragma, value in previous.items():
+                cursor.execute(f"PRAGMA {pragma} = {value}")
+
+
+@contextmanager
+def rebuilt_indexes(model):
+    """
+    Quita los índices de la tabla del modelo dentro del bloque y los vuelve a
+    crear al final.
+
+    Crear un índice sobre la tabla ya cargada ordena las filas una sola vez,
+    en lugar de insertar cada fila en cada índice. Debe usarse dentro de una
+    transacción, para que un error deshaga también la baja de los índices.
+
+    Args:
+        model: Modelo en cuya tabla se van a insertar filas.
+    """
+    if connection.vendor != "sqlite":
+        yield
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name, sql FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = %s AND sql IS NOT NULL",
+            [model._meta.db_table],
+        )
+        indexes = cursor.fetchall()
+        for name, _ in indexes:
+            cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+
+        yield
+
+        for _, sql in indexes:
+            cursor.execute(sql)
+
+
+def seed_entity(entity, count, seed=0, chunk_size=10000):
+    """
+    Inserta filas generadas con `generate_rows` por bloques de `chunk_size`,
+    todas en una misma transacción.
+
+    El índice de búsqueda se arma una sola vez al final (ver
+    `deferred_indexing`), y si se cargan al menos tantas filas como las que ya
+    hay, los demás índices también (ver `rebuilt_indexes`).
+    Las mascotas se vinculan con los clientes y veterinarios ya cargados.
+
+    Args:
+        entity: Nombre de la entidad.
+        count: Cantidad de filas a insertar.
+        seed: Semilla de los datos.
+        chunk_size: Filas insertadas por bloque.
+
+    Returns:
+        int: Cantidad de filas insertadas.
+    """
+    model, _, columns, _ = ENTITIES[entity]
+    rows = generate_rows(entity, count, seed)
+    if entity == "pets":
+        rows = _link_pets(rows, seed)
+    inserted = 0
+    with transaction.atomic(), deferred_indexing(model):
+        large = count >= max(chunk_size, model.objects.count())
+        with rebuilt_indexes(model) if large else nullcontext():
+            while chunk := list(islice(rows, chunk_size)):
+                bulk_insert(model, columns, chunk)
+                inserted += len(chunk)
+    return inserted
@@ -0,0 +1,67 @@
+import re
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+
+from .instrumentation import record_query
+from .models import CacheVersion, Client, Medicine, Pet, Product, Vet
+from .slow_queries import log_slow_query
+
+CACHED_MODELS = (Client, Medicine, Pet, Product, Vet)
+
+PRAGMA_VALUE_RE = re.compile(r"^-?[A-Za-z0-9_]+$")
+
+
+def bump_cache_version(sender, **kwargs):
+    """
+    Invalida lo cacheado a partir de un modelo cuando se guarda o elimina una fila.
+
+    Args:
+        sender: Modelo de la fila guardada o eliminada.
+    """
+    CacheVersion.bump(sender)
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """
+    Aplica los PRAGMA de SQLITE_PRAGMAS a cada conexión nueva de SQLite.
+
+    Args:
+        sender: Clase de la conexión.
+        connection: Conexión recién creada.
+    """
+    if connection.vendor != "sqlite" or not settings.SQLITE_PRAGMAS:
+        return
+
+    with connection.cursor() as cursor:
+        for pragma, value in settings.SQLITE_PRAGMAS.items():
+            if not PRAGMA_VALUE_RE.match(pragma) or not PRAGMA_VALUE_RE.match(str(value)):
+                raise ImproperlyConfigured(f"PRAGMA inválido: {pragma}={value}")
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+
+
+def instrument_connection(sender, connection, **kwargs):
+    """
+    Agrega a cada conexión la medición de consultas de `app.instrumentation`
+    y el log de consultas lentas de `app.slow_queries`.
+
+    Args:
+        sender: Clase de la conexión.
+        connection: Conexión recién creada.
+    """
+    for wrapper in (record_query, log_slow_query):
+        if wrapper not in connection.execute_wrappers:
+            connection.execute_wrappers.append(wrapper)
+
+
+def connect():
+    """
+    Conecta las señales de la aplicación.
+    """
+    for model in CACHED_MODELS:
+        post_save.connect(bump_cache_version, sender=model, dispatch_uid=f"cache-{model.__name__}")
+        post_delete.connect(bump_cache_version, sender=model, dispatch_uid=f"cache-{model.__name__}")
+    connection_created.connect(configure_sqlite, dispatch_uid="sqlite-pragmas")
+    connection_created.connect(instrument_connection, dispatch_uid="query-metrics")
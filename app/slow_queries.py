@@ -0,0 +1,209 @@
+import datetime
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+
+from .instrumentation import current_request
+
+logger = logging.getLogger("vetsoft.slow_queries")
+
+# Sentencias a las que se les pide el plan de ejecución.
+EXPLAINABLE = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+
+# Listas de parámetros de largo variable (por ejemplo, `IN (%s, %s, ...)`),
+# que se normalizan para que cuenten como la misma forma de consulta.
+_PLACEHOLDERS_RE = re.compile(r"%s(?:\s*,\s*%s)+")
+
+# Formas de consulta cuyo plan ya se registró en este proceso.
+_explained = set()
+_explained_lock = threading.Lock()
+
+
+def statement_shape(sql):
+    """
+    Obtiene la forma de una consulta: el SQL con las listas de parámetros
+    normalizadas.
+
+    Args:
+        sql: SQL de la consulta, con `%s` en lugar de los parámetros.
+
+    Returns:
+        str: Identificador corto de la forma de la consulta.
+    """
+    normalized = _PLACEHOLDERS_RE.sub("%s, ...", sql)
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12]
+
+
+def redact(params):
+    """
+    Reemplaza los valores de los parámetros por su tipo (y largo, si es un
+    texto), para no guardar datos de clientes en el log.
+
+    Args:
+        params: Parámetros de la consulta.
+
+    Returns:
+        list: Los parámetros redactados.
+    """
+    if params is None:
+        return []
+    if isinstance(params, dict):
+        params = params.values()
+
+    redacted = []
+    for value in params:
+        if value is None or isinstance(value, bool):
+            redacted.append(value)
+        elif isinstance(value, (str, bytes)):
+            redacted.append(f"<{type(value).__name__}:{len(value)}>")
+        else:
+            redacted.append(f"<{type(value).__name__}>")
+    return redacted
+
+
+def explain(connection, sql, params):
+    """
+    Obtiene el plan de ejecución (EXPLAIN QUERY PLAN) de una consulta de SQLite.
+
+    Usa un cursor aparte, sin los envoltorios de ejecución, para no pisar los
+    resultados de la consulta original.
+
+    Returns:
+        list: Las líneas del plan, o None si no se pudo obtener.
+    """
+    if connection.vendor != "sqlite" or not sql.lstrip().upper().startswith(EXPLAINABLE):
+        return None
+
+    cursor = connection.create_cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return [row[-1] for row in cursor.fetchall()]
+    except Exception:
+        return None
+    finally:
+        cursor.close()
+
+
+def _source():
+    request = current_request()
+    if request is None:
+        return None, None
+
+    match = request.resolver_match
+    return getattr(match, "url_name", None), request.path
+
+
+def log_slow_query(execute, sql, params, many, context):
+    """
+    Envoltorio de ejecución de la base de datos que registra en el logger
+    "vetsoft.slow_queries" las consultas que tardan más de SLOW_QUERY_MS.
+
+    Cada entrada es una línea JSON con la vista de origen, la duración, el SQL
+    y los parámetros redactados. La primera vez que una forma de consulta es
+    lenta se agrega su plan de ejecución.
+    """
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms >= settings.SLOW_QUERY_MS:
+            _log(sql, params, many, context["connection"], elapsed_ms)
+
+
+def _log(sql, params, many, connection, elapsed_ms):
+    shape = statement_shape(sql)
+    url_name, path = _source()
+    entry = {
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+        "view": url_name,
+        "path": path,
+        "ms": round(elapsed_ms, 2),
+        "shape": shape,
+        "sql": sql,
+        "params": "<executemany>" if many else redact(params),
+    }
+
+    with _explained_lock:
+        first = shape not in _explained
+        _explained.add(shape)
+    if first and not many:
+        entry["plan"] = explain(connection, sql, params)
+
+    logger.warning(json.dumps(entry))
+
+
+def log_files(path):
+    """
+    Obtiene el archivo del log de consultas lentas y sus copias rotadas.
+
+    Args:
+        path: Ruta del log (SLOW_QUERY_LOG).
+
+    Returns:
+        list: Las rutas que existen, de la copia más vieja a la actual.
+    """
+    paths = [f"{path}.{index}" for index in range(settings.SLOW_QUERY_LOG_BACKUPS, 0, -1)]
+    paths.append(str(path))
+    return [path for path in paths if os.path.exists(path)]
+
+
+def aggregate(lines):
+    """
+    Agrupa las entradas del log de consultas lentas por forma de consulta.
+
+    Args:
+        lines: Líneas JSON del log.
+
+    Returns:
+        list: Un diccionario por forma con `shape`, `sql`, `count`,
+        `total_ms`, `max_ms`, `views` (Counter) y `plan`.
+    """
+    shapes = {}
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+
+        shape = shapes.get(entry["shape"])
+        if shape is None:
+            shape = shapes[entry["shape"]] = {
+                "shape": entry["shape"], "sql": entry["sql"], "count": 0,
+                "total_ms": 0.0, "max_ms": 0.0, "views": Counter(), "plan": None,
+            }
+        shape["count"] += 1
+        shape["total_ms"] += entry["ms"]
+        shape["max_ms"] = max(shape["max_ms"], entry["ms"])
+        shape["views"][entry.get("view") or entry.get("path") or "-"] += 1
+        if entry.get("plan"):
+            shape["plan"] = entry["plan"]
+
+    return list(shapes.values())
+
+
+def plan_warnings(plan):
+    """
+    Detecta en un plan de ejecución los recorridos completos de tablas y los
+    ordenamientos sin índice.
+
+    Args:
+        plan: Líneas de EXPLAIN QUERY PLAN.
+
+    Returns:
+        list: Las advertencias encontradas.
+    """
+    warnings = []
+    for line in plan or ():
+        if line.startswith("SCAN") and "USING" not in line:
+            warnings.append(f"recorrido completo: {line}")
+        elif "TEMP B-TREE" in line:
+            warnings.append(f"ordenamiento sin índice: {line}")
+    return warnings
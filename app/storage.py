@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.core.files.base import ContentFile
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+from .purgecss import purge_css, used_tokens
+
+
+class PurgedManifestStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    Clase de almacenamiento de archivos estáticos para `collectstatic`: quita
+    las reglas que no se usan de los CSS de PURGE_CSS_FILES, agrega un hash
+    del contenido al nombre de cada archivo y genera sus versiones
+    comprimidas con gzip y brotli (ver WhiteNoise).
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            paths = self.purge(paths)
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+
+    def purge(self, paths):
+        """
+        Reemplaza las copias recolectadas de los CSS de PURGE_CSS_FILES por su
+        versión sin las reglas que no se usan, antes de calcular los hashes.
+
+        Args:
+            paths: Archivos recolectados, con su almacenamiento de origen.
+
+        Returns:
+            dict: Los mismos archivos; los CSS reducidos se leen de este
+            almacenamiento.
+        """
+        files = [path for path in settings.PURGE_CSS_FILES if path in paths]
+        if not files:
+            return paths
+
+        used = used_tokens(settings.PURGE_CSS_CONTENT, settings.BASE_DIR)
+        paths = dict(paths)
+        for path in files:
+            storage, source = paths[path]
+            with storage.open(source) as file:
+                css = file.read().decode("utf-8")
+
+            purged = purge_css(css, used, settings.PURGE_CSS_SAFELIST)
+            self.delete(path)
+            self.save(path, ContentFile(purged.encode("utf-8")))
+            paths[path] = (self, path)
+        return paths
@@ -0,0 +1,100 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.template.loader import get_template, render_to_string
+
+ROWS_MARKER = "__vetsoft_rows__"
+
+
+def _page_parts(request, entity):
+    """
+    Renderiza la página del repositorio con la marca en lugar de las filas y
+    devuelve lo que va antes y después de la marca, y la función que renderiza
+    un bloque de filas.
+    """
+    # El token y los mensajes se resuelven antes de devolver la respuesta para
+    # que los middlewares puedan guardar la cookie y marcar los mensajes leídos.
+    get_token(request)
+    page = render_to_string(
+        f"{entity}/repository.html", {entity: [], "rows_marker": ROWS_MARKER}, request,
+    )
+    head, tail = page.split(ROWS_MARKER, 1)
+    rows_template = get_template(f"{entity}/rows.html")
+
+    def render_rows(rows):
+        return rows_template.render({entity: rows}, request)
+
+    return head, tail, render_rows
+
+
+def stream_repository(request, entity, queryset, chunk_size=None):
+    """
+    Genera una respuesta que envía la tabla completa de un repositorio a medida
+    que se leen las filas, sin armar la página entera en memoria.
+
+    La página se renderiza una sola vez con una marca en lugar de las filas; se
+    envía lo que está antes de la marca, luego las filas en bloques de
+    `chunk_size` leídas con `.iterator()`, y por último el resto de la página.
+
+    Args:
+        request: Objeto de solicitud HTTP.
+        entity: Nombre del repositorio (carpeta de templates y variable de contexto).
+        queryset: Queryset ordenado con las filas a enviar.
+        chunk_size: Cantidad de filas por bloque (por defecto STREAMING_CHUNK_SIZE).
+
+    Returns:
+        StreamingHttpResponse: Respuesta con la página del repositorio.
+    """
+    chunk_size = chunk_size or settings.STREAMING_CHUNK_SIZE
+    head, tail, render_rows = _page_parts(request, entity)
+
+    def content():
+        yield head
+
+        rows = []
+        sent = False
+        for row in queryset.iterator(chunk_size=chunk_size):
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield render_rows(rows)
+                rows = []
+                sent = True
+
+        if rows or not sent:
+            yield render_rows(rows)
+
+        yield tail
+
+    return StreamingHttpResponse(content(), content_type="text/html; charset=utf-8")
+
+
+def astream_repository(request, entity, queryset, chunk_size=None):
+    """
+    Versión asíncrona de `stream_repository`: las filas se leen con
+    `.aiterator()`, así que bajo ASGI la respuesta no ocupa un hilo mientras
+    se envía.
+
+    Returns:
+        StreamingHttpResponse: Respuesta con la página del repositorio.
+    """
+    chunk_size = chunk_size or settings.STREAMING_CHUNK_SIZE
+    head, tail, render_rows = _page_parts(request, entity)
+
+    async def content():
+        yield head
+
+        rows = []
+        sent = False
+        async for row in queryset.aiterator(chunk_size=chunk_size):
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield render_rows(rows)
+                rows = []
+                sent = True
+
+        if rows or not sent:
+            yield render_rows(rows)
+
+        yield tail
+
+    return StreamingHttpResponse(content(), content_type="text/html; charset=utf-8")
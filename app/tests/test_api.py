@@ -0,0 +1,181 @@
+import json
+
+from django.shortcuts import reverse
+from django.test import TestCase
+
+from app.models import Client, Pet, Product
+
+
+class ApiListTest(TestCase):
+    """
+    Clase de tests de integracion de los listados de la API.
+    """
+    def setUp(self):
+        for i in range(5):
+            Product.objects.create(name=f"Producto {i}", type="Perro", price=10 * i, stock=i)
+        Product.objects.create(name="Collar", type="Gato", price=300, stock=2)
+
+    def test_list_returns_all_fields(self):
+        response = self.client.get(reverse("api_list", args=["products"]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        data = response.json()
+        self.assertEqual(len(data["results"]), 6)
+        self.assertEqual(
+            set(data["results"][0]), {"id", "name", "type", "price", "stock"},
+        )
+        self.assertIsNone(data["next"])
+
+    def test_fields_projection(self):
+        response = self.client.get(
+            reverse("api_list", args=["products"]), {"fields": "name,stock", "type": "Gato"},
+        )
+
+        self.assertEqual(response.json()["results"], [{"name": "Collar", "stock": 2}])
+
+    def test_filters_with_lookups(self):
+        third = Product.objects.get(name="Producto 2")
+        response = self.client.get(
+            reverse("api_list", args=["products"]),
+            {"fields": "name", "type": "Perro", "id__gte": third.id, "sort": "-name"},
+        )
+
+        self.assertEqual(
+            [row["name"] for row in response.json()["results"]],
+            ["Producto 4", "Producto 3", "Producto 2"],
+        )
+
+    def test_cursor_pagination_keeps_projection(self):
+        url = reverse("api_list", args=["products"])
+        first = self.client.get(url, {"fields": "name", "sort": "name", "page_size": 4}).json()
+        second = self.client.get(first["next"]).json()
+
+        names = [row["name"] for row in first["results"] + second["results"]]
+        self.assertEqual(names, sorted(Product.objects.values_list("name", flat=True)))
+        self.assertEqual(set(second["results"][0]), {"name"})
+        self.assertIsNone(second["next"])
+
+        back = self.client.get(second["previous"]).json()
+        self.assertEqual(back["results"], first["results"])
+
+    def test_invalid_parameters(self):
+        url = reverse("api_list", args=["products"])
+
+        self.assertEqual(self.client.get(url, {"fields": "name,secret"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"password": "x"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"name__regex": "x"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"id": "abc"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/owners/").status_code, 404)
+
+    def test_only_indexed_columns_can_be_sorted_and_filtered(self):
+        url = reverse("api_list", args=["products"])
+
+        self.assertEqual(self.client.get(url, {"price": "10"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"stock__gte": "3"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"type__icontains": "rr"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"sort": "-stock"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"sort": "-name", "type": "Gato"}).status_code, 200)
+
+
+class ApiDetailTest(TestCase):
+    """
+    Clase de tests de integracion del alta, detalle, modificacion y baja por la API.
+    """
+    def post(self, entity, data):
+        return self.client.post(
+            reverse("api_list", args=[entity]), json.dumps(data), content_type="application/json",
+        )
+
+    def test_create_and_get(self):
+        response = self.post(
+            "clients",
+            {"name": "Juan Sebastian Veron", "phone": "54221555232", "email": "brujita75@vetsoft.com"},
+        )
+
+        self.assertEqual(response.status_code, 201)
+        client = Client.objects.get()
+        self.assertEqual(response.json()["id"], client.id)
+        self.assertEqual(client.address, "")
+
+        detail = self.client.get(reverse("api_detail", args=["clients", client.id]), {"fields": "email"})
+        self.assertEqual(detail.json(), {"email": "brujita75@vetsoft.com"})
+
+    def test_create_with_errors(self):
+        response = self.post("pets", {"name": "Firulais", "breed": "", "birthday": "2020-01-01"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"errors": {"breed": "Por favor ingrese la raza"}})
+        self.assertFalse(Pet.objects.exists())
+
+    def test_non_finite_price(self):
+        response = self.post("products", {"name": "Collar", "type": "Gato", "price": "nan", "stock": "1"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"errors": {"price": "El precio debe ser un número valido"}})
+
+        product = Product.objects.create(name="Collar", type="Gato", price=float("inf"), stock=1)
+        detail = self.client.get(reverse("api_detail", args=["products", product.id]))
+        listing = self.client.get(reverse("api_list", args=["products"]))
+
+        self.assertIsNone(detail.json()["price"])
+        self.assertIsNone(listing.json()["results"][0]["price"])
+
+    def test_patch_updates_only_sent_fields(self):
+        pet = Pet.objects.create(name="Firulais", breed="Labrador", birthday="2020-01-01")
+
+        response = self.client.patch(
+            reverse("api_detail", args=["pets", pet.id]),
+            json.dumps({"name": "Fido"}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(
+            response.json(),
+            {
+                "id": pet.id, "name": "Fido", "breed": "Labrador", "birthday": "2020-01-01",
+                "owner_id": None, "vet_id": None,
+            },
+        )
+
+    def test_put_validates_the_whole_record(self):
+        product = Product.objects.create(name="Collar", type="Gato", price=300, stock=2)
+
+        response = self.client.put(
+            reverse("api_detail", args=["products", product.id]),
+            json.dumps({"name": "Collar"}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("type", response.json()["errors"])
+
+    def test_delete(self):
+        product = Product.objects.create(name="Collar", type="Gato", price=300, stock=2)
+        url = reverse("api_detail", args=["products", product.id])
+
+        self.assertEqual(self.client.delete(url).status_code, 204)
+        self.assertEqual(self.client.delete(url).status_code, 404)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_writes_require_csrf_token(self):
+        client = self.client_class(enforce_csrf_checks=True)
+        product = Product.objects.create(name="Collar", type="Gato", price=300, stock=2)
+
+        forged = client.post(
+            reverse("api_list", args=["products"]),
+            json.dumps({"name": "Correa", "type": "Perro", "price": "10", "stock": "1"}),
+            content_type="text/plain",
+        )
+        deleted = client.delete(reverse("api_detail", args=["products", product.id]))
+
+        self.assertEqual(forged.status_code, 403)
+        self.assertEqual(deleted.status_code, 403)
+        self.assertEqual(Product.objects.count(), 1)
+
+        client.get(reverse("products_repo"))
+        token = client.cookies["csrftoken"].value
+        response = client.delete(
+            reverse("api_detail", args=["products", product.id]), headers={"X-CSRFToken": token},
+        )
+        self.assertEqual(response.status_code, 204)
@@ -0,0 +1,148 @@
+from django.shortcuts import reverse
+from django.test import TestCase, override_settings
+
+from app import async_views
+from app.models import Client, Pet, Product
+from app.urls import get_urlpatterns
+
+
+class AsyncUrls:
+    """
+    Clase de configuración de URLs que usa las vistas asíncronas.
+    """
+    urlpatterns = get_urlpatterns(async_views)
+
+
+@override_settings(ROOT_URLCONF=AsyncUrls)
+class AsyncRepositoryTest(TestCase):
+    """
+    Clase de tests de integracion de los repositorios asíncronos.
+    """
+    async def test_repository_is_paginated(self):
+        for i in range(3):
+            await Client.objects.acreate(
+                name=f"Cliente {i}", phone="54221555232", email=f"c{i}@vetsoft.com",
+            )
+
+        response = await self.async_client.get(reverse("clients_repo"), {"page_size": 2})
+        second = await self.async_client.get(
+            reverse("clients_repo") + response.context["page"].next_url,
+        )
+
+        self.assertTemplateUsed(response, "clients/repository.html")
+        self.assertEqual(len(response.context["clients"]), 2)
+        self.assertEqual(len(second.context["clients"]), 1)
+        self.assertContains(second, "Cliente 2")
+
+    async def test_repository_is_cached_until_a_write(self):
+        await Product.objects.acreate(name="Collar", type="Gato", price=300, stock=1)
+        await self.async_client.get(reverse("products_repo"))
+
+        await Product.objects.acreate(name="Correa", type="Perro", price=100, stock=1)
+        response = await self.async_client.get(reverse("products_repo"))
+
+        self.assertContains(response, "Correa")
+
+    async def test_repository_is_filtered_and_sorted(self):
+        await Product.objects.acreate(name="Rascador", type="Gato", price=200, stock=1)
+        await Product.objects.acreate(name="Collar", type="Gato", price=300, stock=1)
+        await Product.objects.acreate(name="Correa", type="Perro", price=100, stock=1)
+
+        response = await self.async_client.get(
+            reverse("products_repo"), {"filter": "type:Gato", "sort": "name"},
+        )
+
+        self.assertEqual([p.name for p in response.context["products"]], ["Collar", "Rascador"])
+
+    async def test_stream(self):
+        await Pet.objects.acreate(name="Firulais", breed="Labrador", birthday="2020-01-01")
+
+        response = await self.async_client.get(reverse("pets_repo"), {"stream": "1"})
+        content = b"".join([chunk async for chunk in response.streaming_content])
+
+        self.assertIn(b"Firulais", content)
+        self.assertTrue(content.rstrip().endswith(b"</html>"))
+
+
+@override_settings(ROOT_URLCONF=AsyncUrls)
+class AsyncFormTest(TestCase):
+    """
+    Clase de tests de integracion de los formularios y el stock asíncronos.
+    """
+    async def test_create_and_update_client(self):
+        data = {"name": "Juan Sebastian Veron", "phone": "54221555232", "email": "brujita75@vetsoft.com"}
+
+        response = await self.async_client.post(reverse("clients_form"), data)
+        self.assertRedirects(response, reverse("clients_repo"), fetch_redirect_response=False)
+
+        client = await Client.objects.aget()
+        self.assertEqual(client.address, "")
+
+        response = await self.async_client.post(
+            reverse("clients_form"), {**data, "id": client.id, "address": "13 y 44"},
+        )
+        await client.arefresh_from_db()
+        self.assertEqual(client.address, "13 y 44")
+
+    async def test_update_uses_model_methods(self):
+        owner = await Client.objects.acreate(name="Juan Perez", phone="54221555232", email="juan@vetsoft.com")
+        pet = await Pet.objects.acreate(
+            name="Firulais", breed="Labrador", birthday="2020-01-01", owner=owner,
+        )
+
+        # Como en las vistas sincrónicas, los campos vacíos o ausentes
+        # conservan su valor y el dueño sólo cambia si se envía.
+        response = await self.async_client.post(
+            reverse("pets_form"), {"id": pet.id, "name": "Fido", "breed": "", "birthday": ""},
+        )
+
+        self.assertRedirects(response, reverse("pets_repo"), fetch_redirect_response=False)
+        await pet.arefresh_from_db()
+        self.assertEqual((pet.name, pet.breed, pet.owner_id), ("Fido", "Labrador", owner.id))
+
+    async def test_update_product(self):
+        product = await Product.objects.acreate(name="Collar", type="Gato", price=300, stock=1)
+
+        response = await self.async_client.post(
+            reverse("products_form"),
+            {"id": product.id, "name": "Collar", "type": "Gato", "price": "250", "stock": "4"},
+        )
+
+        self.assertRedirects(response, reverse("products_repo"), fetch_redirect_response=False)
+        await product.arefresh_from_db()
+        self.assertEqual((product.price, product.stock), (250, 4))
+
+    async def test_form_errors(self):
+        response = await self.async_client.post(
+            reverse("products_form"), {"name": "Collar", "type": "Gato", "price": "-1", "stock": "1"},
+        )
+
+        self.assertContains(response, "El precio no puede ser negativo")
+        self.assertFalse(await Product.objects.aexists())
+
+    async def test_edit_form_and_404(self):
+        pet = await Pet.objects.acreate(name="Firulais", breed="Labrador", birthday="2020-01-01")
+
+        response = await self.async_client.get(reverse("pets_edit", args=[pet.id]))
+        missing = await self.async_client.get(reverse("pets_edit", args=[pet.id + 1]))
+
+        self.assertContains(response, "Firulais")
+        self.assertEqual(missing.status_code, 404)
+
+    async def test_stock(self):
+        product = await Product.objects.acreate(name="Collar", type="Gato", price=300, stock=1)
+
+        await self.async_client.post(
+            reverse("increase_stock"), {"product_id": product.id, "amount": "2"},
+        )
+        await self.async_client.post(
+            reverse("decrease_stock"), {"product_id": product.id, "amount": "3"},
+        )
+        response = await self.async_client.post(
+            reverse("decrease_stock"), {"product_id": product.id, "product_name": "Collar"},
+            follow=True,
+        )
+
+        await product.arefresh_from_db()
+        self.assertEqual(product.stock, 0)
+        self.assertContains(response, "Collar: Fuera de stock.")
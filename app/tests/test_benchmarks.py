@@ -0,0 +1,52 @@
+from django.test import SimpleTestCase, TestCase
+
+from app import urls
+from app.benchmarks.suite import compare, percentile, run, summarize
+from app.importers import ENTITIES
+from app.seeding import seed_entity
+
+
+class BenchmarkHelpersTest(SimpleTestCase):
+    """
+    Clase de tests de unidad de las funciones del benchmark.
+    """
+    def test_percentiles(self):
+        ordered = [n / 1000 for n in range(1, 101)]
+
+        self.assertEqual(percentile(ordered, 0.5), 0.05)
+        self.assertEqual(percentile(ordered, 0.99), 0.099)
+
+        summary = summarize(ordered[::-1])
+        self.assertEqual((summary["p50_ms"], summary["p95_ms"], summary["iterations"]), (50, 95, 100))
+
+    def test_compare_flags_regressions(self):
+        baseline = {"url:home": {"p95_ms": 10}, "url:vet_repo": {"p95_ms": 10}}
+        results = {
+            "url:home": {"p95_ms": 11},
+            "url:vet_repo": {"p95_ms": 13},
+            "url:nueva": {"p95_ms": 50},
+        }
+
+        rows = {row[0]: row for row in compare(results, baseline, 0.2)}
+
+        self.assertFalse(rows["url:home"][4])
+        self.assertTrue(rows["url:vet_repo"][4])
+        self.assertNotIn("url:nueva", rows)
+
+
+class BenchmarkRunTest(TestCase):
+    """
+    Clase de tests de los escenarios del benchmark.
+    """
+    def test_every_url_has_a_scenario(self):
+        for entity in ENTITIES:
+            seed_entity(entity, 5)
+
+        results = run(iterations=1, warmup=0)
+
+        self.assertEqual(
+            {name for name in results if name.startswith("url:")},
+            {f"url:{pattern.name}" for pattern in urls.urlpatterns} | {"url:decrease_stock_out_of_stock"},
+        )
+        self.assertIn("model:update_product", results)
+        self.assertEqual(results["url:home"]["iterations"], 1)
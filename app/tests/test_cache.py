@@ -0,0 +1,112 @@
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.shortcuts import reverse
+from django.test import TestCase
+
+from app.cache import get_or_build
+from app.models import CacheVersion, Client, Product
+
+
+class RepositoryCacheTest(TestCase):
+    """
+    Clase de tests de integracion de la cache de paginas de repositorio.
+    """
+    def setUp(self):
+        cache.clear()
+        Client.objects.create(name="Ana", phone="54221555232", email="ana@vetsoft.com")
+
+    def test_second_hit_only_reads_the_version(self):
+        self.client.get(reverse("clients_repo"))
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("clients_repo"))
+
+        self.assertContains(response, "ana@vetsoft.com")
+
+    def test_key_ignores_parameters_that_do_not_change_the_page(self):
+        url = reverse("clients_repo")
+        self.client.get(url)
+
+        # Parámetros ajenos, un tamaño de página inválido o un cursor alterado
+        # sirven la misma página, así que usan la misma entrada de la caché.
+        for params in ({"x": "1"}, {"utm_source": "mail", "page_size": "abc"}, {"after": "no-es-un-cursor"}):
+            with self.subTest(params=params), self.assertNumQueries(1):
+                self.client.get(url, params)
+
+        with self.assertNumQueries(3):
+            self.client.get(url, {"sort": "-name"})
+
+    def test_writes_invalidate_the_page(self):
+        self.client.get(reverse("clients_repo"))
+        self.client.post(
+            reverse("clients_form"),
+            data={"name": "Beto", "phone": "54221555233", "email": "beto@vetsoft.com", "address": ""},
+        )
+
+        response = self.client.get(reverse("clients_repo"))
+        self.assertContains(response, "beto@vetsoft.com")
+
+        Client.objects.get(name="Beto").delete()
+        response = self.client.get(reverse("clients_repo"))
+        self.assertNotContains(response, "beto@vetsoft.com")
+
+    def test_stock_changes_invalidate_products(self):
+        product = Product.objects.create(name="Alimento", type="Perro", price=10, stock=7)
+        self.client.get(reverse("products_repo"))
+
+        self.client.post(reverse("increase_stock"), {"product_id": product.id, "amount": 35})
+
+        response = self.client.get(reverse("products_repo"))
+        self.assertContains(response, "<td>42</td>", html=True)
+
+    def test_cached_rows_use_the_request_csrf_token(self):
+        self.client.get(reverse("clients_repo"))
+        response = self.client.get(reverse("clients_repo"))
+
+        self.assertNotContains(response, "__vetsoft_csrf_token__")
+        self.assertContains(response, 'name="csrfmiddlewaretoken"')
+
+    def test_rollback_restores_the_version(self):
+        before = CacheVersion.get_tokens(Client)
+
+        try:
+            with transaction.atomic():
+                Client.objects.create(name="Beto", phone="54221555233", email="beto@vetsoft.com")
+                self.assertNotEqual(CacheVersion.get_tokens(Client), before)
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        self.assertEqual(CacheVersion.get_tokens(Client), before)
+
+
+class GetOrBuildTest(TestCase):
+    """
+    Clase de tests de unidad de la reconstruccion coalescida de claves de cache.
+    """
+    def setUp(self):
+        cache.clear()
+
+    def test_cold_key_is_built_once_under_load(self):
+        calls = []
+
+        def build():
+            calls.append(1)
+            time.sleep(0.05)
+            return "valor"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_or_build("clave", build)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["valor"] * 8)
@@ -0,0 +1,113 @@
+import datetime
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from app.dashboard import compute_summary, get_dashboard, rebuild_summary
+from app.models import Client, Pet, Product, SummaryCounter
+from app.seeding import seed_entity
+
+TODAY = datetime.date(2026, 6, 15)
+
+
+class DashboardSummaryTest(TestCase):
+    """
+    Clase de tests de los contadores del tablero de inicio, que mantienen los
+    triggers de la migración 0013_dashboard_summary.
+    """
+    def assertInSync(self):
+        counters, birthdays = compute_summary()
+        dashboard = get_dashboard(TODAY)
+        self.assertEqual(dashboard["counts"]["product"], counters["product"][0])
+        self.assertAlmostEqual(dashboard["inventory_value"], counters["product"][1])
+        self.assertEqual(dashboard["out_of_stock"], counters["product_out_of_stock"][0])
+        self.assertEqual(sum(count for _, count in dashboard["pet_ages"]), sum(birthdays.values()))
+
+    def test_counts_follow_creates_and_deletes(self):
+        Client.save_client({"name": "Juan Perez", "phone": "54221555232", "email": "juan@vetsoft.com", "address": "Calle 1"})
+        client = Client.objects.create(name="Ana", phone="54221555233", email="ana@vetsoft.com")
+
+        self.assertEqual(get_dashboard()["counts"]["client"], 2)
+
+        client.delete()
+
+        self.assertEqual(get_dashboard()["counts"]["client"], 1)
+
+    def test_inventory_value_follows_stock_changes(self):
+        collar = Product.objects.create(name="Collar", type="Accesorio", price=10.5, stock=2)
+        Product.objects.create(name="Correa", type="Accesorio", price=5, stock=0)
+
+        self.assertEqual(get_dashboard()["inventory_value"], 21)
+        self.assertEqual(get_dashboard()["out_of_stock"], 1)
+
+        Product.increase_stock(collar.pk, 2)
+        self.assertEqual(get_dashboard()["inventory_value"], 42)
+
+        Product.decrease_stock(collar.pk, 4)
+        self.assertEqual(get_dashboard()["inventory_value"], 0)
+        self.assertEqual(get_dashboard()["out_of_stock"], 2)
+
+        collar.refresh_from_db()
+        collar.update_product({"name": "Collar", "type": "Accesorio", "price": "20", "stock": "3"})
+        self.assertEqual(get_dashboard()["inventory_value"], 60)
+        self.assertEqual(get_dashboard()["out_of_stock"], 1)
+        self.assertInSync()
+
+    def test_pets_by_age(self):
+        for birthday in ("2026-01-10", "2025-06-15", "2025-06-16", "2018-06-15", "2010-01-01"):
+            Pet.objects.create(name="Luna", breed="Caniche", birthday=birthday)
+        pet = Pet.objects.get(birthday="2010-01-01")
+
+        ages = dict(get_dashboard(TODAY)["pet_ages"])
+
+        self.assertEqual(ages, {
+            "Menos de 1 año": 2, "1 a 3 años": 1, "4 a 7 años": 0, "8 años o más": 2,
+        })
+
+        pet.update_pet({"birthday": "2020-01-01"})
+
+        self.assertEqual(dict(get_dashboard(TODAY)["pet_ages"])["4 a 7 años"], 1)
+        self.assertInSync()
+
+    def test_bulk_loads_are_counted(self):
+        seed_entity("products", 50)
+        seed_entity("pets", 50)
+
+        self.assertEqual(get_dashboard()["counts"]["pet"], 50)
+        self.assertInSync()
+
+    def test_dashboard_reads_summary_tables_only(self):
+        seed_entity("products", 50)
+
+        with self.assertNumQueries(2):
+            get_dashboard()
+
+    def test_rebuild_fixes_drift(self):
+        Product.objects.create(name="Collar", type="Accesorio", price=10, stock=2)
+        SummaryCounter.objects.filter(name="product").update(count=7, total=1)
+
+        changes = rebuild_summary()
+
+        self.assertEqual(changes, [("product", (7, 1), (1, 20))])
+        self.assertEqual(get_dashboard()["counts"]["product"], 1)
+        self.assertEqual(rebuild_summary(), [])
+
+    def test_reconcile_command(self):
+        Client.objects.create(name="Ana", phone="54221555233", email="ana@vetsoft.com")
+        SummaryCounter.objects.all().delete()
+        out = StringIO()
+
+        call_command("reconcile_dashboard", stdout=out)
+
+        self.assertIn("client: None -> (1, 0)", out.getvalue())
+        self.assertEqual(get_dashboard()["counts"]["client"], 1)
+
+    def test_home_shows_dashboard(self):
+        Product.objects.create(name="Collar", type="Accesorio", price=10, stock=0)
+
+        response = self.client.get(reverse("home"))
+
+        self.assertContains(response, 'data-testid="count-Productos">1</p>', html=False)
+        self.assertContains(response, 'data-testid="out-of-stock">1</p>', html=False)
@@ -0,0 +1,90 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+
+from django.core.management import call_command
+from django.shortcuts import reverse
+from django.test import TestCase
+
+from app.exporters import export_entity
+from app.models import Client, Pet, Product
+
+
+class ExportersTest(TestCase):
+    """
+    Clase de tests de unidad de la exportacion de entidades.
+    """
+    def setUp(self):
+        self.client_a = Client.objects.create(
+            name="Juan Sebastian Veron", phone="54221555232",
+            email="brujita75@vetsoft.com", address="13 y 44",
+        )
+        Client.objects.create(
+            name="Guido, Carrillo", phone="54221232555", email="goleador@vetsoft.com",
+        )
+
+    def test_csv_export(self):
+        content = b"".join(export_entity("clients", "csv")).decode()
+
+        self.assertEqual(content.splitlines(), [
+            "id,name,phone,email,address",
+            f"{self.client_a.id},Juan Sebastian Veron,54221555232,brujita75@vetsoft.com,13 y 44",
+            f'{self.client_a.id + 1},"Guido, Carrillo",54221232555,goleador@vetsoft.com,',
+        ])
+
+    def test_jsonl_export_with_dates(self):
+        Pet.objects.create(name="Firulais", breed="Labrador", birthday="2020-01-01")
+
+        content = b"".join(export_entity("pets", "jsonl")).decode()
+
+        self.assertEqual(json.loads(content.splitlines()[0])["birthday"], "2020-01-01")
+
+    def test_jsonl_export_with_non_finite_float(self):
+        # Un precio infinito no pasa la validación, pero puede venir de datos
+        # cargados por otro medio.
+        Product.objects.create(name="Collar", type="Gato", price=float("inf"), stock=1)
+
+        content = b"".join(export_entity("products", "jsonl")).decode()
+
+        self.assertIsNone(json.loads(content)["price"])
+
+    def test_gzip_export(self):
+        compressed = b"".join(export_entity("clients", "csv", compress=True))
+
+        self.assertEqual(
+            gzip.decompress(compressed), b"".join(export_entity("clients", "csv")),
+        )
+
+
+class ExportDataViewTest(TestCase):
+    """
+    Clase de tests de integracion de la vista y el comando de exportacion.
+    """
+    def test_export_view_streams_attachment(self):
+        Client.objects.create(name="Ana", phone="54221555232", email="ana@vetsoft.com")
+
+        response = self.client.get(
+            reverse("export_data", kwargs={"entity": "clients"}), {"gzip": "1"},
+        )
+
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertIn('filename="clients.csv.gz"', response["Content-Disposition"])
+        content = gzip.decompress(b"".join(response.streaming_content)).decode()
+        self.assertIn("ana@vetsoft.com", content)
+
+    def test_export_view_unknown_entity(self):
+        response = self.client.get(reverse("export_data", kwargs={"entity": "users"}))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_export_data_command(self):
+        Client.objects.create(name="Ana", phone="54221555232", email="ana@vetsoft.com")
+        path = os.path.join(tempfile.mkdtemp(), "clients.jsonl")
+        self.addCleanup(os.remove, path)
+
+        call_command("export_data", "clients", "--format", "jsonl", "--output", path, stderr=io.StringIO())
+
+        with open(path) as file:
+            self.assertEqual(json.loads(file.readline())["name"], "Ana")
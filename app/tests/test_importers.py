@@ -0,0 +1,122 @@
+import io
+import os
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.shortcuts import reverse
+from django.test import TestCase
+
+from app.importers import _iter_json_array, import_file, iter_rows
+from app.models import Client, Medicine, Pet, Product
+
+CLIENTS_CSV = (
+    "name,phone,email,address\n"
+    "Juan Sebastian Veron,54221555232,brujita75@vetsoft.com,13 y 44\n"
+    "Guido Carrillo,1234,goleador@vetsoft.com,1 y 57\n"
+    "Ana Lopez,54221232555,ana@vetsoft.com,\n"
+)
+
+
+class ImportersTest(TestCase):
+    """
+    Clase de tests de unidad de la importacion masiva de datos.
+    """
+    def test_csv_rows_are_validated_and_inserted(self):
+        result = import_file("clients", io.BytesIO(CLIENTS_CSV.encode()), "csv", chunk_size=1)
+
+        self.assertEqual(result.created, 2)
+        self.assertEqual(result.failed, 1)
+        self.assertEqual(
+            result.errors, [(2, {"phone": "El teléfono debe comenzar con '54'"})],
+        )
+        self.assertEqual(
+            list(Client.objects.order_by("id").values_list("name", flat=True)),
+            ["Juan Sebastian Veron", "Ana Lopez"],
+        )
+
+    def test_imported_clients_are_searchable(self):
+        import_file("clients", io.BytesIO(CLIENTS_CSV.encode()), "csv")
+        Client.objects.create(name="Ana Veron", phone="54221000000", email="ana2@vetsoft.com")
+
+        response = self.client.get(reverse("clients_search"), {"q": "veron"})
+
+        self.assertEqual(
+            sorted(client.name for client in response.context["clients"]),
+            ["Ana Veron", "Juan Sebastian Veron"],
+        )
+
+    def test_json_array_is_read_in_small_blocks(self):
+        data = (
+            '[{"name": "Aspirina", "description": "Analgesico", "dose": 5},\n'
+            ' {"name": "Ibuprofeno", "description": "Antiinflamatorio", "dose": 15}]'
+        )
+        rows = list(iter_rows(io.StringIO(data), "json"))
+        self.assertEqual(rows[0], {"name": "Aspirina", "description": "Analgesico", "dose": "5"})
+        self.assertEqual(len(list(_iter_json_array(io.StringIO(data), chunk_size=7))), 2)
+
+        result = import_file("medicines", io.BytesIO(data.encode()), "json")
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual(result.errors, [(2, {"dose": "La dosis debe ser entre 1 y 10"})])
+        self.assertEqual(Medicine.objects.get().dose, 5)
+
+    def test_jsonl_rows_with_invalid_values_are_reported(self):
+        data = (
+            '{"name": "Firulais", "breed": "Labrador", "birthday": "2020-01-01"}\n'
+            '{"name": "Michi", "breed": "Siames", "birthday": "no es una fecha"}\n'
+        )
+
+        result = import_file("pets", io.BytesIO(data.encode()), "jsonl")
+
+        self.assertEqual(result.created, 1)
+        self.assertEqual(result.failed, 1)
+        self.assertEqual(Pet.objects.get().name, "Firulais")
+
+    def test_errors_are_capped(self):
+        data = "name,type,price,stock\n" + "Producto,Alimento,-1,1\n" * 5
+
+        result = import_file("products", io.BytesIO(data.encode()), "csv", max_errors=2)
+
+        self.assertEqual(result.failed, 5)
+        self.assertEqual(len(result.errors), 2)
+        self.assertEqual(Product.objects.count(), 0)
+
+
+class ImportDataViewTest(TestCase):
+    """
+    Clase de tests de integracion de la vista y el comando de importacion.
+    """
+    def test_upload_shows_report(self):
+        upload = SimpleUploadedFile("clientes.csv", CLIENTS_CSV.encode())
+
+        response = self.client.post(
+            reverse("import_data"), {"entity": "clients", "file": upload},
+        )
+
+        self.assertTemplateUsed(response, "imports/form.html")
+        self.assertContains(response, "Se importaron 2 filas.")
+        self.assertContains(response, "El teléfono debe comenzar con &#x27;54&#x27;")
+        self.assertEqual(Client.objects.count(), 2)
+
+    def test_upload_requires_entity_and_file(self):
+        response = self.client.post(reverse("import_data"), {})
+
+        self.assertContains(response, "Por favor seleccione los datos a importar")
+        self.assertContains(response, "Por favor seleccione un archivo")
+
+    def test_import_data_command(self):
+        path = self.get_temp_file(CLIENTS_CSV)
+        out = io.StringIO()
+
+        call_command("import_data", "clients", path, stdout=out, stderr=io.StringIO())
+
+        self.assertIn("Se importaron 2 filas (1 con errores)", out.getvalue())
+        self.assertEqual(Client.objects.count(), 2)
+
+    def get_temp_file(self, content):
+        file = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False)
+        self.addCleanup(os.remove, file.name)
+        with file:
+            file.write(content)
+        return file.name
@@ -0,0 +1,167 @@
+import gc
+import json
+import os
+import re
+import tempfile
+import threading
+
+from django.shortcuts import reverse
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from app.metrics import (
+    LATENCY_BUCKETS,
+    Registry,
+    clear_process_metrics,
+    collect_all,
+    render,
+    retire_process_metrics,
+)
+
+
+def sample(text, name, **labels):
+    """
+    Devuelve el valor de una muestra del texto de /metrics, o None si no está.
+    """
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        metric, _, value = line.rpartition(" ")
+        match = re.fullmatch(r"(\w+)(?:\{(.*)\})?", metric)
+        found = dict(re.findall(r'(\w+)="([^"]*)"', match.group(2) or ""))
+        if match.group(1) == name and found == labels:
+            return float(value)
+    return None
+
+
+class RegistryTest(SimpleTestCase):
+    """
+    Clase de tests de unidad del registro de metricas por hilo.
+    """
+    def test_threads_are_merged_on_collect(self):
+        registry = Registry()
+
+        def work():
+            for _ in range(1000):
+                registry.inc("vetsoft_requests_total", (("view", "home"), ("status", "200")))
+                registry.observe("vetsoft_request_duration_seconds", 0.02, (("view", "home"),))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        collected = registry.collect()
+        self.assertEqual(
+            collected["counters"][("vetsoft_requests_total", (("view", "home"), ("status", "200")))],
+            4000,
+        )
+        buckets = collected["histograms"][("vetsoft_request_duration_seconds", (("view", "home"),))]
+        self.assertEqual(sum(buckets[:-1]), 4000)
+        self.assertEqual(buckets[LATENCY_BUCKETS.index(0.025)], 4000)
+
+    def test_finished_threads_are_retired(self):
+        registry = Registry()
+        registry.inc("vetsoft_requests_total", (("view", "home"),))
+
+        for _ in range(20):
+            thread = threading.Thread(
+                target=registry.observe, args=("vetsoft_request_duration_seconds", 0.02),
+            )
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        self.assertEqual(len(registry._shards), 1)
+        collected = registry.collect()
+        self.assertEqual(collected["counters"][("vetsoft_requests_total", (("view", "home"),))], 1)
+        self.assertEqual(sum(collected["histograms"][("vetsoft_request_duration_seconds", ())][:-1]), 20)
+
+    def test_histogram_is_rendered_cumulative(self):
+        registry = Registry()
+        for seconds in (0.001, 0.2, 20):
+            registry.observe("vetsoft_request_duration_seconds", seconds, (("view", "home"),))
+
+        text = render(registry.collect())
+
+        self.assertIn("# TYPE vetsoft_request_duration_seconds histogram", text)
+        bucket = "vetsoft_request_duration_seconds_bucket"
+        self.assertEqual(sample(text, bucket, view="home", le="0.005"), 1)
+        self.assertEqual(sample(text, bucket, view="home", le="0.25"), 2)
+        self.assertEqual(sample(text, bucket, view="home", le="+Inf"), 3)
+        self.assertEqual(sample(text, "vetsoft_request_duration_seconds_count", view="home"), 3)
+
+
+class MetricsViewTest(TestCase):
+    """
+    Clase de tests de integracion del endpoint /metrics.
+    """
+    def test_requests_are_reported_by_url_name(self):
+        before = render(collect_all())
+        self.client.get(reverse("clients_repo"))
+        self.client.get(reverse("clients_repo"))
+
+        response = self.client.get(reverse("metrics"))
+        text = response.content.decode()
+
+        self.assertEqual(response["Content-Type"], "text/plain; version=0.0.4; charset=utf-8")
+        count = "vetsoft_request_duration_seconds_count"
+        self.assertEqual(
+            sample(text, count, view="clients_repo"),
+            (sample(before, count, view="clients_repo") or 0) + 2,
+        )
+        self.assertIsNotNone(sample(text, "vetsoft_requests_total", view="clients_repo", status="200"))
+        self.assertIsNotNone(sample(text, "vetsoft_db_queries_total", view="clients_repo"))
+        self.assertIsNotNone(sample(text, "vetsoft_cache_hit_ratio", cache="clients"))
+        self.assertIsNotNone(sample(text, "vetsoft_writes_total", result="ok"))
+
+    def test_other_processes_are_merged(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        other = {
+            "counters": [["vetsoft_cache_requests_total", [["cache", "otra"], ["result", "hit"]], 3]],
+            "histograms": [
+                ["vetsoft_request_duration_seconds", [["view", "otra"]], [1] + [0] * 11 + [0.001]],
+            ],
+        }
+        with open(os.path.join(directory.name, "1-1.json"), "w") as file:
+            json.dump(other, file)
+
+        with override_settings(METRICS_DIR=directory.name):
+            text = self.client.get(reverse("metrics")).content.decode()
+
+        self.assertEqual(sample(text, "vetsoft_cache_requests_total", cache="otra", result="hit"), 3)
+        self.assertEqual(sample(text, "vetsoft_cache_hit_ratio", cache="otra"), 1)
+        self.assertEqual(sample(text, "vetsoft_request_duration_seconds_count", view="otra"), 1)
+
+    def test_clear_removes_previous_processes(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        for filename in ("1-1.json", "2-1.json.tmp", "notas.txt"):
+            with open(os.path.join(directory.name, filename), "w") as file:
+                file.write("{}")
+
+        self.assertEqual(clear_process_metrics(directory.name), 2)
+        self.assertEqual(os.listdir(directory.name), ["notas.txt"])
+
+    def test_finished_processes_are_merged_into_one_file(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        worker = {
+            "counters": [["vetsoft_cache_requests_total", [["cache", "otra"], ["result", "hit"]], 3]],
+            "histograms": [],
+        }
+        for filename in ("1-1.json", "1-2.json", "2-1.json"):
+            with open(os.path.join(directory.name, filename), "w") as file:
+                json.dump(worker, file)
+        with open(os.path.join(directory.name, "1-3.json.tmp"), "w") as file:
+            file.write("{")
+
+        self.assertEqual(retire_process_metrics(1, directory.name), 2)
+        self.assertEqual(retire_process_metrics(2, directory.name), 1)
+        self.assertEqual(retire_process_metrics(3, directory.name), 0)
+
+        self.assertEqual(os.listdir(directory.name), ["retired.json"])
+        with override_settings(METRICS_DIR=directory.name):
+            text = render(collect_all())
+        self.assertEqual(sample(text, "vetsoft_cache_requests_total", cache="otra", result="hit"), 9)
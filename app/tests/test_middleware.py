@@ -0,0 +1,84 @@
+import json
+
+from django.http import HttpResponse
+from django.shortcuts import reverse
+from django.test import RequestFactory, TestCase, override_settings
+
+from app.middleware import RequestTimingMiddleware
+from app.models import Client
+from app.tests.test_async_views import AsyncUrls
+
+
+def client_names(request):
+    """
+    Vista de prueba que hace una consulta por cliente (el patrón N+1).
+    """
+    ids = Client.objects.values_list("id", flat=True)
+    return HttpResponse(",".join(Client.objects.get(pk=pk).name for pk in ids))
+
+
+class RequestTimingTest(TestCase):
+    """
+    Clase de tests de integracion de la medicion de solicitudes.
+    """
+    def log_line(self, logs):
+        return json.loads(logs.records[-1].getMessage())
+
+    def test_response_has_server_timing(self):
+        response = self.client.get(reverse("clients_repo"))
+
+        timing = response["Server-Timing"]
+        self.assertRegex(timing, r'db;dur=[\d.]+;desc="\d+ consultas"')
+        self.assertRegex(timing, r"tpl;dur=[\d.]+")
+        self.assertRegex(timing, r"view;dur=[\d.]+")
+
+    def test_request_is_logged(self):
+        with self.assertLogs("vetsoft.requests", "INFO") as logs:
+            self.client.get(reverse("clients_repo"))
+
+        line = self.log_line(logs)
+        self.assertEqual((line["method"], line["path"], line["status"]), ("GET", "/clientes/", 200))
+        self.assertGreater(line["queries"], 0)
+        self.assertGreater(line["template_ms"], 0)
+        self.assertNotIn("flags", line)
+
+    @override_settings(REQUEST_QUERY_BUDGET=0, REQUEST_TIME_BUDGET_MS=0)
+    def test_budgets_are_flagged(self):
+        with self.assertLogs("vetsoft.requests", "WARNING") as logs:
+            self.client.get(reverse("clients_repo"))
+
+        self.assertEqual(self.log_line(logs)["flags"], ["query_budget", "time_budget"])
+
+    @override_settings(REQUEST_REPEATED_QUERY_LIMIT=3)
+    def test_repeated_queries_are_flagged(self):
+        Client.objects.bulk_create(
+            [Client(name=f"C{i}", phone="221", email=f"c{i}@vetsoft.com") for i in range(3)],
+        )
+        middleware = RequestTimingMiddleware(client_names)
+
+        with self.assertLogs("vetsoft.requests", "WARNING") as logs:
+            middleware(RequestFactory().get("/"))
+
+        line = self.log_line(logs)
+        self.assertEqual(line["flags"], ["repeated_queries"])
+        self.assertEqual(line["repeated_queries"][0]["count"], 3)
+
+    @override_settings(REQUEST_TIMING=False)
+    def test_can_be_disabled(self):
+        response = self.client.get(reverse("clients_repo"))
+
+        self.assertFalse(response.has_header("Server-Timing"))
+
+
+@override_settings(ROOT_URLCONF=AsyncUrls)
+class AsyncRequestTimingTest(TestCase):
+    """
+    Clase de tests de integracion de la medicion de solicitudes asíncronas.
+    """
+    async def test_queries_of_async_views_are_counted(self):
+        with self.assertLogs("vetsoft.requests", "INFO") as logs:
+            response = await self.async_client.get(reverse("clients_repo"))
+
+        line = json.loads(logs.records[-1].getMessage())
+        self.assertGreater(line["queries"], 0)
+        self.assertIn("Server-Timing", response)
@@ -0,0 +1,96 @@
+from django.db import connection
+from django.shortcuts import reverse
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from app.models import Client, Pet
+from app.pagination import encode_cursor
+
+
+class ClientsPaginationTest(TestCase):
+    """
+    Clase de tests de integracion de la paginacion por cursor del repositorio de clientes.
+    """
+    def setUp(self):
+        for name in ["Carla", "Ana", "Elena", "Beto", "Dario"]:
+            Client.objects.create(
+                name=name, phone="54221555232", email=f"{name}@vetsoft.com",
+            )
+
+    def get_names(self, response):
+        return [client.name for client in response.context["clients"]]
+
+    def test_first_page_is_limited_by_page_size(self):
+        response = self.client.get(reverse("clients_repo"), {"page_size": 2})
+
+        self.assertEqual(self.get_names(response), ["Carla", "Ana"])
+        self.assertTrue(response.context["page"].has_next)
+        self.assertFalse(response.context["page"].has_previous)
+
+    def test_can_walk_forward_and_backward(self):
+        url = reverse("clients_repo")
+        first = self.client.get(url, {"page_size": 2})
+        second = self.client.get(url + first.context["page"].next_url)
+        third = self.client.get(url + second.context["page"].next_url)
+
+        self.assertEqual(self.get_names(second), ["Elena", "Beto"])
+        self.assertEqual(self.get_names(third), ["Dario"])
+        self.assertFalse(third.context["page"].has_next)
+
+        back = self.client.get(url + third.context["page"].previous_url)
+        self.assertEqual(self.get_names(back), ["Elena", "Beto"])
+        self.assertTrue(back.context["page"].has_previous)
+
+    def test_sort_by_name_in_both_directions(self):
+        url = reverse("clients_repo")
+        first = self.client.get(url, {"page_size": 3, "sort": "name"})
+        second = self.client.get(url + first.context["page"].next_url)
+        descending = self.client.get(url, {"page_size": 2, "sort": "-name"})
+
+        self.assertEqual(self.get_names(first), ["Ana", "Beto", "Carla"])
+        self.assertEqual(self.get_names(second), ["Dario", "Elena"])
+        self.assertEqual(self.get_names(descending), ["Elena", "Dario"])
+
+    def test_unknown_sort_and_invalid_cursor_fall_back_to_first_page(self):
+        response = self.client.get(
+            reverse("clients_repo"), {"sort": "phone", "after": "no-es-un-cursor"},
+        )
+
+        self.assertEqual(
+            self.get_names(response), ["Carla", "Ana", "Elena", "Beto", "Dario"],
+        )
+
+    def test_tampered_cursor_falls_back_to_first_page(self):
+        url = reverse("clients_repo")
+
+        for cursor in (["x", "y"], [{"a": 1}, None], ["Ana", [1]]):
+            response = self.client.get(url, {"sort": "name", "after": encode_cursor(cursor)})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(self.get_names(response), ["Ana", "Beto", "Carla", "Dario", "Elena"])
+
+        Pet.objects.create(name="Firulais", breed="Labrador", birthday="2020-01-01")
+        response = self.client.get(
+            reverse("pets_repo"), {"sort": "birthday", "before": encode_cursor(["notadate", 1])},
+        )
+        self.assertContains(response, "Firulais")
+
+    def test_api_rejects_tampered_cursor(self):
+        response = self.client.get(
+            reverse("api_list", args=["clients"]), {"after": encode_cursor(["x", "y"])},
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_page_does_not_use_offset_or_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse("clients_repo"), {"page_size": 2})
+
+        sql = " ".join(query["sql"] for query in queries.captured_queries).upper()
+        self.assertNotIn("OFFSET", sql)
+        self.assertNotIn("COUNT(", sql)
+
+    def test_repository_shows_navigation_links(self):
+        response = self.client.get(reverse("clients_repo"), {"page_size": 2})
+
+        self.assertContains(response, "Siguiente")
+        self.assertContains(response, "Anterior")
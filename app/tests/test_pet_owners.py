@@ -0,0 +1,225 @@
+import importlib
+import io
+import os
+import tempfile
+from unittest import mock
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.shortcuts import reverse
+from django.test import TestCase, override_settings
+
+from app.importers import import_file
+from app.models import CacheVersion, Client, Pet, Vet
+from app.pet_links import backfill_links, read_links
+from app.tests.test_async_views import AsyncUrls
+
+PET_DATA = {"name": "Firulais", "breed": "Labrador", "birthday": "2020-01-01"}
+
+
+class PetOwnerTest(TestCase):
+    """
+    Clase de tests del dueño y el veterinario de las mascotas.
+    """
+    def setUp(self):
+        cache.clear()
+        self.owner = Client.objects.create(name="Juan Perez", phone="54221555232", email="juan@vetsoft.com")
+        self.vet = Vet.objects.create(name="Ana Gomez", email="ana@vetsoft.com", phone="54221555000")
+
+    def test_form_saves_owner_and_vet(self):
+        self.client.post(reverse("pets_form"), {**PET_DATA, "owner_id": self.owner.id, "vet_id": self.vet.id})
+
+        pet = Pet.objects.get()
+        self.assertEqual(pet.owner, self.owner)
+        self.assertEqual(pet.vet, self.vet)
+
+    def test_form_rejects_missing_owner(self):
+        response = self.client.post(reverse("pets_form"), {**PET_DATA, "owner_id": self.owner.id + 100})
+
+        self.assertContains(response, "No existe el cliente indicado")
+        self.assertFalse(Pet.objects.exists())
+
+    def test_update_links_and_unlinks(self):
+        pet = Pet.objects.create(**PET_DATA)
+
+        self.assertEqual(pet.update_pet({"owner_id": str(self.owner.id)}), (True, None))
+        pet.refresh_from_db()
+        self.assertEqual(pet.owner, self.owner)
+
+        saved, errors = pet.update_pet({"vet_id": "999"})
+        self.assertFalse(saved)
+        self.assertEqual(errors, {"vet_id": "No existe el veterinario indicado"})
+
+        pet.update_pet({"owner_id": ""})
+        pet.refresh_from_db()
+        self.assertIsNone(pet.owner)
+
+    def test_deleting_owner_keeps_pet(self):
+        pet = Pet.objects.create(**PET_DATA, owner=self.owner)
+
+        self.owner.delete()
+
+        pet.refresh_from_db()
+        self.assertIsNone(pet.owner_id)
+
+    def test_repositories_show_relations(self):
+        Pet.objects.create(**PET_DATA, owner=self.owner, vet=self.vet)
+        Pet.objects.create(name="Michi", breed="Siames", birthday="2021-01-01", owner=self.owner)
+
+        pets = self.client.get(reverse("pets_repo"))
+        clients = self.client.get(reverse("clients_repo"))
+
+        self.assertContains(pets, "<td>Juan Perez</td>", count=2, html=True)
+        self.assertContains(pets, "<td>Ana Gomez</td>", count=1, html=True)
+        self.assertContains(clients, "<td>Firulais, Michi</td>", html=True)
+
+    def test_repository_queries_do_not_depend_on_rows(self):
+        for number in range(20):
+            Pet.objects.create(**PET_DATA, owner=self.owner, vet=self.vet)
+            Client.objects.create(name="Otro", phone="54221555232", email=f"c{number}@vetsoft.com")
+
+        # Una consulta a la versión de la caché y una a las filas; los clientes
+        # cargan sus mascotas con una consulta más.
+        with self.assertNumQueries(2):
+            cache.clear()
+            self.client.get(reverse("pets_repo"))
+        with self.assertNumQueries(3):
+            cache.clear()
+            self.client.get(reverse("clients_repo"))
+        # El listado completo no usa la caché: una consulta por bloque de filas
+        # y una por las mascotas de ese bloque.
+        with self.assertNumQueries(2):
+            self.client.get(reverse("clients_repo"), {"stream": "1"}).getvalue()
+
+    def test_owner_change_invalidates_pets_repository(self):
+        Pet.objects.create(**PET_DATA, owner=self.owner)
+        self.client.get(reverse("pets_repo"))
+
+        self.owner.update_client(
+            {"name": "Juan Carlos Perez", "phone": "54221555232", "email": "juan@vetsoft.com"},
+        )
+
+        self.assertContains(self.client.get(reverse("pets_repo")), "Juan Carlos Perez")
+
+    def test_import_validates_links(self):
+        csv = (
+            "name,breed,birthday,owner_id,vet_id\n"
+            f"Firulais,Labrador,2020-01-01,{self.owner.id},{self.vet.id}\n"
+            "Michi,Siames,2021-01-01,,\n"
+            "Rex,Ovejero,2019-01-01,999,\n"
+        )
+
+        result = import_file("pets", io.BytesIO(csv.encode()), "csv")
+
+        self.assertEqual(result.created, 2)
+        self.assertEqual(result.errors, [(3, {"owner_id": "No existe el cliente indicado"})])
+        self.assertEqual(Pet.objects.get(name="Firulais").vet, self.vet)
+        self.assertIsNone(Pet.objects.get(name="Michi").owner)
+
+
+@override_settings(ROOT_URLCONF=AsyncUrls)
+class AsyncPetOwnerTest(TestCase):
+    """
+    Clase de tests del dueño de las mascotas con las vistas asíncronas.
+    """
+    async def test_edit_form_shows_owner(self):
+        owner = await Client.objects.acreate(name="Juan Perez", phone="54221555232", email="juan@vetsoft.com")
+        pet = await Pet.objects.acreate(**PET_DATA, owner=owner)
+
+        response = await self.async_client.get(reverse("pets_edit", args=[pet.id]))
+
+        self.assertContains(response, "Juan Perez")
+
+    async def test_repositories_show_relations(self):
+        owner = await Client.objects.acreate(name="Juan Perez", phone="54221555232", email="juan@vetsoft.com")
+        await Pet.objects.acreate(**PET_DATA, owner=owner)
+
+        pets = await self.async_client.get(reverse("pets_repo"))
+        clients = await self.async_client.get(reverse("clients_repo"), {"stream": "1"})
+
+        self.assertContains(pets, "Juan Perez")
+        self.assertIn("Firulais", b"".join([chunk async for chunk in clients.streaming_content]).decode())
+
+
+class PetLinksBackfillTest(TestCase):
+    """
+    Clase de tests de la carga por bloques de los vínculos de las mascotas.
+    """
+    def write_links(self, content):
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w") as file:
+            file.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_backfill_in_batches(self):
+        owner = Client.objects.create(name="Juan Perez", phone="54221555232", email="juan@vetsoft.com")
+        vet = Vet.objects.create(name="Ana Gomez", email="ana@vetsoft.com", phone="54221555000")
+        pets = [Pet.objects.create(**PET_DATA) for _ in range(5)]
+        pets[4].vet = vet
+        pets[4].save()
+        batches = []
+
+        updated = backfill_links(
+            [(pet.id, owner.id, None) for pet in pets] + [(pets[0].id, 999, vet.id)],
+            batch_size=2, on_batch=batches.append,
+        )
+
+        self.assertEqual(updated, 6)
+        self.assertEqual(batches, [2, 4, 6])
+        self.assertEqual(Pet.objects.filter(owner=owner).count(), 5)
+        # Un ID vacío o inexistente no cambia el vínculo actual.
+        self.assertEqual(Pet.objects.get(pk=pets[4].id).vet, vet)
+        self.assertEqual(Pet.objects.get(pk=pets[0].id).owner, owner)
+        self.assertEqual(Pet.objects.get(pk=pets[0].id).vet, vet)
+
+    def test_read_links_rejects_invalid_rows(self):
+        path = self.write_links("pet_id,owner_id,vet_id\n1,2,\nx,1,1\n")
+
+        with self.assertRaisesMessage(ValueError, "Fila 3"):
+            list(read_links(path))
+
+        with self.assertRaisesMessage(ValueError, "vet_id"):
+            list(read_links(self.write_links("pet_id,owner_id\n1,2\n")))
+
+    def test_command(self):
+        owner = Client.objects.create(name="Juan Perez", phone="54221555232", email="juan@vetsoft.com")
+        pet = Pet.objects.create(**PET_DATA)
+        self.client.get(reverse("pets_repo"))
+        out = io.StringIO()
+
+        call_command(
+            "backfill_pet_links", self.write_links(f"pet_id,owner_id,vet_id\n{pet.id},{owner.id},\n"),
+            stdout=out, stderr=io.StringIO(),
+        )
+
+        self.assertIn("Se vincularon 1 mascotas.", out.getvalue())
+        self.assertContains(self.client.get(reverse("pets_repo")), "Juan Perez")
+
+    def test_migration_backfills_from_the_project_file(self):
+        migration = importlib.import_module("app.migrations.0015_backfill_pet_links")
+        owner = Client.objects.create(name="Juan Perez", phone="54221555232", email="juan@vetsoft.com")
+        vet = Vet.objects.create(name="Ana Gomez", email="ana@vetsoft.com", phone="54221555000")
+        pets = [Pet.objects.create(**PET_DATA) for _ in range(3)]
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        schema_editor = mock.Mock(connection=connection)
+
+        with override_settings(BASE_DIR=directory.name):
+            # Sin archivo de vínculos no cambia nada.
+            migration.backfill_pet_links(apps, schema_editor)
+            self.assertFalse(Pet.objects.filter(owner__isnull=False).exists())
+
+            with open(os.path.join(directory.name, migration.LINKS_FILE), "w") as file:
+                file.write("pet_id,owner_id,vet_id\n")
+                file.writelines(f"{pet.id},{owner.id},\n" for pet in pets)
+                file.write(f"{pets[0].id},999,{vet.id}\n")
+            before = CacheVersion.get_tokens(Pet)
+            with mock.patch.object(migration, "BATCH_SIZE", 2):
+                migration.backfill_pet_links(apps, schema_editor)
+
+        self.assertEqual(Pet.objects.filter(owner=owner).count(), 3)
+        self.assertEqual(Pet.objects.get(pk=pets[0].id).vet, vet)
+        self.assertNotEqual(CacheVersion.get_tokens(Pet), before)
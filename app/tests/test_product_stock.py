@@ -32,3 +32,27 @@ class ProductStockTest(TestCase):
         product.save()
         product.refresh_from_db()
         self.assertEqual(product.stock, 0)
+
+    def test_increase_and_decrease_stock_are_atomic_updates(self):
+        product = Product.objects.create(name="Test Product", type="Type A", price=10.0, stock=2)
+
+        self.assertTrue(Product.increase_stock(product.id, 3))
+        self.assertTrue(Product.decrease_stock(product.id, 5))
+        self.assertFalse(Product.decrease_stock(product.id))
+        self.assertFalse(Product.increase_stock(product.id + 1))
+
+        product.refresh_from_db()
+        self.assertEqual(product.stock, 0)
+
+    def test_stale_instance_does_not_lose_updates(self):
+        Product.objects.create(name="Test Product", type="Type A", price=10.0, stock=0)
+        stale = Product.objects.get()
+
+        # Otra solicitud suma stock después de que se leyó `stale`; el
+        # incremento siguiente parte del valor de la base y no del de `stale`.
+        Product.increase_stock(stale.id)
+        Product.increase_stock(stale.id)
+
+        self.assertEqual(stale.stock, 0)
+        stale.refresh_from_db()
+        self.assertEqual(stale.stock, 2)
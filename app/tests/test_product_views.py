@@ -18,15 +18,67 @@ class ProductViewsTest(TestCase):
         # Enviar una solicitud POST para disminuir el stock
         response = self.client.post(url, {'product_id': product.id})
         
-        # Verifico que el stock se haya disminuido 
+        # Verifico que el stock se haya disminuido sin advertencias
         product.refresh_from_db()
         self.assertEqual(product.stock, 0)
-        
-        # Verifico que se haya generado el mensaje de producto sin stock
+        self.assertEqual(len(list(get_messages(response.wsgi_request))), 0)
+
+        # Al intentar disminuir sin stock, el stock no cambia y se avisa que no hay stock
+        response = self.client.post(url, {'product_id': product.id, 'product_name': product.name})
+        product.refresh_from_db()
+        self.assertEqual(product.stock, 0)
+
         messages = list(get_messages(response.wsgi_request))
         self.assertEqual(len(messages), 1)
         self.assertEqual(str(messages[0]), "Test Product: Fuera de stock.")
 
+    def test_decrease_stock_view_with_amount(self):
+        product = Product.objects.create(name="Test Product", type="Type A", price=10.0, stock=5)
+        url = reverse('decrease_stock')
+
+        self.client.post(url, {'product_id': product.id, 'amount': 3})
+        response = self.client.post(url, {'product_id': product.id, 'product_name': product.name, 'amount': 3})
+
+        # El segundo descuento no se aplica porque dejaría el stock negativo
+        product.refresh_from_db()
+        self.assertEqual(product.stock, 2)
+        messages = list(get_messages(response.wsgi_request))
+        self.assertEqual(str(messages[0]), "Test Product: Fuera de stock.")
+
+    def test_stock_views_with_invalid_amount_or_product(self):
+        product = Product.objects.create(name="Test Product", type="Type A", price=10.0, stock=5)
+
+        response = self.client.post(reverse('increase_stock'), {'product_id': product.id, 'amount': -2})
+        product.refresh_from_db()
+        self.assertEqual(product.stock, 5)
+        messages = list(get_messages(response.wsgi_request))
+        self.assertEqual(str(messages[0]), "La cantidad debe ser un número entero positivo.")
+
+        response = self.client.post(reverse('increase_stock'), {'product_id': 100})
+        self.assertEqual(response.status_code, 404)
+
+    def test_out_of_stock_does_not_read_the_product(self):
+        product = Product.objects.create(name="Test Product", type="Type A", price=10.0, stock=0)
+
+        # Sólo el UPDATE condicional: el nombre del aviso viene del formulario.
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                reverse('decrease_stock'), {'product_id': product.id, 'product_name': product.name},
+            )
+
+        self.assertEqual(str(list(get_messages(response.wsgi_request))[0]), "Test Product: Fuera de stock.")
+
+        # Un producto inexistente tampoco se lee: el descuento no se aplica y se avisa.
+        response = self.client.post(reverse('decrease_stock'), {'product_id': 100})
+        self.assertEqual(str(list(get_messages(response.wsgi_request))[-1]), "El producto: Fuera de stock.")
+
+    def test_repository_sends_product_name(self):
+        Product.objects.create(name="Collar", type="Gato", price=10.0, stock=0)
+
+        response = self.client.get(reverse('products_repo'))
+
+        self.assertContains(response, '<input type="hidden" name="product_name" value="Collar" />', html=True)
+
     def test_increase_stock_view(self):
         # Creo un producto inicial con stock 0
         product = Product.objects.create(name="Test Product", type="Type A", price=10.0, stock=0)
@@ -42,3 +94,11 @@ class ProductViewsTest(TestCase):
         # Verifico que no haya mensajes de advertencia
         messages = list(get_messages(response.wsgi_request))
         self.assertEqual(len(messages), 0)
+
+    def test_increase_stock_view_with_amount(self):
+        product = Product.objects.create(name="Test Product", type="Type A", price=10.0, stock=1)
+
+        self.client.post(reverse('increase_stock'), {'product_id': product.id, 'amount': 10})
+
+        product.refresh_from_db()
+        self.assertEqual(product.stock, 11)
@@ -0,0 +1,107 @@
+import json
+import os
+import runpy
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+GUNICORN_CONF = Path(settings.BASE_DIR) / "gunicorn.conf.py"
+
+SHOW_SETTINGS = (
+    "import django, json; django.setup(); from django.conf import settings as s; "
+    "print(json.dumps([s.DEBUG, s.ALLOWED_HOSTS, s.STORAGES['staticfiles']['BACKEND'], "
+    "s.DATABASES['default']['CONN_MAX_AGE']]))"
+)
+
+
+class ProductionSettingsTest(SimpleTestCase):
+    """
+    Clase de tests de la configuración de producción.
+    """
+    def run_settings(self, **env):
+        environ = {
+            key: value for key, value in os.environ.items()
+            if not key.startswith(("VETSOFT_", "DJANGO_", "DB_"))
+        }
+        environ.update(env, DJANGO_SETTINGS_MODULE="vetsoft.settings_production")
+        return subprocess.run(
+            [sys.executable, "-c", SHOW_SETTINGS],
+            cwd=settings.BASE_DIR, env=environ, capture_output=True, text=True,
+        )
+
+    def test_debug_is_off(self):
+        result = self.run_settings(
+            DJANGO_SECRET_KEY="clave", DJANGO_ALLOWED_HOSTS="vetsoft.local, 192.168.0.10",
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(
+            json.loads(result.stdout),
+            [False, ["vetsoft.local", "192.168.0.10"], "app.storage.PurgedManifestStaticFilesStorage", 600],
+        )
+
+    def test_secret_key_is_required(self):
+        result = self.run_settings()
+
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("DJANGO_SECRET_KEY", result.stderr)
+
+
+class GunicornConfigTest(SimpleTestCase):
+    """
+    Clase de tests de la configuración de gunicorn.
+    """
+    def load(self, **env):
+        with mock.patch.dict(os.environ, env):
+            for key in {"WEB_CONCURRENCY", "PORT", "VETSOFT_SERVER", "VETSOFT_METRICS_DIR"} - env.keys():
+                os.environ.pop(key, None)
+            config = runpy.run_path(str(GUNICORN_CONF))
+            config["environ"] = dict(os.environ)
+            return config
+
+    def test_workers_default_to_cpu_count(self):
+        with mock.patch("multiprocessing.cpu_count", return_value=4):
+            config = self.load()
+
+        self.assertEqual(config["workers"], 9)
+        self.assertTrue(config["preload_app"])
+        self.assertEqual((config["wsgi_app"], config["worker_class"]), ("vetsoft.wsgi:application", "sync"))
+        self.assertEqual(config["accesslog"], "-")
+
+    def test_environment_overrides(self):
+        config = self.load(WEB_CONCURRENCY="3", PORT="9000", VETSOFT_SERVER="asgi")
+
+        self.assertEqual(config["workers"], 3)
+        self.assertEqual(config["bind"], "0.0.0.0:9000")
+        self.assertEqual(config["worker_class"], "uvicorn.workers.UvicornWorker")
+
+    def test_metrics_dir_is_shared_and_cleared_at_start(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        with open(os.path.join(directory.name, "1-1.json"), "w") as file:
+            file.write("{}")
+
+        default = self.load(PORT="9000")["environ"]["VETSOFT_METRICS_DIR"]
+        config = self.load(VETSOFT_METRICS_DIR=directory.name)
+        with mock.patch.dict(os.environ, config["environ"]):
+            config["on_starting"](mock.Mock())
+
+        self.assertEqual(os.path.basename(default), "vetsoft-metrics-9000")
+        self.assertEqual(os.listdir(directory.name), [])
+
+    def test_child_exit_retires_the_worker_metrics(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        with open(os.path.join(directory.name, "42-1.json"), "w") as file:
+            file.write('{"counters": [["vetsoft_requests_total", [], 2]], "histograms": []}')
+
+        config = self.load(VETSOFT_METRICS_DIR=directory.name)
+        with mock.patch.dict(os.environ, config["environ"]):
+            config["child_exit"](mock.Mock(), mock.Mock(pid=42))
+
+        self.assertEqual(os.listdir(directory.name), ["retired.json"])
@@ -0,0 +1,95 @@
+import os
+import pstats
+import sys
+import tempfile
+
+from django.contrib.auth.models import User
+from django.shortcuts import reverse
+from django.test import TestCase, override_settings
+
+from app.models import Product
+from app.profiling import _CPROFILE_LOCK
+
+
+@override_settings(PROFILING=True, PROFILE_DIR="", PROFILE_SAMPLE_INTERVAL=0.0001)
+class ProfilerTest(TestCase):
+    """
+    Clase de tests de integracion del perfilado a pedido.
+    """
+    def setUp(self):
+        Product.objects.create(name="Collar", type="Gato", price=300, stock=1)
+        staff = User.objects.create(username="admin", is_staff=True)
+        self.client.force_login(staff)
+
+    def test_cprofile_report_is_returned(self):
+        response = self.client.get(reverse("products_repo"), {"_profile": "cprofile"})
+
+        self.assertEqual(response["Content-Type"], "text/plain; charset=utf-8")
+        self.assertContains(response, "products_repository")
+        self.assertContains(response, "cumulative")
+
+    def test_sampler_returns_collapsed_stacks(self):
+        # Una página larga, para que el hilo del perfilador llegue a tomar muestras.
+        Product.objects.bulk_create(
+            Product(name=f"Collar {n}", type="Perro", price=300, stock=1) for n in range(200)
+        )
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(0.00001)
+
+        response = self.client.get(
+            reverse("products_repo"), {"page_size": 200}, headers={"X-Vetsoft-Profile": "sample"},
+        )
+
+        lines = response.content.decode().splitlines()
+        self.assertTrue(lines)
+        stack, count = lines[0].rsplit(" ", 1)
+        self.assertIn(";", stack)
+        self.assertGreater(int(count), 0)
+
+    def test_concurrent_cprofile_is_rejected(self):
+        url = reverse("products_repo")
+
+        with _CPROFILE_LOCK:
+            busy = self.client.get(url, {"_profile": "cprofile"})
+            sampled = self.client.get(url, {"_profile": "sample"})
+
+        self.assertEqual(busy.status_code, 409)
+        self.assertEqual(sampled.status_code, 200)
+        self.assertContains(self.client.get(url, {"_profile": "cprofile"}), "cumulative")
+        self.assertContains(self.client.get(url, {"_profile": "cprofile"}), "cumulative")
+
+    def test_profiles_are_saved(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        with self.settings(PROFILE_DIR=directory.name):
+            response = self.client.get(reverse("products_repo"), {"_profile": "cprofile"})
+
+        path = os.path.join(directory.name, response["X-Profile-File"])
+        self.assertTrue(path.endswith("-products_repo-%d.prof" % os.getpid()))
+        self.assertTrue(pstats.Stats(path).total_calls > 0)
+
+    def test_only_staff_can_profile(self):
+        self.client.logout()
+
+        response = self.client.get(reverse("products_repo"), {"_profile": "cprofile"})
+
+        self.assertTemplateUsed(response, "products/repository.html")
+
+    def test_requests_without_flag_are_not_profiled(self):
+        response = self.client.get(reverse("products_repo"))
+
+        self.assertTemplateUsed(response, "products/repository.html")
+
+
+class ProfilerDisabledTest(TestCase):
+    """
+    Clase de tests de integracion del perfilado desactivado.
+    """
+    def test_middleware_is_not_installed(self):
+        staff = User.objects.create(username="admin", is_staff=True)
+        self.client.force_login(staff)
+
+        response = self.client.get(reverse("products_repo"), {"_profile": "cprofile"})
+
+        self.assertTemplateUsed(response, "products/repository.html")
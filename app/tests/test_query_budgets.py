@@ -0,0 +1,101 @@
+import difflib
+import json
+import os
+import re
+from pathlib import Path
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+
+from app.benchmarks.suite import Context, url_scenarios
+from app.importers import ENTITIES
+from app.seeding import seed_entity
+
+# Consultas SQL esperadas de cada vista, por nombre de URL. Para regenerarlo
+# después de un cambio intencional: VETSOFT_UPDATE_QUERY_BUDGETS=1.
+BUDGET_FILE = Path(__file__).with_name("query_budgets.json")
+
+# Filas por modelo con que se mide cada vista: la cantidad de consultas no
+# debe depender de la cantidad de datos (más que una página incluida).
+SIZES = (1, 30, 120)
+
+# Listas de parámetros de largo variable, como en app/slow_queries.py,
+# incluidas las de un solo elemento (un IN de la carga de relaciones).
+PLACEHOLDERS_RE = re.compile(r"\((?:%s\s*,\s*)*%s\)")
+
+# Nombres de savepoint, que cambian en cada transacción.
+SAVEPOINT_RE = re.compile(r'"s\d+_x\d+"')
+
+
+class QueryRecorder:
+    """
+    Clase que registra el SQL de las consultas ejecutadas, sin parámetros.
+    """
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, execute, sql, params, many, context):
+        statement = PLACEHOLDERS_RE.sub("(%s, ...)", sql)
+        self.statements.append(SAVEPOINT_RE.sub('"<savepoint>"', statement))
+        return execute(sql, params, many, context)
+
+
+def query_diff(expected, measured):
+    """
+    Diferencia legible entre dos listas de consultas.
+    """
+    return "\n".join(difflib.unified_diff(expected, measured, "esperado", "medido", lineterm=""))
+
+
+class QueryBudgetTest(TestCase):
+    """
+    Clase de tests que fija las consultas SQL de cada vista, para que un N+1,
+    una consulta de más a la sesión o una relectura innecesaria fallen.
+    """
+    def setUp(self):
+        cache.clear()
+
+    def record(self, scenario):
+        operation, prepare = scenario if isinstance(scenario, tuple) else (scenario, None)
+        args = prepare() if prepare is not None else ()
+        # Siempre con la caché vacía, para medir la construcción de la página.
+        cache.clear()
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            operation(*args)
+        return recorder.statements
+
+    def test_query_budgets(self):
+        budgets = json.loads(BUDGET_FILE.read_text()) if BUDGET_FILE.exists() else {}
+        measured = {}
+
+        seeded = 0
+        for size in SIZES:
+            for entity in ENTITIES:
+                seed_entity(entity, size - seeded, seed=seeded)
+            seeded = size
+
+            for name, scenario in url_scenarios(Context()).items():
+                statements = self.record(scenario)
+                measured.setdefault(name, statements)
+                if statements != measured[name]:
+                    with self.subTest(view=name, size=size):
+                        self.fail(
+                            f"{name}: las consultas cambian con {size} filas por modelo\n"
+                            f"{query_diff(measured[name], statements)}",
+                        )
+
+        if os.environ.get("VETSOFT_UPDATE_QUERY_BUDGETS") == "1":
+            BUDGET_FILE.write_text(json.dumps(measured, indent=2, ensure_ascii=False) + "\n")
+            return
+
+        self.assertEqual(set(budgets), set(measured))
+        for name, statements in measured.items():
+            with self.subTest(view=name):
+                expected = budgets.get(name, [])
+                if statements != expected:
+                    self.fail(
+                        f"{name}: {len(statements)} consultas (presupuesto: {len(expected)})\n"
+                        f"{query_diff(expected, statements)}",
+                    )
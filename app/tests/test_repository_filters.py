@@ -0,0 +1,109 @@
+import datetime
+
+from django.db import connection
+from django.shortcuts import reverse
+from django.test import TestCase
+
+from app.models import Client, Pet, Product
+
+
+class RepositoryFiltersTest(TestCase):
+    """
+    Clase de tests de integracion del orden y los filtros de los repositorios.
+    """
+    def setUp(self):
+        for name, phone in [("Carla", "221"), ("Ana", "221"), ("Beto", "11")]:
+            Client.objects.create(
+                name=name, phone=phone, email=f"{name.lower()}@vetsoft.com",
+            )
+
+    def get_names(self, response, entity="clients"):
+        return [row.name for row in response.context[entity]]
+
+    def test_filter_by_allowed_column(self):
+        response = self.client.get(reverse("clients_repo"), {"filter": "phone:221"})
+
+        self.assertEqual(self.get_names(response), ["Carla", "Ana"])
+        self.assertEqual(response.context["active_filters"], [("Teléfono", "221")])
+
+    def test_filters_are_combined(self):
+        response = self.client.get(
+            reverse("clients_repo"), {"filter": ["phone:221", "email:ana@vetsoft.com"]},
+        )
+
+        self.assertEqual(self.get_names(response), ["Ana"])
+
+    def test_form_fields_are_a_filter(self):
+        response = self.client.get(
+            reverse("clients_repo"), {"filter_field": "phone", "filter_value": "11"},
+        )
+
+        self.assertEqual(self.get_names(response), ["Beto"])
+        self.assertEqual(response.context["filter_params"], ["phone:11"])
+
+    def test_columns_outside_the_whitelist_are_ignored(self):
+        response = self.client.get(reverse("clients_repo"), {"filter": "address:x"})
+
+        self.assertEqual(self.get_names(response), ["Carla", "Ana", "Beto"])
+        self.assertEqual(response.context["active_filters"], [])
+
+    def test_sort_by_indexed_column(self):
+        response = self.client.get(reverse("clients_repo"), {"sort": "-email"})
+
+        self.assertEqual(self.get_names(response), ["Carla", "Beto", "Ana"])
+        self.assertContains(response, 'href="?sort=email"')
+
+    def test_navigation_links_keep_filters(self):
+        url = reverse("clients_repo")
+        first = self.client.get(url, {"filter": "phone:221", "sort": "name", "page_size": 1})
+        second = self.client.get(url + first.context["page"].next_url)
+
+        self.assertIn("filter=phone%3A221", first.context["page"].next_url)
+        self.assertEqual(self.get_names(first), ["Ana"])
+        self.assertEqual(self.get_names(second), ["Carla"])
+        self.assertFalse(second.context["page"].has_next)
+
+    def test_invalid_values_are_ignored(self):
+        Pet.objects.create(name="Cachito", breed="Caniche", birthday=datetime.date(2020, 5, 1))
+
+        response = self.client.get(reverse("pets_repo"), {"filter": "birthday:ayer"})
+        self.assertEqual(self.get_names(response, "pets"), ["Cachito"])
+
+        response = self.client.get(reverse("pets_repo"), {"filter": "birthday:2021-01-01"})
+        self.assertEqual(self.get_names(response, "pets"), [])
+
+    def test_stream_applies_filters(self):
+        Product.objects.create(name="Collar", type="Perro", price=100, stock=1)
+        Product.objects.create(name="Rascador", type="Gato", price=200, stock=1)
+
+        response = self.client.get(reverse("products_repo"), {"stream": "1", "filter": "type:Gato"})
+        content = b"".join(response.streaming_content).decode()
+
+        self.assertIn("Rascador", content)
+        self.assertNotIn("Collar", content)
+
+
+class RepositoryIndexesTest(TestCase):
+    """
+    Clase de tests de unidad de los indices usados por el orden y los filtros.
+    """
+    def query_plan(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return " ".join(row[-1] for row in cursor.fetchall())
+
+    def test_filters_use_an_index(self):
+        self.assertIn("client_email_idx", self.query_plan(Client.objects.filter(email="a@b.com")))
+        self.assertIn("client_phone_idx", self.query_plan(Client.objects.filter(phone="221")))
+        self.assertIn("pet_birthday_idx", self.query_plan(Pet.objects.filter(birthday="2020-01-01")))
+
+    def test_filter_and_sort_by_name_use_a_composite_index(self):
+        plan = self.query_plan(Product.objects.filter(type="Gato").order_by("name", "pk")[:20])
+
+        self.assertIn("product_type_name_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+        plan = self.query_plan(Pet.objects.filter(breed="Caniche").order_by("name", "pk")[:20])
+        self.assertIn("pet_breed_name_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
@@ -0,0 +1,111 @@
+from django.shortcuts import reverse
+from django.test import TestCase
+
+from app.models import Client, Pet
+from app.pagination import encode_cursor
+from app.search import build_match_query
+
+
+class SearchQueryTest(TestCase):
+    """
+    Clase de tests de unidad de la construccion de consultas de texto completo.
+    """
+    def test_words_are_quoted_prefixes(self):
+        self.assertEqual(build_match_query("juan  ver"), '"juan"* "ver"*')
+
+    def test_special_characters_are_ignored(self):
+        self.assertEqual(build_match_query('"OR (* -'), '"OR"*')
+        self.assertEqual(build_match_query("  "), "")
+
+
+class ClientsSearchTest(TestCase):
+    """
+    Clase de tests de integracion de la busqueda de clientes.
+    """
+    def setUp(self):
+        self.veron = Client.objects.create(
+            name="Juan Sebastián Veron", phone="54221555232",
+            email="brujita75@vetsoft.com", address="13 y 44",
+        )
+        self.carrillo = Client.objects.create(
+            name="Guido Carrillo", phone="54221232555",
+            email="goleador@vetsoft.com", address="1 y 57",
+        )
+
+    def get_names(self, response):
+        return [client.name for client in response.context["clients"]]
+
+    def test_search_by_partial_name_without_accents(self):
+        response = self.client.get(reverse("clients_search"), {"q": "sebas"})
+
+        self.assertTemplateUsed(response, "clients/repository.html")
+        self.assertEqual(self.get_names(response), ["Juan Sebastián Veron"])
+
+    def test_search_by_phone_and_email_prefix(self):
+        by_phone = self.client.get(reverse("clients_search"), {"q": "54221232"})
+        by_email = self.client.get(reverse("clients_search"), {"q": "brujita"})
+
+        self.assertEqual(self.get_names(by_phone), ["Guido Carrillo"])
+        self.assertEqual(self.get_names(by_email), ["Juan Sebastián Veron"])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.carrillo.update_client({
+            "name": "Guido Milan",
+            "phone": "54221232555",
+            "email": "goleador@vetsoft.com",
+        })
+        self.veron.delete()
+
+        old_name = self.client.get(reverse("clients_search"), {"q": "carrillo"})
+        new_name = self.client.get(reverse("clients_search"), {"q": "milan"})
+        deleted = self.client.get(reverse("clients_search"), {"q": "veron"})
+
+        self.assertEqual(self.get_names(old_name), [])
+        self.assertEqual(self.get_names(new_name), ["Guido Milan"])
+        self.assertEqual(self.get_names(deleted), [])
+
+    def test_results_are_paginated(self):
+        for i in range(3):
+            Client.objects.create(
+                name="Juan Perez", phone="54221000000", email=f"juan{i}@vetsoft.com",
+            )
+        url = reverse("clients_search")
+
+        first = self.client.get(url, {"q": "juan", "page_size": 3})
+        second = self.client.get(url + first.context["page"].next_url)
+
+        self.assertEqual(len(first.context["clients"]), 3)
+        self.assertEqual(len(second.context["clients"]), 1)
+        ids = {c.id for c in first.context["clients"]} | {c.id for c in second.context["clients"]}
+        self.assertEqual(len(ids), 4)
+
+        back = self.client.get(url + second.context["page"].previous_url)
+        self.assertEqual(
+            [c.id for c in back.context["clients"]],
+            [c.id for c in first.context["clients"]],
+        )
+
+    def test_tampered_cursor_falls_back_to_first_page(self):
+        url = reverse("clients_search")
+
+        for cursor in ([{"a": 1}, 1], [0, "x"], [None, None]):
+            response = self.client.get(url, {"q": "veron", "after": encode_cursor(cursor)})
+            self.assertEqual(self.get_names(response), ["Juan Sebastián Veron"])
+
+    def test_empty_search_redirects_to_repository(self):
+        response = self.client.get(reverse("clients_search"), {"q": " "})
+
+        self.assertRedirects(response, reverse("clients_repo"))
+
+
+class PetsSearchTest(TestCase):
+    """
+    Clase de tests de integracion de la busqueda de mascotas.
+    """
+    def test_search_by_breed(self):
+        Pet.save_pet({"name": "Firulais", "breed": "Labrador", "birthday": "2020-01-01"})
+        Pet.save_pet({"name": "Michi", "breed": "Siames", "birthday": "2021-01-01"})
+
+        response = self.client.get(reverse("pets_search"), {"q": "labra"})
+
+        self.assertEqual([pet.name for pet in response.context["pets"]], ["Firulais"])
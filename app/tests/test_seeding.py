@@ -0,0 +1,74 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.shortcuts import reverse
+from django.test import SimpleTestCase, TestCase
+
+from app.importers import ENTITIES
+from app.models import Client, Pet
+from app.seeding import generate_rows, parse_size, seed_entity
+
+
+class ParseSizeTest(SimpleTestCase):
+    """
+    Clase de tests de unidad de los tamaños de datos.
+    """
+    def test_parse_size(self):
+        self.assertEqual(parse_size("100k"), 100_000)
+        self.assertEqual(parse_size("1M"), 1_000_000)
+        self.assertEqual(parse_size("250"), 250)
+
+
+class SeedingTest(TestCase):
+    """
+    Clase de tests de los datos generados.
+    """
+    def indexes(self, model):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = %s AND sql IS NOT NULL",
+                [model._meta.db_table],
+            )
+            return {name for (name,) in cursor.fetchall()}
+
+    def test_rows_are_deterministic_and_valid(self):
+        for entity, (_, schema, columns, _) in ENTITIES.items():
+            rows = list(generate_rows(entity, 50, seed=3))
+            self.assertEqual(rows, list(generate_rows(entity, 50, seed=3)))
+            self.assertNotEqual(rows, list(generate_rows(entity, 50, seed=4)))
+            for row in rows:
+                data = {column: str(value) for column, value in zip(columns, row)}
+                self.assertEqual(schema.validate(data), {}, (entity, data))
+
+    def test_seed_entity_keeps_indexes(self):
+        indexes = self.indexes(Pet)
+
+        self.assertEqual(seed_entity("pets", 25, chunk_size=10), 25)
+
+        self.assertEqual(Pet.objects.count(), 25)
+        self.assertEqual(self.indexes(Pet), indexes)
+
+    def test_seeded_clients_are_searchable(self):
+        seed_entity("clients", 30, chunk_size=10)
+        client = Client.objects.order_by("pk").last()
+
+        response = self.client.get(reverse("clients_search"), {"q": client.email.split("@")[0]})
+
+        self.assertContains(response, client.email)
+
+    def test_seed_command(self):
+        out = StringIO()
+
+        call_command("seed", "clients", "vets", count="40", seed=2, stdout=out)
+
+        self.assertEqual(Client.objects.count(), 40)
+        self.assertEqual(ENTITIES["vets"][0].objects.count(), 40)
+        self.assertEqual(Pet.objects.count(), 0)
+        self.assertIn("Se generaron 40 filas de clients", out.getvalue())
+
+    def test_seed_command_rejects_unknown_entities(self):
+        with self.assertRaisesMessage(CommandError, "Entidades desconocidas: owners"):
+            call_command("seed", "clients", "owners", count="5", stdout=StringIO())
+
+        self.assertFalse(Client.objects.exists())
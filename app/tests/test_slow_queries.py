@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.shortcuts import reverse
+from django.test import SimpleTestCase, TestCase
+
+from app import slow_queries
+from app.models import Client
+from app.slow_queries import aggregate, plan_warnings, redact, statement_shape
+
+
+class SlowQueryHelpersTest(SimpleTestCase):
+    """
+    Clase de tests de unidad de las funciones del log de consultas lentas.
+    """
+    def test_parameters_are_redacted(self):
+        self.assertEqual(
+            redact(["ana@vetsoft.com", 3, 1.5, None, True]),
+            ["<str:15>", "<int>", "<float>", None, True],
+        )
+
+    def test_shape_ignores_the_length_of_parameter_lists(self):
+        self.assertEqual(
+            statement_shape("SELECT * FROM t WHERE id IN (%s, %s)"),
+            statement_shape("SELECT * FROM t WHERE id IN (%s, %s, %s, %s)"),
+        )
+        self.assertNotEqual(
+            statement_shape("SELECT * FROM t WHERE id = %s"),
+            statement_shape("SELECT * FROM u WHERE id = %s"),
+        )
+
+    def test_plan_warnings(self):
+        plan = ["SCAN app_client", "SCAN app_pet USING INDEX pet_name_idx", "USE TEMP B-TREE FOR ORDER BY"]
+
+        self.assertEqual(
+            plan_warnings(plan),
+            ["recorrido completo: SCAN app_client", "ordenamiento sin índice: USE TEMP B-TREE FOR ORDER BY"],
+        )
+
+    def test_entries_are_aggregated_by_shape(self):
+        lines = [
+            json.dumps({"shape": "a", "sql": "SELECT 1", "ms": 300, "view": "clients_repo", "plan": ["SCAN t"]}),
+            json.dumps({"shape": "a", "sql": "SELECT 1", "ms": 500, "view": "clients_repo"}),
+            json.dumps({"shape": "b", "sql": "SELECT 2", "ms": 250, "view": None, "path": None}),
+            "no es json",
+        ]
+
+        shapes = {shape["shape"]: shape for shape in aggregate(lines)}
+
+        self.assertEqual((shapes["a"]["count"], shapes["a"]["total_ms"], shapes["a"]["max_ms"]), (2, 800, 500))
+        self.assertEqual(shapes["a"]["plan"], ["SCAN t"])
+        self.assertEqual(shapes["b"]["views"], {"-": 1})
+
+
+class SlowQueryLogTest(TestCase):
+    """
+    Clase de tests de integracion del log de consultas lentas.
+    """
+    def setUp(self):
+        slow_queries._explained.clear()
+
+    def log_all_queries(self):
+        # Sólo dentro del bloque, para no escribir el resto en SLOW_QUERY_LOG.
+        return self.settings(SLOW_QUERY_MS=0)
+
+    def entries(self, logs):
+        return [json.loads(record.getMessage()) for record in logs.records]
+
+    def test_slow_queries_are_logged_with_view_and_plan(self):
+        Client.objects.create(name="Ana", phone="221", email="ana@vetsoft.com")
+
+        with self.log_all_queries(), self.assertLogs("vetsoft.slow_queries") as logs:
+            self.client.get(reverse("clients_repo"), {"filter": "email:ana@vetsoft.com"})
+
+        entry = next(
+            entry for entry in self.entries(logs)
+            if entry["sql"].startswith('SELECT "app_client"')
+        )
+        self.assertEqual((entry["view"], entry["path"]), ("clients_repo", "/clientes/"))
+        self.assertIn("<str:15>", entry["params"])
+        self.assertNotIn("ana@vetsoft.com", json.dumps(entry))
+        self.assertTrue(any("client_email_idx" in line for line in entry["plan"]))
+
+    def test_plan_is_captured_once_per_shape(self):
+        with self.log_all_queries(), self.assertLogs("vetsoft.slow_queries") as logs:
+            Client.objects.filter(phone="1").count()
+            Client.objects.filter(phone="2").count()
+
+        first, second = self.entries(logs)
+        self.assertEqual(first["shape"], second["shape"])
+        self.assertIn("plan", first)
+        self.assertNotIn("plan", second)
+        self.assertIsNone(first["view"])
+
+    def test_report_command(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "slow.log")
+        with open(f"{path}.1", "w") as file:
+            file.write(json.dumps({
+                "shape": "a", "sql": "SELECT * FROM app_client", "ms": 900, "view": "clients_repo",
+                "plan": ["SCAN app_client"],
+            }) + "\n")
+        with open(path, "w") as file:
+            file.write(json.dumps({"shape": "b", "sql": "SELECT 1", "ms": 300, "view": "home"}) + "\n")
+
+        out = StringIO()
+        call_command("slow_queries_report", file=path, top=1, stdout=out)
+
+        report = out.getvalue()
+        self.assertIn("1. [a] 1 veces, total 900.0 ms", report)
+        self.assertIn("origen: clients_repo (1)", report)
+        self.assertIn("recorrido completo: SCAN app_client", report)
+        self.assertNotIn("[b]", report)
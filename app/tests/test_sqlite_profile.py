@@ -0,0 +1,57 @@
+import os
+import tempfile
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase, override_settings
+
+PRODUCTION_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": "1048576",
+    "cache_size": "-2000",
+    "temp_store": "MEMORY",
+    "busy_timeout": "1234",
+}
+
+
+class SqliteProfileTest(SimpleTestCase):
+    """
+    Clase de tests de unidad de la configuracion de las conexiones de SQLite.
+    """
+    def open_connection(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        wrapper = DatabaseWrapper(
+            {**connection.settings_dict, "NAME": os.path.join(directory.name, "db.sqlite3")},
+        )
+        self.addCleanup(wrapper.close)
+        wrapper.ensure_connection()
+        return wrapper
+
+    def pragma(self, wrapper, name):
+        with wrapper.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    @override_settings(SQLITE_PRAGMAS=PRODUCTION_PRAGMAS)
+    def test_pragmas_are_applied_to_new_connections(self):
+        wrapper = self.open_connection()
+
+        self.assertEqual(self.pragma(wrapper, "journal_mode"), "wal")
+        self.assertEqual(self.pragma(wrapper, "synchronous"), 1)
+        self.assertEqual(self.pragma(wrapper, "cache_size"), -2000)
+        self.assertEqual(self.pragma(wrapper, "temp_store"), 2)
+        self.assertEqual(self.pragma(wrapper, "busy_timeout"), 1234)
+
+    @override_settings(SQLITE_PRAGMAS={})
+    def test_default_profile_keeps_sqlite_defaults(self):
+        wrapper = self.open_connection()
+
+        self.assertEqual(self.pragma(wrapper, "journal_mode"), "delete")
+
+    @override_settings(SQLITE_PRAGMAS={"journal_mode": "WAL; DROP TABLE app_client"})
+    def test_invalid_values_are_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            self.open_connection()
@@ -0,0 +1,93 @@
+import tempfile
+from pathlib import Path
+
+from django.core.management import call_command
+from django.shortcuts import reverse
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from app.purgecss import purge_css, used_tokens
+
+CSS = (
+    '@charset "UTF-8";/*! Licencia MIT */'
+    ":root{--bs-blue:#0d6efd}"
+    ".btn{padding:1px}.carousel{display:block}"
+    ".btn:hover,.carousel-item.active{color:red}"
+    "@media (min-width:992px){.navbar-expand-lg{display:flex}.offcanvas{display:none}}"
+    "@font-face{font-family:icons;src:url(\"fonts/icons.woff2?v=1\")}"
+    "@keyframes spin{to{transform:rotate(360deg)}}"
+    ".alert-success{color:green}"
+)
+
+
+class PurgeCssTest(SimpleTestCase):
+    """
+    Clase de tests de unidad de la reducción de los CSS.
+    """
+    def test_unused_rules_are_removed(self):
+        purged = purge_css(CSS, {"btn", "navbar-expand-lg"}, ("alert-*",))
+
+        self.assertEqual(
+            purged,
+            '@charset "UTF-8";/*! Licencia MIT */'
+            ":root{--bs-blue:#0d6efd}"
+            ".btn{padding:1px}"
+            ".btn:hover{color:red}"
+            "@media (min-width:992px){.navbar-expand-lg{display:flex}}"
+            "@font-face{font-family:icons;src:url(\"fonts/icons.woff2?v=1\")}"
+            "@keyframes spin{to{transform:rotate(360deg)}}"
+            ".alert-success{color:green}",
+        )
+
+    def test_nothing_is_removed_when_every_class_is_used(self):
+        used = {"btn", "carousel", "carousel-item", "active", "navbar-expand-lg", "offcanvas", "alert-success"}
+
+        self.assertEqual(purge_css(CSS, used), CSS)
+
+    def test_used_tokens(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        Path(directory.name, "page.html").write_text('<i class="bi bi-people {{ icon }}"></i>')
+
+        tokens = used_tokens(["*.html"], directory.name)
+
+        self.assertLessEqual({"bi", "bi-people", "icon"}, tokens)
+
+
+class StaticAssetsTest(TestCase):
+    """
+    Clase de tests de los archivos estáticos propios.
+    """
+    def test_pages_do_not_use_a_cdn(self):
+        response = self.client.get(reverse("home"))
+
+        self.assertContains(response, "/static/vendor/bootstrap/css/bootstrap.min.css")
+        self.assertContains(response, "/static/vendor/bootstrap/js/bootstrap.min.js")
+        self.assertNotContains(response, "https://")
+
+    def test_collectstatic_purges_hashes_and_compresses(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        static = Path(__file__).parents[1] / "static"
+        storages = {
+            "staticfiles": {"BACKEND": "app.storage.PurgedManifestStaticFilesStorage"},
+        }
+
+        # Sólo los archivos de app/static, sin los del admin.
+        with override_settings(
+            STATIC_ROOT=directory.name, STORAGES=storages, STATICFILES_DIRS=[static],
+            STATICFILES_FINDERS=["django.contrib.staticfiles.finders.FileSystemFinder"],
+        ):
+            call_command("collectstatic", interactive=False, verbosity=0)
+
+        root = Path(directory.name)
+        source = static / "vendor/bootstrap/css/bootstrap.min.css"
+        (hashed,) = root.glob("vendor/bootstrap/css/bootstrap.min.*.css")
+        self.assertLess(hashed.stat().st_size, source.stat().st_size / 2)
+        self.assertIn(".navbar-expand-lg", hashed.read_text())
+        self.assertNotIn(".carousel-item", hashed.read_text())
+        self.assertTrue(hashed.with_name(f"{hashed.name}.gz").exists())
+        self.assertTrue(hashed.with_name(f"{hashed.name}.br").exists())
+
+        (icons,) = root.glob("vendor/bootstrap-icons/bootstrap-icons.min.*.css")
+        self.assertIn(".bi-people::before", icons.read_text())
+        self.assertRegex(icons.read_text(), r"fonts/bootstrap-icons\.\w+\.woff2")
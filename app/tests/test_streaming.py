@@ -0,0 +1,41 @@
+from django.http import StreamingHttpResponse
+from django.shortcuts import reverse
+from django.test import TestCase, override_settings
+
+from app.models import Product
+
+
+class ProductsStreamingTest(TestCase):
+    """
+    Clase de tests de integracion del modo streaming del repositorio de productos.
+    """
+    def get_content(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    @override_settings(STREAMING_CHUNK_SIZE=2)
+    def test_stream_sends_every_row_in_order(self):
+        for i in range(5):
+            Product.objects.create(name=f"Producto {i}", type="Alimento", price=10, stock=i)
+
+        response = self.client.get(reverse("products_repo"), {"stream": "1"})
+        self.assertIsInstance(response, StreamingHttpResponse)
+
+        content = self.get_content(response)
+        positions = [content.index(f"Producto {i}") for i in range(5)]
+        self.assertEqual(positions, sorted(positions))
+        self.assertIn("</html>", content)
+        self.assertNotIn("No hay productos cargados", content)
+        self.assertNotIn("Siguiente", content)
+
+    def test_stream_of_empty_table_shows_empty_message(self):
+        response = self.client.get(reverse("products_repo"), {"stream": "1"})
+
+        self.assertIn("No hay productos cargados", self.get_content(response))
+
+    def test_stream_rows_include_csrf_token(self):
+        Product.objects.create(name="Producto", type="Alimento", price=10, stock=1)
+
+        response = self.client.get(reverse("products_repo"), {"stream": "1"})
+
+        self.assertIn("csrfmiddlewaretoken", self.get_content(response))
+        self.assertIn("csrftoken", response.cookies)
@@ -0,0 +1,111 @@
+from datetime import date, timedelta
+
+from django.test import SimpleTestCase
+
+from app.benchmarks import legacy_validators
+from app.models import (
+    validate_client,
+    validate_medicines,
+    validate_pet,
+    validate_products,
+    validate_vet,
+)
+from app.validation import (
+    PET_SCHEMA,
+    PRODUCT_SCHEMA,
+    Schema,
+    between,
+    integer,
+    required,
+)
+
+TOMORROW = (date.today() + timedelta(days=1)).isoformat()
+
+
+class ValidationParityTest(SimpleTestCase):
+    """
+    Clase de tests de unidad que comparan los esquemas compilados con las
+    validaciones anteriores.
+    """
+    CASES = {
+        "client": (validate_client, legacy_validators.validate_client, [
+            {},
+            {"name": "Juan Sebastián Veron", "phone": "54221555232", "email": "juan@vetsoft.com"},
+            {"name": "Juan 3", "phone": "221555232", "email": "juan@gmail.com"},
+            {"name": "Juan\n", "phone": "54a", "email": "vetsoft.com"},
+            {"name": "", "phone": "", "email": "@vetsoft.com"},
+        ]),
+        "pet": (validate_pet, legacy_validators.validate_pet, [
+            {},
+            {"name": "Firulais", "breed": "Labrador", "birthday": "2020-01-01"},
+            {"name": "Firulais", "breed": "", "birthday": "2020-1-5"},
+            {"name": "", "breed": "Labrador", "birthday": TOMORROW},
+        ]),
+        "medicine": (validate_medicines, legacy_validators.validate_medicines, [
+            {},
+            {"name": "Paracetamol", "description": "Analgésico", "dose": "5"},
+            {"name": "", "description": "", "dose": ""},
+            {"name": "A", "description": "B", "dose": "0"},
+            {"name": "A", "description": "B", "dose": " 10 "},
+            {"name": "A", "description": "B", "dose": "11"},
+            {"name": "A", "description": "B", "dose": "5.5"},
+        ]),
+        "product": (validate_products, legacy_validators.validate_products, [
+            {},
+            {"name": "Collar", "type": "Gato", "price": "300", "stock": "0"},
+            {"name": "", "type": "", "price": "", "stock": ""},
+            {"name": "A", "type": "B", "price": "-0.5", "stock": "-1"},
+            {"name": "A", "type": "B", "price": "1e3", "stock": "1.5"},
+            {"name": "A", "type": "B", "price": "abc", "stock": "3"},
+        ]),
+        "vet": (validate_vet, legacy_validators.validate_vet, [
+            {},
+            {"name": "Ana", "email": "ana@vetsoft.com", "phone": "54221555000"},
+            {"name": "", "email": "sin-arroba", "phone": ""},
+        ]),
+    }
+
+    def test_same_errors_as_previous_validations(self):
+        for entity, (validate, legacy, rows) in self.CASES.items():
+            for row in rows:
+                with self.subTest(entity=entity, row=row):
+                    self.assertEqual(validate(row), legacy(row))
+
+
+class SchemaTest(SimpleTestCase):
+    """
+    Clase de tests de unidad de los esquemas de validación.
+    """
+    def test_validate_many_returns_errors_per_row(self):
+        rows = [
+            {"name": "Collar", "type": "Gato", "price": "300", "stock": "0"},
+            {"name": "Collar", "type": "Gato", "price": "-1", "stock": "0"},
+        ]
+
+        self.assertEqual(
+            PRODUCT_SCHEMA.validate_many(rows),
+            [{}, {"price": "El precio no puede ser negativo"}],
+        )
+
+    def test_invalid_date_is_an_error(self):
+        errors = PET_SCHEMA.validate({"name": "Firulais", "breed": "Labrador", "birthday": "2020-02-30"})
+
+        self.assertEqual(errors, {"birthday": "Por favor ingrese una fecha válida"})
+
+    def test_rules_after_conversion_use_the_converted_value(self):
+        schema = Schema(
+            age=[required("Falta"), integer("Entero"), between(None, 20, "Muy grande")],
+        )
+
+        self.assertEqual(schema.validate({}), {"age": "Falta"})
+        self.assertEqual(schema.validate({"age": "x"}), {"age": "Entero"})
+        self.assertEqual(schema.validate({"age": "21"}), {"age": "Muy grande"})
+        self.assertEqual(schema.validate({"age": "-5"}), {})
+
+    def test_price_must_be_finite(self):
+        for price in ("nan", "inf", "-inf", "1e999"):
+            with self.subTest(price=price):
+                self.assertEqual(
+                    PRODUCT_SCHEMA.validate({"name": "A", "type": "B", "price": price, "stock": "1"}),
+                    {"price": "El precio debe ser un número valido"},
+                )
@@ -0,0 +1,67 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+
+from app import warmup
+
+
+class WarmupTest(TestCase):
+    """
+    Clase de tests del calentamiento de los procesos y de la vista /ready.
+    """
+    def setUp(self):
+        was_ready = warmup.READY.is_set()
+        warmup.READY.clear()
+        self.addCleanup(warmup.READY.set if was_ready else warmup.READY.clear)
+
+    def test_not_ready_before_warm_up(self):
+        response = self.client.get(reverse("ready"))
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json(), {"status": "warming"})
+
+    def test_warm_up_reports_phases(self):
+        timings = warmup.warm_up()
+
+        self.assertEqual(set(timings), {"urls", "templates", "database", "total"})
+        self.assertGreaterEqual(timings["total"], timings["urls"])
+        self.assertTrue(warmup.is_ready())
+
+    def test_ready_after_warm_up(self):
+        warmup.warm_up()
+
+        response = self.client.get(reverse("ready"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "ready")
+        self.assertIn("total", response.json()["warmup_ms"])
+
+    def test_warm_up_logs_breakdown(self):
+        with self.assertLogs("vetsoft.warmup", "INFO") as logs:
+            warmup.warm_up()
+
+        self.assertIn("templates", logs.output[0])
+        self.assertIn("database", logs.output[0])
+
+    def test_failed_phase_keeps_process_not_ready(self):
+        failing = (("database", mock.Mock(side_effect=RuntimeError("sin base"))),)
+
+        with mock.patch.object(warmup, "PHASES", failing), self.assertLogs("vetsoft.warmup", "ERROR"):
+            self.assertIsNone(warmup.warm_up())
+
+        self.assertFalse(warmup.is_ready())
+        self.assertEqual(self.client.get(reverse("ready")).status_code, 503)
+
+    def test_failed_warm_up_after_a_previous_one(self):
+        # Como un worker creado con fork después de calentar el maestro.
+        warmup.warm_up()
+        failing = (("database", mock.Mock(side_effect=RuntimeError("sin base"))),)
+
+        with mock.patch.object(warmup, "PHASES", failing), self.assertLogs("vetsoft.warmup", "ERROR"):
+            warmup.warm_up()
+
+        self.assertFalse(warmup.is_ready())
+
+    def test_templates_are_cached(self):
+        self.assertGreater(warmup.warm_templates(), 0)
@@ -0,0 +1,74 @@
+import threading
+
+from django.db import OperationalError, connection
+from django.test import TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from app.models import Product
+from app.writes import STATS, run_write
+
+
+@override_settings(WRITE_RETRIES=3, WRITE_RETRY_BASE_DELAY=0.001, WRITE_RETRY_MAX_DELAY=0.002)
+class RunWriteTest(TransactionTestCase):
+    """
+    Clase de tests de unidad de la coordinacion de escrituras.
+    """
+    def setUp(self):
+        STATS.reset()
+
+    def failing(self, failures, error="database is locked"):
+        calls = []
+
+        def write():
+            calls.append(1)
+            if len(calls) <= failures:
+                raise OperationalError(error)
+            return "ok"
+
+        return write, calls
+
+    def test_locked_writes_are_retried(self):
+        write, calls = self.failing(2)
+
+        self.assertEqual(run_write(write), "ok")
+        self.assertEqual(len(calls), 3)
+        stats = STATS.snapshot()
+        self.assertEqual((stats["writes"], stats["lock_waits"], stats["retries"]), (1, 2, 2))
+        self.assertGreater(stats["backoff_seconds"], 0)
+
+    def test_gives_up_after_the_last_retry(self):
+        write, calls = self.failing(10)
+
+        with self.assertRaises(OperationalError):
+            run_write(write)
+
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(STATS.snapshot()["failures"], 1)
+
+    def test_other_errors_are_not_retried(self):
+        write, calls = self.failing(1, error="no such table: app_owner")
+
+        with self.assertRaises(OperationalError):
+            run_write(write)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(STATS.snapshot()["retries"], 0)
+
+    def test_transaction_is_immediate(self):
+        with CaptureQueriesContext(connection) as queries:
+            Product.save_product({"name": "Collar", "type": "Gato", "price": "300", "stock": "1"})
+
+        self.assertEqual(queries[0]["sql"], "BEGIN IMMEDIATE")
+        self.assertTrue(Product.objects.filter(name="Collar").exists())
+
+    @override_settings(WRITE_QUEUE=True)
+    def test_queue_runs_writes_in_the_writer_thread(self):
+        threads = []
+
+        def write():
+            threads.append(threading.current_thread().name)
+            return len(threads)
+
+        self.assertEqual(run_write(write), 1)
+        self.assertEqual(threads, ["vetsoft-writer"])
+        self.assertEqual(STATS.snapshot()["queued"], 1)
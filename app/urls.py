@@ -1,29 +1,55 @@
+from django.conf import settings
 from django.urls import path
 
-from . import views
+from . import api, async_views, views
 
-urlpatterns = [
-    path("", view=views.home, name="home"),
-    path("clientes/", view=views.clients_repository, name="clients_repo"),
-    path("clientes/nuevo/", view=views.clients_form, name="clients_form"),
-    path("clientes/editar/<int:id>/", view=views.clients_form, name="clients_edit"),
-    path("clientes/eliminar/", view=views.clients_delete, name="clients_delete"),
-    path("medicines/", view=views.medicines_repository, name="medicines_repo"),
-    path("medicines/nuevo/", view=views.medicines_form, name="medicines_form"),
-    path("medicines/editar/<int:id>/", view=views.medicines_form, name="medicines_edit"),
-    path("medicines/eliminar/", view=views.medicines_delete, name="medicines_delete"),
-    path("products/", view=views.products_repository, name="products_repo"),
-    path("products/nuevo/", view=views.products_form, name="products_form"),
-    path("products/editar/<int:id>/", view=views.products_form, name="products_edit"),
-    path("products/eliminar/", view=views.products_delete, name="products_delete"),
-    path("products/increase_stock/", view=views.increase_stock, name="increase_stock"),
-    path("products/decrease_stock/", view=views.decrease_stock, name="decrease_stock"),
-    path("mascotas/", view=views.pets_repository, name="pets_repo"),
-    path("mascotas/nuevo/", view=views.pets_form, name="pets_form"),
-    path("mascotas/editar/<int:id>/", view=views.pets_form, name="pets_edit"),
-    path("mascotas/eliminar/", view=views.pets_delete, name="pets_delete"),
-    path("veterinario/", view=views.vet_repository, name="vet_repo"),
-    path("veterinario/nuevo/", view=views.vet_form, name="vet_form"),
-    path("veterinario/editar/<int:id>/", view=views.vet_form, name="vet_edit"),
-    path("veterinario/eliminar/", view=views.vet_delete, name="vet_delete"),
-]
+
+def get_urlpatterns(pages):
+    """
+    Arma las rutas de la aplicación.
+
+    Args:
+        pages: Módulo con las vistas de repositorios, formularios y stock
+            (`views` o su versión asíncrona, `async_views`).
+
+    Returns:
+        list: Las rutas de la aplicación.
+    """
+    return [
+        path("", view=views.home, name="home"),
+        path("clientes/", view=pages.clients_repository, name="clients_repo"),
+        path("clientes/buscar/", view=views.clients_search, name="clients_search"),
+        path("clientes/nuevo/", view=pages.clients_form, name="clients_form"),
+        path("clientes/editar/<int:id>/", view=pages.clients_form, name="clients_edit"),
+        path("clientes/eliminar/", view=views.clients_delete, name="clients_delete"),
+        path("medicines/", view=pages.medicines_repository, name="medicines_repo"),
+        path("medicines/nuevo/", view=pages.medicines_form, name="medicines_form"),
+        path("medicines/editar/<int:id>/", view=pages.medicines_form, name="medicines_edit"),
+        path("medicines/eliminar/", view=views.medicines_delete, name="medicines_delete"),
+        path("products/", view=pages.products_repository, name="products_repo"),
+        path("products/nuevo/", view=pages.products_form, name="products_form"),
+        path("products/editar/<int:id>/", view=pages.products_form, name="products_edit"),
+        path("products/eliminar/", view=views.products_delete, name="products_delete"),
+        path("products/increase_stock/", view=pages.increase_stock, name="increase_stock"),
+        path("products/decrease_stock/", view=pages.decrease_stock, name="decrease_stock"),
+        path("mascotas/", view=pages.pets_repository, name="pets_repo"),
+        path("mascotas/buscar/", view=views.pets_search, name="pets_search"),
+        path("mascotas/nuevo/", view=pages.pets_form, name="pets_form"),
+        path("mascotas/editar/<int:id>/", view=pages.pets_form, name="pets_edit"),
+        path("mascotas/eliminar/", view=views.pets_delete, name="pets_delete"),
+        path("veterinario/", view=pages.vet_repository, name="vet_repo"),
+        path("veterinario/nuevo/", view=pages.vet_form, name="vet_form"),
+        path("veterinario/editar/<int:id>/", view=pages.vet_form, name="vet_edit"),
+        path("veterinario/eliminar/", view=views.vet_delete, name="vet_delete"),
+        path("importar/", view=views.import_data, name="import_data"),
+        path("exportar/<str:entity>/", view=views.export_data, name="export_data"),
+        path("api/<str:entity>/", view=api.api_list, name="api_list"),
+        path("api/<str:entity>/<int:id>/", view=api.api_detail, name="api_detail"),
+        path("metrics", view=views.metrics, name="metrics"),
+        path("ready", view=views.ready, name="ready"),
+    ]
+
+
+# Con ASYNC_VIEWS (activo por defecto al servir con ASGI) se usan las vistas
+# asíncronas.
+urlpatterns = get_urlpatterns(async_views if settings.ASYNC_VIEWS else views)
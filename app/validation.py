@@ -0,0 +1,403 @@
+import math
+import re
+from datetime import date, datetime
+
+
+class Rule:
+    """
+    Clase de regla de validación de un campo.
+
+    Atributos:
+        message: Mensaje de error si el valor no es válido.
+        check: Función que recibe el valor del campo, el valor convertido por
+            una regla de conversión anterior y la fecha del día, y devuelve
+            True si el valor es válido.
+        convert: Función de conversión para las reglas de conversión: el valor
+            es válido si no lanza ValueError ni TypeError, y el resultado pasa
+            como valor convertido a las reglas siguientes.
+        uses_today: Indica si `check` usa la fecha del día.
+    """
+
+    def __init__(self, message, check=None, convert=None, uses_today=False):
+        self.message = message
+        self.check = check
+        self.convert = convert
+        self.uses_today = uses_today
+
+
+def required(message):
+    """
+    Regla que exige que el campo no esté vacío.
+
+    Args:
+        message: Mensaje de error si el campo está vacío.
+
+    Returns:
+        Rule: La regla.
+    """
+    def check(value, converted, today):
+        return value != ""
+
+    return Rule(message, check)
+
+
+def matches(pattern, message):
+    """
+    Regla que exige que el campo coincida con una expresión regular desde el
+    comienzo (como `re.match`). La expresión se compila una sola vez, al
+    crear la regla.
+
+    Args:
+        pattern: Expresión regular.
+        message: Mensaje de error si el campo no coincide.
+
+    Returns:
+        Rule: La regla.
+    """
+    match = re.compile(pattern).match
+
+    def check(value, converted, today):
+        return match(value) is not None
+
+    return Rule(message, check)
+
+
+def ends_with(suffix, message):
+    """
+    Regla que exige que el campo termine con `suffix`.
+
+    Args:
+        suffix: Texto con el que debe terminar el campo.
+        message: Mensaje de error si el campo no termina con `suffix`.
+
+    Returns:
+        Rule: La regla.
+    """
+    def check(value, converted, today):
+        return value.endswith(suffix)
+
+    return Rule(message, check)
+
+
+def contains(text, message):
+    """
+    Regla que exige que el campo contenga `text`.
+
+    Args:
+        text: Texto que debe aparecer en el campo.
+        message: Mensaje de error si el campo no contiene `text`.
+
+    Returns:
+        Rule: La regla.
+    """
+    def check(value, converted, today):
+        return text in value
+
+    return Rule(message, check)
+
+
+def integer(message):
+    """
+    Regla que exige que el campo sea un número entero (según `int()`).
+
+    Args:
+        message: Mensaje de error si el campo no es un entero.
+
+    Returns:
+        Rule: La regla.
+    """
+    return Rule(message, convert=int)
+
+
+def number(message):
+    """
+    Regla que exige que el campo sea un número (según `float()`).
+
+    Args:
+        message: Mensaje de error si el campo no es un número.
+
+    Returns:
+        Rule: La regla.
+    """
+    return Rule(message, convert=float)
+
+
+def finite(message):
+    """
+    Regla que exige que el número convertido por la regla anterior sea finito
+    (ni NaN ni infinito), que no se pueden guardar ni exportar a JSON.
+
+    Args:
+        message: Mensaje de error si el número no es finito.
+
+    Returns:
+        Rule: La regla.
+    """
+    def check(value, converted, today):
+        return math.isfinite(converted)
+
+    return Rule(message, check)
+
+
+def between(minimum, maximum, message):
+    """
+    Regla que exige que el valor convertido por la regla anterior esté entre
+    `minimum` y `maximum`, inclusive (None significa sin límite).
+
+    Args:
+        minimum: Valor mínimo, o None.
+        maximum: Valor máximo, o None.
+        message: Mensaje de error si el valor está fuera del rango.
+
+    Returns:
+        Rule: La regla.
+    """
+    # Se escribe como "no menor y no mayor" para que NaN sea válido, como antes.
+    def check(value, converted, today):
+        if minimum is not None and converted < minimum:
+            return False
+        return maximum is None or not converted > maximum
+
+    return Rule(message, check)
+
+
+def parse_date(value):
+    """
+    Convierte un texto AAAA-MM-DD en fecha.
+
+    Las fechas con exactamente ese formato se leen con `date.fromisoformat`,
+    mucho más rápido que `strptime`; el resto pasa por `strptime`, que acepta
+    también meses y días de un dígito.
+
+    Args:
+        value: Texto con la fecha.
+
+    Returns:
+        date: La fecha.
+
+    Raises:
+        ValueError: Si el texto no es una fecha válida.
+    """
+    if len(value) == 10 and value[4] == "-" and value[7] == "-" and value.isascii():
+        return date.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def valid_date(message):
+    """
+    Regla que exige que el campo sea una fecha AAAA-MM-DD válida.
+
+    Args:
+        message: Mensaje de error si la fecha no es válida.
+
+    Returns:
+        Rule: La regla.
+    """
+    return Rule(message, convert=parse_date)
+
+
+def not_future(message):
+    """
+    Regla que exige que la fecha convertida por la regla anterior no sea
+    posterior al día actual.
+
+    Args:
+        message: Mensaje de error si la fecha es futura.
+
+    Returns:
+        Rule: La regla.
+    """
+    def check(value, converted, today):
+        return not converted > today
+
+    return Rule(message, check, uses_today=True)
+
+
+class Schema:
+    """
+    Clase de esquema de validación: asocia a cada campo una lista de reglas y
+    valida diccionarios con los datos de un registro.
+
+    Las reglas se arman una sola vez al crear el esquema (con las expresiones
+    regulares ya compiladas), así que validar un registro sólo recorre la
+    lista de reglas de cada campo. Las reglas de un campo se evalúan en orden
+    y el campo toma el mensaje de la primera que falla. Los campos ausentes
+    se tratan como "".
+
+    Atributos:
+        fields: Lista de (campo, reglas) en el orden en que se validan.
+    """
+
+    def __init__(self, **fields):
+        self.fields = [(name, tuple(rules)) for name, rules in fields.items()]
+        self._uses_today = any(rule.uses_today for _, rules in self.fields for rule in rules)
+
+    def _validate(self, data, today):
+        errors = {}
+        for field, rules in self.fields:
+            value = converted = data.get(field, "")
+            for rule in rules:
+                if rule.convert is not None:
+                    try:
+                        converted = rule.convert(value)
+                    except (TypeError, ValueError):
+                        errors[field] = rule.message
+                        break
+                elif not rule.check(value, converted, today):
+                    errors[field] = rule.message
+                    break
+        return errors
+
+    def validate(self, data):
+        """
+        Valida un registro.
+
+        Args:
+            data: Diccionario con los datos del registro.
+
+        Returns:
+            dict: Un diccionario con errores de validación si los hay.
+        """
+        return self._validate(data, date.today() if self._uses_today else None)
+
+    def validate_many(self, rows):
+        """
+        Valida varios registros, calculando una sola vez los valores comunes
+        a todos (como la fecha del día).
+
+        Args:
+            rows: Iterable de diccionarios con los datos de cada registro.
+
+        Returns:
+            list: Un diccionario de errores (vacío si es válido) por registro.
+        """
+        today = date.today()
+        validate = self._validate
+        return [validate(row, today) for row in rows]
+
+
+class RelatedSchema:
+    """
+    Clase de esquema que, además de las reglas de otro esquema, verifica que
+    existan las filas a las que apuntan los campos de claves foráneas
+    opcionales (como `owner_id`).
+
+    Las claves de todos los registros validados juntos se buscan con una
+    sola consulta por modelo relacionado, así que validar un bloque de una
+    importación no agrega una consulta por fila.
+
+    Atributos:
+        schema: Esquema con las reglas de los campos.
+        related: Diccionario de campo a (modelo, mensaje de error).
+    """
+
+    def __init__(self, schema, **related):
+        self.schema = schema
+        self.related = related
+
+    def validate(self, data):
+        """
+        Valida un registro.
+
+        Args:
+            data: Diccionario con los datos del registro.
+
+        Returns:
+            dict: Un diccionario con errores de validación si los hay.
+        """
+        return self.validate_many([data])[0]
+
+    def validate_many(self, rows):
+        """
+        Valida varios registros.
+
+        Args:
+            rows: Iterable de diccionarios con los datos de cada registro.
+
+        Returns:
+            list: Un diccionario de errores (vacío si es válido) por registro.
+        """
+        rows = list(rows)
+        errors = self.schema.validate_many(rows)
+        for field, (model, message) in self.related.items():
+            pending = [
+                (int(row[field]), row_errors) for row, row_errors in zip(rows, errors)
+                if row.get(field, "") != "" and field not in row_errors
+            ]
+            if not pending:
+                continue
+
+            existing = set(
+                model._default_manager.filter(pk__in={pk for pk, _ in pending})
+                .values_list("pk", flat=True),
+            )
+            for pk, row_errors in pending:
+                if pk not in existing:
+                    row_errors[field] = message
+        return errors
+
+
+# Un precio, stock o dosis vacío no pasa la conversión a número, así que su
+# mensaje es el de "número" y no el de "ingrese", igual que antes.
+CLIENT_SCHEMA = Schema(
+    name=[
+        required("Por favor ingrese un nombre"),
+        matches(r"^[a-zA-ZÁÉÍÓÚáéíóúüÜ\s]+$", "El nombre solo debe contener letras y espacios"),
+    ],
+    phone=[
+        required("Por favor ingrese un teléfono"),
+        matches(r"^[0-9]+$", "El teléfono sólo puede contener números"),
+        matches(r"^54", "El teléfono debe comenzar con '54'"),
+    ],
+    email=[
+        required("Por favor ingrese un email"),
+        ends_with("@vetsoft.com", "El correo electrónico debe terminar en @vetsoft.com"),
+        contains("@", "Por favor ingrese un email válido"),
+    ],
+)
+
+PET_SCHEMA = Schema(
+    name=[required("Por favor ingrese un nombre")],
+    breed=[required("Por favor ingrese la raza")],
+    birthday=[
+        required("Por favor ingrese una fecha"),
+        valid_date("Por favor ingrese una fecha válida"),
+        not_future("La fecha de cumpleaños no puede ser mayor al dia actual"),
+    ],
+    # El dueño y el veterinario son opcionales; que existan lo verifica
+    # `RelatedSchema` (ver `models.PET_LINKED_SCHEMA`).
+    owner_id=[matches(r"^[0-9]*$", "El dueño debe ser el ID de un cliente")],
+    vet_id=[matches(r"^[0-9]*$", "El veterinario debe ser el ID de un veterinario")],
+)
+
+MEDICINE_SCHEMA = Schema(
+    name=[required("Por favor, ingrese un nombre para la medicina")],
+    description=[required("Por favor, ingrese una descripcion")],
+    dose=[
+        integer("La dosis debe ser un número entero"),
+        between(1, 10, "La dosis debe ser entre 1 y 10"),
+    ],
+)
+
+PRODUCT_SCHEMA = Schema(
+    name=[required("Ingrese el nombre del producto")],
+    type=[required("Ingrese el tipo de producto")],
+    price=[
+        number("El precio debe ser un número valido"),
+        finite("El precio debe ser un número valido"),
+        between(0, None, "El precio no puede ser negativo"),
+    ],
+    stock=[
+        integer("El stock debe ser un número entero"),
+        between(0, None, "El stock no puede ser negativo"),
+    ],
+)
+
+VET_SCHEMA = Schema(
+    name=[required("Por favor, ingrese el nombre del veterinario/a")],
+    email=[
+        required("Por favor ingrese un email del veterinario/a"),
+        contains("@", "Por favor ingrese un email válido del veterinario/a"),
+    ],
+    phone=[required("Por favor, ingrese el telefono del veterinario/a")],
+)
@@ -1,21 +1,251 @@
+from urllib.parse import urlencode
+
 from django.contrib import messages
+from django.db.models import Prefetch, prefetch_related_objects
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.middleware.csrf import get_token
 from django.shortcuts import get_object_or_404, redirect, render, reverse
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+
+from .cache import get_or_build, make_key
+from .dashboard import get_dashboard
+from .exporters import CONTENT_TYPES, export_entity, get_model
+from .importers import guess_format, import_file
+from .metrics import collect_all
+from .metrics import render as render_metrics
+from .models import CacheVersion, Client, Medicine, Pet, Product, Vet
+from .pagination import (
+    get_filters,
+    get_sort,
+    order_queryset,
+    paginate_queryset,
+    read_page_params,
+)
+from .search import search
+from .streaming import stream_repository
+from .warmup import TIMINGS, is_ready
+from .writes import run_write
+
+
+def _search_page(request, entity, model, related=()):
+    """
+    Renderiza el repositorio con los resultados de la búsqueda de `?q=`.
+
+    Args:
+        request: Objeto de solicitud HTTP con el texto a buscar en `q`.
+        entity: Nombre del repositorio (carpeta de templates y variable de contexto).
+        model: Modelo en el que se busca.
+        related: Relaciones que muestran las filas, que se cargan con una
+            consulta por relación para toda la página.
+
+    Returns:
+        HttpResponse: La página de resultados, o una redirección al repositorio
+        si no se ingresó texto.
+    """
+    query = request.GET.get("q", "").strip()
+    if query == "":
+        return redirect(reverse(f"{entity}_repo"))
+
+    page = search(request, model, query)
+    prefetch_related_objects(page.items, *related)
+    return render(
+        request,
+        f"{entity}/repository.html",
+        {entity: page.items, "page": page, "query": query},
+    )
+
+CSRF_PLACEHOLDER = "__vetsoft_csrf_token__"
+
+# Columnas por las que se puede ordenar y filtrar cada repositorio. Todas
+# tienen índice (ver los `Meta.indexes` de los modelos), así que el orden y
+# los filtros no recorren la tabla entera.
+CLIENT_SORTABLE = ("pk", "name", "email", "phone")
+CLIENT_FILTERABLE = (("email", "Email"), ("phone", "Teléfono"))
+MEDICINE_SORTABLE = ("pk", "name")
+MEDICINE_FILTERABLE = (("name", "Nombre"),)
+PRODUCT_SORTABLE = ("pk", "name")
+PRODUCT_FILTERABLE = (("type", "Tipo"),)
+PET_SORTABLE = ("pk", "name", "birthday")
+PET_FILTERABLE = (("breed", "Raza"), ("birthday", "Cumpleaños"))
+VET_SORTABLE = ("pk", "name")
+VET_FILTERABLE = (("email", "Email"),)
+
+# Relaciones que muestran las filas de cada repositorio. Se cargan con un JOIN
+# (mascotas) o con una consulta para toda la página (clientes), así que la
+# cantidad de consultas no depende de la cantidad de filas.
+CLIENT_PETS = Prefetch("pets", queryset=Pet.objects.order_by("name", "pk"))
+PET_RELATED = ("owner", "vet")
+
+# Otros modelos cuyos cambios invalidan la caché de cada repositorio, porque
+# sus filas muestran datos de ellos.
+REPOSITORY_DEPENDENCIES = {
+    "clients": (Pet,),
+    "pets": (Client, Vet),
+}
+
+# Métodos con los que los formularios crean y actualizan cada entidad. Son
+# los mismos en las vistas sincrónicas y asíncronas (ver `save_form`).
+FORM_WRITES = {
+    "clients": (Client, Client.save_client, Client.update_client),
+    "medicines": (Medicine, Medicine.save_medicine, Medicine.update_medicine),
+    "products": (Product, Product.save_product, Product.update_product),
+    "pets": (Pet, Pet.save_pet, Pet.update_pet),
+    "vets": (Vet, Vet.save_vet, Vet.update_vet),
+}
+
+def save_form(entity, data):
+    """
+    Crea o actualiza un registro con los datos de su formulario, usando los
+    métodos `save_*` y `update_*` del modelo, que validan los datos y
+    escriben con `coordinated_write`.
+
+    Args:
+        entity: Nombre de la entidad (clave de FORM_WRITES).
+        data: Datos del formulario; si incluyen `id`, se actualiza ese registro.
+
+    Returns:
+        tuple: Si se guardó y los errores de validación (o None).
+
+    Raises:
+        Http404: Si no existe el registro a actualizar.
+    """
+    model, save, update = FORM_WRITES[entity]
+    record_id = data.get("id", "")
+    if record_id == "":
+        result = save(data)
+    else:
+        result = update(get_object_or_404(model, pk=record_id), data)
+
+    # Algunos `update_*` no devuelven nada cuando guardan.
+    return result or (True, None)
+
+def _filter_repository(request, queryset, sortable, filterable):
+    """
+    Aplica al queryset los filtros pedidos y arma los datos de orden y filtros
+    que usa el template del repositorio.
+
+    Args:
+        request: Objeto de solicitud HTTP.
+        queryset: Queryset con las filas del repositorio.
+        sortable: Columnas por las que se permite ordenar el repositorio.
+        filterable: Pares (columna, etiqueta) de las columnas por las que se
+            permite filtrar el repositorio.
+
+    Returns:
+        tuple: El queryset filtrado y el contexto de los controles de la tabla.
+    """
+    labels = dict(filterable)
+    filters = get_filters(request, queryset.model, labels)
+    for field, value in filters:
+        queryset = queryset.filter(**{field: value})
+
+    filter_params = [f"{field}:{value}" for field, value in filters]
+    controls = {
+        "sort": get_sort(request, sortable),
+        "sortable": sortable,
+        "filter_fields": filterable,
+        "filter_params": filter_params,
+        "filter_query": urlencode({"filter": filter_params}, doseq=True),
+        "active_filters": [(labels[field], value) for field, value in filters],
+    }
+    return queryset, controls
+
+def _repository_key(request, entity, versions, model, sortable, controls):
+    """
+    Arma la clave de caché de una página de un repositorio a partir de los
+    parámetros ya normalizados (orden, filtros, tamaño de página y cursor) y
+    no de la URL, así que los parámetros que no cambian la página (como
+    `?_profile=` o los de seguimiento) no crean entradas nuevas en la caché.
+    """
+    params = {
+        "page": read_page_params(request, model, sortable),
+        "filter": sorted(controls["filter_params"]),
+    }
+    return make_key(entity, versions, params)
+
+def _repository_page(request, entity, queryset, sortable, filterable=()):
+    """
+    Renderiza una página de un repositorio paginado por cursor, o el repositorio
+    completo en streaming si la solicitud incluye `?stream=1`.
+
+    El orden (`?sort=`) y los filtros (`?filter=campo:valor`) se resuelven en
+    la base de datos y sólo se permiten sobre columnas con índice.
+
+    La página (filas y cursores) y las filas ya renderizadas se guardan en la
+    caché bajo la versión actual del modelo, que cambia con cada escritura. Las
+    filas se renderizan con un token CSRF de reemplazo que se sustituye por el
+    de cada solicitud al servirlas.
+
+    Args:
+        request: Objeto de solicitud HTTP.
+        entity: Nombre del repositorio (carpeta de templates y variable de contexto).
+        queryset: Queryset con las filas del repositorio.
+        sortable: Columnas por las que se permite ordenar el repositorio.
+        filterable: Pares (columna, etiqueta) de las columnas por las que se
+            permite filtrar el repositorio.
+
+    Returns:
+        HttpResponse: La página del repositorio pedida.
+    """
+    queryset, controls = _filter_repository(request, queryset, sortable, filterable)
+
+    if request.GET.get("stream") == "1":
+        return stream_repository(request, entity, order_queryset(queryset, controls["sort"]))
+
+    def build():
+        params = {"filter": controls["filter_params"]}
+        page = paginate_queryset(request, queryset, sortable, params)
+        return page, _render_rows(entity, page)
+
+    versions = CacheVersion.get_tokens(queryset.model, *REPOSITORY_DEPENDENCIES.get(entity, ()))
+    key = _repository_key(request, entity, versions, queryset.model, sortable, controls)
+    page, rows_html = get_or_build(key, build)
+    return _render_repository(request, entity, page, rows_html, controls)
+
+def _render_rows(entity, page):
+    """
+    Renderiza las filas de una página con el token CSRF de reemplazo, para
+    guardarlas en la caché.
+    """
+    return get_template(f"{entity}/rows.html").render(
+        {entity: page.items, "csrf_token": CSRF_PLACEHOLDER},
+    )
 
-from .models import Client, Medicine, Pet, Product, Vet
+def _render_repository(request, entity, page, rows_html, controls=None):
+    """
+    Renderiza la página del repositorio con las filas ya renderizadas,
+    sustituyendo el token CSRF de reemplazo por el de la solicitud.
+    """
+    rows_html = mark_safe(rows_html.replace(CSRF_PLACEHOLDER, get_token(request)))
 
+    return render(
+        request,
+        f"{entity}/repository.html",
+        {entity: page.items, "page": page, "rows_html": rows_html, **(controls or {})},
+    )
 
 def home(request):
     """
-    Renderiza la página de inicio.
+    Renderiza la página de inicio, con el tablero de resumen (ver
+    app/dashboard.py).
     """
-    return render(request, "home.html")
+    return render(request, "home.html", {"dashboard": get_dashboard()})
 
 def clients_repository(request):
     """
-    Muestra todos los clientes en el repositorio.
+    Muestra los clientes del repositorio, paginados por cursor.
     """
-    clients = Client.objects.all()
-    return render(request, "clients/repository.html", {"clients": clients})
+    return _repository_page(
+        request, "clients", Client.objects.prefetch_related(CLIENT_PETS),
+        CLIENT_SORTABLE, CLIENT_FILTERABLE,
+    )
+
+def clients_search(request):
+    """
+    Busca clientes por nombre, email, teléfono o dirección.
+    """
+    return _search_page(request, "clients", Client, (CLIENT_PETS,))
 
 def clients_form(request, id=None):
     """
@@ -30,16 +260,7 @@ def clients_form(request, id=None):
         Render: Renderiza el formulario con errores si hay problemas o con los datos del cliente a editar.
     """
     if request.method == "POST":
-        client_id = request.POST.get("id", "")
-        errors = {}
-        saved = True
-
-
-        if client_id == "":
-            saved, errors = Client.save_client(request.POST)
-        else:
-            client = get_object_or_404(Client, pk=client_id)
-            saved, errors = client.update_client(request.POST)
+        saved, errors = save_form("clients", request.POST)
 
         if saved:
             return redirect(reverse("clients_repo"))
@@ -69,15 +290,16 @@ def clients_delete(request):
     """
     client_id = request.POST.get("client_id")
     client = get_object_or_404(Client, pk=int(client_id))
-    client.delete()
+    run_write(client.delete)
     return redirect(reverse("clients_repo"))
 
 def medicines_repository(request):
     """
-    Muestra todos los medicamentos en el repositorio.
+    Muestra los medicamentos del repositorio, paginados por cursor.
     """
-    medicines = Medicine.objects.all()
-    return render(request, "medicines/repository.html", {"medicines": medicines})
+    return _repository_page(
+        request, "medicines", Medicine.objects.all(), MEDICINE_SORTABLE, MEDICINE_FILTERABLE,
+    )
 
 def medicines_form(request, id=None):
     """
@@ -92,15 +314,7 @@ def medicines_form(request, id=None):
         Render: Renderiza el formulario con errores si hay problemas o con los datos del medicamento a editar.
     """
     if request.method == "POST":
-        medicine_id = request.POST.get("id", "")
-        errors = {}
-        saved = True
-
-        if medicine_id == "":
-            saved, errors = Medicine.save_medicine(request.POST)
-        else:
-            medicine = get_object_or_404(Medicine, pk=medicine_id)
-            medicine.update_medicine(request.POST)
+        saved, errors = save_form("medicines", request.POST)
 
         if saved:
             return redirect(reverse("medicines_repo"))
@@ -127,15 +341,16 @@ def medicines_delete(request):
     """
     medicine_id = request.POST.get("medicine_id")
     medicine = get_object_or_404(Medicine, pk=int(medicine_id))
-    medicine.delete()
+    run_write(medicine.delete)
     return redirect(reverse("medicines_repo"))
 
 def products_repository(request):
     """
-    Muestra todos los productos en el repositorio.
+    Muestra los productos del repositorio, paginados por cursor.
     """
-    products = Product.objects.all()
-    return render(request, "products/repository.html", {"products": products})
+    return _repository_page(
+        request, "products", Product.objects.all(), PRODUCT_SORTABLE, PRODUCT_FILTERABLE,
+    )
 
 def products_form(request, id=None):
     """
@@ -150,15 +365,7 @@ def products_form(request, id=None):
         Render: Renderiza el formulario con errores si hay problemas o con los datos del producto a editar.
     """
     if request.method == "POST":
-        product_id = request.POST.get("id", "")
-        errors = {}
-        saved = True
-
-        if product_id == "":
-            saved, errors = Product.save_product(request.POST)
-        else:
-            product = get_object_or_404(Product, pk=product_id)
-            saved, errors = product.update_product(request.POST)
+        saved, errors = save_form("products", request.POST)
 
         if saved:
             return redirect(reverse("products_repo"))
@@ -185,12 +392,48 @@ def products_delete(request):
     """
     product_id = request.POST.get("product_id")
     product = get_object_or_404(Product, pk=int(product_id))
-    product.delete()
+    run_write(product.delete)
     return redirect(reverse("products_repo"))
 
+def _stock_amount(request):
+    """
+    Obtiene la cantidad de unidades a sumar o restar del stock.
+
+    Args:
+        request: Objeto de solicitud HTTP con el campo opcional `amount` en los datos POST.
+
+    Returns:
+        int: La cantidad pedida (1 por defecto), o None si no es un entero positivo.
+    """
+    try:
+        amount = int(request.POST.get("amount", 1))
+    except ValueError:
+        return None
+
+    return amount if amount > 0 else None
+
+def _out_of_stock_message(request):
+    """
+    Arma el aviso de un descuento de stock que no se aplicó.
+
+    El nombre del producto viene del formulario (`product_name`), así que
+    avisar no vuelve a leer el producto: el UPDATE condicional que no afectó
+    ninguna fila ya indica que no había stock suficiente (o que el producto
+    no existe).
+
+    Args:
+        request: Objeto de solicitud HTTP con el campo opcional `product_name`.
+
+    Returns:
+        str: El mensaje de producto fuera de stock.
+    """
+    name = request.POST.get("product_name", "").strip() or "El producto"
+    return f"{name}: Fuera de stock."
+
 def increase_stock(request):
     """
-    Aumenta el stock de un producto según el ID proporcionado en la solicitud POST.
+    Aumenta el stock de un producto según el ID y la cantidad opcional `amount`
+    proporcionados en la solicitud POST.
 
     Args:
         request: Objeto de solicitud HTTP que contiene el ID del producto en los datos POST.
@@ -200,14 +443,24 @@ def increase_stock(request):
     """
     if request.method == "POST":
         product_id = request.POST.get("product_id")
-        product = get_object_or_404(Product, pk=product_id)
-        product.stock += 1
-        product.save()
+        amount = _stock_amount(request)
+        if amount is None:
+            messages.warning(request, "La cantidad debe ser un número entero positivo.")
+            return redirect("products_repo")
+
+        if not Product.increase_stock(product_id, amount):
+            raise Http404("No existe el producto.")
+
         return redirect("products_repo")
 
 def decrease_stock(request):
     """
-    Disminuye el stock de un producto según el ID proporcionado en la solicitud POST.
+    Disminuye el stock de un producto según el ID y la cantidad opcional `amount`
+    proporcionados en la solicitud POST.
+
+    El descuento es un único UPDATE condicional; si no afecta ninguna fila, el
+    producto no tiene stock suficiente (o no existe) y se avisa que está fuera
+    de stock, sin volver a leerlo.
 
     Args:
         request: Objeto de solicitud HTTP que contiene el ID del producto en los datos POST.
@@ -217,22 +470,29 @@ def decrease_stock(request):
     """
     if request.method == "POST":
         product_id = request.POST.get("product_id")
-        product = get_object_or_404(Product, pk=product_id)
-        if product.stock > 0:
-            product.stock -= 1
-            product.save()
-        
-        if product.stock == 0:
-            messages.warning(request, f"{product.name}: Fuera de stock.")
+        amount = _stock_amount(request)
+        if amount is None:
+            messages.warning(request, "La cantidad debe ser un número entero positivo.")
+            return redirect("products_repo")
+
+        if not Product.decrease_stock(product_id, amount):
+            messages.warning(request, _out_of_stock_message(request))
 
         return redirect("products_repo")
 
 def pets_repository(request):
     """
-    Muestra todas las mascotas en el repositorio.
+    Muestra las mascotas del repositorio, paginadas por cursor.
     """
-    pets = Pet.objects.all()
-    return render(request, "pets/repository.html", {"pets": pets})
+    return _repository_page(
+        request, "pets", Pet.objects.select_related(*PET_RELATED), PET_SORTABLE, PET_FILTERABLE,
+    )
+
+def pets_search(request):
+    """
+    Busca mascotas por nombre o raza.
+    """
+    return _search_page(request, "pets", Pet, PET_RELATED)
 
 def pets_form(request, id=None):
     """
@@ -247,15 +507,7 @@ def pets_form(request, id=None):
         Render: Renderiza el formulario con errores si hay problemas o con los datos de la mascota a editar.
     """
     if request.method == "POST":
-        pet_id = request.POST.get("id", "")
-        errors = {}
-        saved = True
-
-        if pet_id == "":
-            saved, errors = Pet.save_pet(request.POST)
-        else:
-            pet = get_object_or_404(Pet, pk=pet_id)
-            pet.update_pet(request.POST)
+        saved, errors = save_form("pets", request.POST)
 
         if saved:
             return redirect(reverse("pets_repo"))
@@ -269,7 +521,7 @@ def pets_form(request, id=None):
 
     pet = None
     if id is not None:
-        pet = get_object_or_404(Pet, pk=id)
+        pet = get_object_or_404(Pet.objects.select_related(*PET_RELATED), pk=id)
 
     return render(request, "pets/form.html", {"pet": pet})
 
@@ -285,15 +537,16 @@ def pets_delete(request):
     """
     pet_id = request.POST.get("pet_id")
     pet = get_object_or_404(Pet, pk=int(pet_id))
-    pet.delete()
+    run_write(pet.delete)
     return redirect(reverse("pets_repo"))
 
 def vet_repository(request):
     """
-    Muestra todos los veterinarios en el repositorio.
+    Muestra los veterinarios del repositorio, paginados por cursor.
     """
-    vets = Vet.objects.all()
-    return render(request, "vets/repository.html", {"vets": vets})
+    return _repository_page(
+        request, "vets", Vet.objects.all(), VET_SORTABLE, VET_FILTERABLE,
+    )
 
 def vet_form(request, id=None):
     """
@@ -309,15 +562,7 @@ def vet_form(request, id=None):
     """
     
     if request.method == "POST":
-        vet_id = request.POST.get("id", "")
-        errors = {}
-        saved = True
-
-        if vet_id == "":
-            saved, errors = Vet.save_vet(request.POST)
-        else:
-            vet = get_object_or_404(Vet, pk=vet_id)
-            vet.update_vet(request.POST)
+        saved, errors = save_form("vets", request.POST)
 
         if saved:
             return redirect(reverse("vet_repo"))
@@ -345,5 +590,111 @@ def vet_delete(request):
     
     vet_id = request.POST.get("vet_id")
     vet = get_object_or_404(Vet, pk=int(vet_id))
-    vet.delete()
-    return redirect(reverse("vet_repo"))
\ No newline at end of file
+    run_write(vet.delete)
+    return redirect(reverse("vet_repo"))
+
+IMPORT_ENTITIES = [
+    ("clients", "Clientes"),
+    ("pets", "Mascotas"),
+    ("products", "Productos"),
+    ("medicines", "Medicinas"),
+    ("vets", "Veterinarios"),
+]
+
+def import_data(request):
+    """
+    Maneja el formulario de importación masiva de datos desde un archivo.
+
+    Args:
+        request: Objeto de solicitud HTTP con la entidad a importar y el archivo en los datos POST.
+
+    Returns:
+        Render: Renderiza el formulario con el reporte de la importación o con los errores del formulario.
+    """
+    context = {"entities": IMPORT_ENTITIES}
+
+    if request.method == "POST":
+        entity = request.POST.get("entity", "")
+        upload = request.FILES.get("file")
+        errors = {}
+
+        if entity not in dict(IMPORT_ENTITIES):
+            errors["entity"] = "Por favor seleccione los datos a importar"
+        if upload is None:
+            errors["file"] = "Por favor seleccione un archivo"
+
+        if not errors:
+            try:
+                context["result"] = import_file(entity, upload, guess_format(upload.name))
+            except ValueError as error:
+                errors["file"] = f"No se pudo leer el archivo: {error}"
+
+        context.update({"errors": errors, "entity": entity})
+
+    return render(request, "imports/form.html", context)
+
+def export_data(request, entity):
+    """
+    Exporta todas las filas de una entidad como archivo descargable.
+
+    Args:
+        request: Objeto de solicitud HTTP con los parámetros opcionales `format`
+            ("csv" o "jsonl") y `gzip` ("1" para comprimir).
+        entity: Nombre de la entidad a exportar.
+
+    Returns:
+        StreamingHttpResponse: El archivo exportado, enviado a medida que se genera.
+    """
+    if get_model(entity) is None:
+        raise Http404("No existe la entidad.")
+
+    format = request.GET.get("format", "csv")
+    if format not in CONTENT_TYPES:
+        format = "csv"
+    compress = request.GET.get("gzip") == "1"
+
+    filename = f"{entity}.{format}"
+    content_type = CONTENT_TYPES[format]
+    if compress:
+        filename += ".gz"
+        content_type = "application/gzip"
+
+    response = StreamingHttpResponse(
+        export_entity(entity, format, compress), content_type=content_type,
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def metrics(request):
+    """
+    Devuelve las métricas de la aplicación en el formato de Prometheus.
+
+    Con METRICS_DIR configurado incluye las de todos los procesos del servidor.
+
+    Args:
+        request: Objeto de solicitud HTTP.
+
+    Returns:
+        HttpResponse: Las métricas en texto plano.
+    """
+    return HttpResponse(
+        render_metrics(collect_all()), content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+def ready(request):
+    """
+    Informa si el proceso terminó el calentamiento (ver `app.warmup`), para
+    que el balanceador o el orquestador le envíen solicitudes sólo después.
+
+    Args:
+        request: Objeto de solicitud HTTP.
+
+    Returns:
+        JsonResponse: Estado 200 con la duración de cada fase si el proceso
+        está listo, o 503 si todavía no.
+    """
+    if not is_ready():
+        return JsonResponse({"status": "warming"}, status=503)
+    return JsonResponse({"status": "ready", "warmup_ms": TIMINGS})
@@ -0,0 +1,133 @@
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection
+from django.template import engines
+from django.urls import resolve, reverse
+from django.urls.converters import IntConverter
+
+from .models import Client, Medicine, Pet, Product, Vet
+
+logger = logging.getLogger("vetsoft.warmup")
+
+# Valores de ejemplo para armar las URL con parámetros (por defecto, "clients").
+SAMPLE_VALUES = {IntConverter: 1}
+
+READY = threading.Event()
+
+# Duración de cada fase del último calentamiento, en milisegundos.
+TIMINGS = {}
+
+
+def warm_urls():
+    """
+    Arma y resuelve cada URL de `app/urls.py`, lo que carga el resolver y
+    compila sus expresiones regulares.
+
+    Returns:
+        int: Cantidad de URL resueltas.
+    """
+    # app.urls importa las vistas, que usan este módulo.
+    from . import urls
+
+    for pattern in urls.urlpatterns:
+        kwargs = {
+            name: SAMPLE_VALUES.get(type(converter), "clients")
+            for name, converter in pattern.pattern.converters.items()
+        }
+        resolve(reverse(pattern.name, kwargs=kwargs))
+    return len(urls.urlpatterns)
+
+
+def warm_templates():
+    """
+    Compila los templates del proyecto, que quedan en la caché del loader de
+    cada motor de templates.
+
+    Returns:
+        int: Cantidad de templates compilados.
+    """
+    count = 0
+    for engine in engines.all():
+        for directory in engine.template_dirs:
+            directory = Path(directory)
+            if not directory.is_relative_to(settings.BASE_DIR):
+                continue
+            for path in sorted(directory.rglob("*.html")):
+                engine.get_template(path.relative_to(directory).as_posix())
+                count += 1
+    return count
+
+
+def warm_database():
+    """
+    Abre la conexión a la base de datos y lee la primera página de cada
+    repositorio, para cargar sus páginas en la caché.
+
+    Returns:
+        int: Cantidad de tablas leídas.
+    """
+    connection.ensure_connection()
+    models = (Client, Medicine, Pet, Product, Vet)
+    for model in models:
+        list(model.objects.order_by("pk")[: settings.REPOSITORY_PAGE_SIZE])
+    return len(models)
+
+
+PHASES = (
+    ("urls", warm_urls),
+    ("templates", warm_templates),
+    ("database", warm_database),
+)
+
+
+def warm_up():
+    """
+    Calienta el proceso antes de atender solicitudes: resuelve las URL,
+    compila los templates y abre la conexión a la base de datos.
+
+    Registra en el log la duración de cada fase y, si todas terminan bien,
+    marca el proceso como listo (ver `is_ready`). Si alguna falla (por
+    ejemplo, si faltan las migraciones) se registra el error y el proceso
+    queda sin estar listo, aunque lo estuviera antes: un worker de gunicorn
+    hereda READY del maestro que calentó al precargar la aplicación.
+
+    Returns:
+        dict: Duración de cada fase y total en milisegundos, o None si falló.
+    """
+    READY.clear()
+    start = time.perf_counter()
+    timings, counts = {}, {}
+    try:
+        for name, phase in PHASES:
+            phase_start = time.perf_counter()
+            counts[name] = phase()
+            timings[name] = round((time.perf_counter() - phase_start) * 1000, 1)
+    except Exception:
+        logger.exception("Falló el calentamiento del proceso %s", os.getpid())
+        return None
+    timings["total"] = round((time.perf_counter() - start) * 1000, 1)
+
+    TIMINGS.clear()
+    TIMINGS.update(timings)
+    READY.set()
+    logger.info(
+        "Proceso %s listo en %.1f ms: %s",
+        os.getpid(), timings["total"],
+        ", ".join(f"{name} {timings[name]:.1f} ms ({counts[name]})" for name, _ in PHASES),
+    )
+    return timings
+
+
+def is_ready():
+    """
+    Indica si el proceso ya terminó el calentamiento.
+
+    Returns:
+        bool: True si `warm_up` terminó bien.
+    """
+    return READY.is_set()
@@ -0,0 +1,219 @@
+import functools
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import OperationalError, close_old_connections, connection, transaction
+
+LOCKED_MESSAGES = ("database is locked", "database table is locked")
+
+
+class WriteStats:
+    """
+    Clase de contadores de las escrituras coordinadas por `run_write`.
+
+    Atributos:
+        writes: Escrituras completadas.
+        lock_waits: Veces que una escritura encontró la base bloqueada.
+        retries: Reintentos realizados después de un bloqueo.
+        failures: Escrituras que fallaron después de agotar los reintentos.
+        backoff_seconds: Tiempo total esperado entre reintentos.
+        queued: Escrituras enviadas a la cola del escritor.
+        queue_wait_seconds: Tiempo total que las escrituras esperaron en la cola.
+    """
+
+    FIELDS = (
+        "writes", "lock_waits", "retries", "failures", "backoff_seconds",
+        "queued", "queue_wait_seconds",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            for name in self.FIELDS:
+                setattr(self, name, 0)
+
+    def add(self, **amounts):
+        with self._lock:
+            for name, amount in amounts.items():
+                setattr(self, name, getattr(self, name) + amount)
+
+    def snapshot(self):
+        """
+        Devuelve los valores actuales de los contadores.
+
+        Returns:
+            dict: Nombre y valor de cada contador.
+        """
+        with self._lock:
+            return {name: getattr(self, name) for name in self.FIELDS}
+
+
+STATS = WriteStats()
+
+
+def is_locked_error(error):
+    """
+    Indica si un error de la base de datos se debe a un lock de escritura.
+
+    Args:
+        error: Excepción lanzada por la base de datos.
+
+    Returns:
+        bool: True si el error es "database is locked" o equivalente.
+    """
+    return isinstance(error, OperationalError) and any(
+        message in str(error) for message in LOCKED_MESSAGES
+    )
+
+
+def _backoff(attempt):
+    """
+    Espera exponencial con jitter: entre la mitad y 1.5 veces
+    WRITE_RETRY_BASE_DELAY * 2^attempt, sin pasar de WRITE_RETRY_MAX_DELAY.
+    """
+    delay = min(settings.WRITE_RETRY_MAX_DELAY, settings.WRITE_RETRY_BASE_DELAY * 2 ** attempt)
+    return delay * random.uniform(0.5, 1.5)
+
+
+def _run_with_retries(func, args, kwargs):
+    attempt = 0
+    while True:
+        previous = getattr(connection, "immediate_transactions", None)
+        try:
+            connection.immediate_transactions = True
+            try:
+                with transaction.atomic():
+                    result = func(*args, **kwargs)
+            finally:
+                connection.immediate_transactions = previous
+        except OperationalError as error:
+            if not is_locked_error(error):
+                raise
+            STATS.add(lock_waits=1)
+            if attempt >= settings.WRITE_RETRIES:
+                STATS.add(failures=1)
+                raise
+
+            delay = _backoff(attempt)
+            STATS.add(retries=1, backoff_seconds=delay)
+            time.sleep(delay)
+            attempt += 1
+            continue
+
+        STATS.add(writes=1)
+        return result
+
+
+class WriterQueue:
+    """
+    Clase de cola de escrituras: un único hilo del proceso ejecuta, en orden
+    de llegada, las escrituras que se le envían.
+
+    Así, dentro de un proceso nunca compiten dos escrituras por el lock de
+    SQLite; las solicitudes esperan su turno en la cola en lugar de reintentar.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._work, name="vetsoft-writer", daemon=True,
+                )
+                self._thread.start()
+
+    def _work(self):
+        while True:
+            future, func, args, kwargs, queued_at = self._queue.get()
+            STATS.add(queue_wait_seconds=time.monotonic() - queued_at)
+            close_old_connections()
+            try:
+                future.set_result(_run_with_retries(func, args, kwargs))
+            except BaseException as error:
+                future.set_exception(error)
+
+    def is_writer_thread(self):
+        return threading.current_thread() is self._thread
+
+    def submit(self, func, args, kwargs):
+        """
+        Envía una escritura a la cola y espera su resultado.
+
+        Returns:
+            object: Lo que devuelve `func`.
+        """
+        self._ensure_started()
+        future = Future()
+        STATS.add(queued=1)
+        self._queue.put((future, func, args, kwargs, time.monotonic()))
+        return future.result()
+
+
+WRITER = WriterQueue()
+
+
+def run_write(func, *args, **kwargs):
+    """
+    Ejecuta una escritura en una transacción coordinada.
+
+    La transacción se abre con BEGIN IMMEDIATE (con el backend
+    `app.backends.sqlite3`), y si la base está bloqueada por otra escritura se
+    reintenta hasta WRITE_RETRIES veces con espera exponencial con jitter. Con
+    WRITE_QUEUE activo, la escritura se ejecuta en el hilo escritor del
+    proceso (ver `WriterQueue`).
+
+    Si ya hay una transacción abierta, la escritura forma parte de ella y se
+    ejecuta directamente: no se puede reintentar sólo una parte.
+
+    Args:
+        func: Función que realiza la escritura.
+        *args: Argumentos posicionales de `func`.
+        **kwargs: Argumentos con nombre de `func`.
+
+    Returns:
+        object: Lo que devuelve `func`.
+    """
+    if connection.in_atomic_block:
+        return func(*args, **kwargs)
+    if settings.WRITE_QUEUE and not WRITER.is_writer_thread():
+        return WRITER.submit(func, args, kwargs)
+    return _run_with_retries(func, args, kwargs)
+
+
+async def arun_write(func, *args, **kwargs):
+    """
+    Versión asíncrona de `run_write`, para las vistas asíncronas.
+
+    Returns:
+        object: Lo que devuelve `func`.
+    """
+    return await sync_to_async(run_write)(func, *args, **kwargs)
+
+
+def coordinated_write(func):
+    """
+    Decorador que ejecuta la función con `run_write`.
+
+    Args:
+        func: Función que realiza una escritura.
+
+    Returns:
+        function: La función decorada.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return run_write(func, *args, **kwargs)
+
+    return wrapper
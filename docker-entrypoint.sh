@@ -0,0 +1,11 @@
+#!/bin/sh
+# Punto de entrada de producción: aplica las migraciones una vez y reemplaza
+# este proceso por el maestro de gunicorn (ver gunicorn.conf.py), que recibe
+# las señales del contenedor (TERM para apagar, HUP para recargar).
+set -e
+
+export DJANGO_SETTINGS_MODULE="${DJANGO_SETTINGS_MODULE:-vetsoft.settings_production}"
+
+python manage.py migrate --noinput
+
+exec gunicorn --config gunicorn.conf.py "$@"
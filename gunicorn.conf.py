@@ -0,0 +1,101 @@
+"""
+Configuración de gunicorn para producción (ver docker-entrypoint.sh).
+
+Un proceso maestro carga la aplicación una sola vez (preload_app) y crea los
+workers con fork. Con `kill -HUP` al maestro se recarga esta configuración y
+se reemplazan los workers de forma gradual: los nuevos empiezan a atender
+antes de que los anteriores terminen sus solicitudes en curso. Como el código
+se carga en el maestro, un cambio de código requiere reiniciar el servidor.
+"""
+
+import multiprocessing
+import os
+import tempfile
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vetsoft.settings_production")
+
+# Cada worker guarda sus métricas en este directorio para que /metrics sume
+# las de todos (ver app/metrics.py); sin él, cada consulta a /metrics sólo
+# vería las del worker que la atiende. Por defecto, uno por puerto en el
+# directorio temporal.
+os.environ.setdefault(
+    "VETSOFT_METRICS_DIR",
+    os.path.join(tempfile.gettempdir(), f"vetsoft-metrics-{os.environ.get('PORT', '8000')}"),
+)
+
+# Con VETSOFT_SERVER=asgi se sirve vetsoft.asgi (vistas asíncronas) con workers
+# de uvicorn; por defecto, vetsoft.wsgi con workers sincrónicos.
+if os.environ.get("VETSOFT_SERVER", "wsgi") == "asgi":
+    wsgi_app = "vetsoft.asgi:application"
+    worker_class = "uvicorn.workers.UvicornWorker"
+else:
+    wsgi_app = "vetsoft.wsgi:application"
+    worker_class = "sync"
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# WEB_CONCURRENCY fija la cantidad de workers; por defecto, 2 por CPU más 1.
+workers = int(os.environ.get("WEB_CONCURRENCY") or multiprocessing.cpu_count() * 2 + 1)
+
+preload_app = True
+
+timeout = 30
+graceful_timeout = 30
+keepalive = 5
+
+# Reinicia cada worker después de una cantidad de solicitudes (con jitter,
+# para que no se reinicien todos a la vez) y acota así su memoria.
+max_requests = 1000
+max_requests_jitter = 100
+
+# Logs de acceso y de errores en stdout/stderr, con la duración en ms.
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+access_log_format = '%(h)s "%(r)s" %(s)s %(b)s %(M)sms "%(a)s"'
+
+
+def on_starting(server):
+    """
+    Borra las métricas de un arranque anterior antes de crear los workers,
+    para que /metrics no sume las de procesos que ya no existen.
+    """
+    from app.metrics import clear_process_metrics
+
+    clear_process_metrics(os.environ["VETSOFT_METRICS_DIR"])
+
+
+def pre_fork(server, worker):
+    """
+    Cierra las conexiones a la base de datos del maestro antes de crear cada
+    worker, para que ningún worker herede una conexión abierta al precargar la
+    aplicación.
+    """
+    from django.db import connections
+
+    connections.close_all()
+
+
+def child_exit(server, worker):
+    """
+    Suma las métricas de un worker que terminó (por ejemplo, al reciclarlo
+    por max_requests) al acumulado de los workers terminados y borra su
+    archivo, para que METRICS_DIR no crezca con cada reinicio.
+    """
+    from app.metrics import retire_process_metrics
+
+    retire_process_metrics(worker.pid, os.environ["VETSOFT_METRICS_DIR"])
+
+
+def post_worker_init(worker):
+    """
+    Calienta cada worker antes de que empiece a atender solicitudes: el
+    maestro ya compiló los templates al precargar la aplicación, pero cada
+    worker abre su propia conexión a la base de datos (ver app/warmup.py).
+    """
+    from django.conf import settings
+
+    if settings.WARMUP:
+        from app.warmup import warm_up
+
+        warm_up()
@@ -8,9 +8,24 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 """
 
 import os
+import threading
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vetsoft.settings")
+# Bajo ASGI se usan las vistas asíncronas, salvo que se pida lo contrario con
+# VETSOFT_ASYNC_VIEWS=0.
+os.environ.setdefault("VETSOFT_ASYNC_VIEWS", "1")
 
 application = get_asgi_application()
+
+# Calienta el proceso antes de atender solicitudes (ver app/warmup.py). Uvicorn
+# carga la aplicación con el event loop en marcha, donde Django no permite
+# consultas sincrónicas, así que el calentamiento corre en otro hilo.
+if settings.WARMUP:
+    from app.warmup import warm_up
+
+    warmup_thread = threading.Thread(target=warm_up, name="vetsoft-warmup")
+    warmup_thread.start()
+    warmup_thread.join()
@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
+import os
+import warnings
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -23,7 +25,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = "django-insecure-p)^5i@33!)v)l7*c#q)%j(g5d+**-yo%)6l*vg!gs_w-e=^_ig"
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = os.environ.get("VETSOFT_DEBUG", "1") == "1"
 
 ALLOWED_HOSTS = []
 
@@ -37,24 +39,28 @@ INSTALLED_APPS = [
     "django.contrib.contenttypes",
     "django.contrib.sessions",
     "django.contrib.messages",
+    "whitenoise.runserver_nostatic",
     "django.contrib.staticfiles",
 ]
 
 MIDDLEWARE = [
+    "app.middleware.RequestTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "app.profiling.ProfilerMiddleware",
 ]
 
 ROOT_URLCONF = "vetsoft.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "app.backends.templates.DjangoTemplates",
         "DIRS": [],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -75,13 +81,58 @@ WSGI_APPLICATION = "vetsoft.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# Con DB_PROFILE=production las conexiones son persistentes (con chequeo de
+# salud) y cada conexión nueva se configura con los PRAGMA de SQLITE_PRAGMAS
+# (ver app/signals.py). Cada valor se puede cambiar con su variable de entorno.
+
+DB_PRODUCTION = os.environ.get("DB_PROFILE", "") == "production"
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "ENGINE": "app.backends.sqlite3",
+        "NAME": os.environ.get("DB_NAME") or BASE_DIR / "db.sqlite3",
+        "CONN_MAX_AGE": int(
+            os.environ.get("DB_CONN_MAX_AGE") or (600 if DB_PRODUCTION else 0),
+        ),
+        "CONN_HEALTH_CHECKS": (
+            os.environ.get("DB_CONN_HEALTH_CHECKS") or ("1" if DB_PRODUCTION else "0")
+        ) == "1",
     },
 }
 
+# PRAGMA aplicados a cada conexión nueva de SQLite, en este orden. En
+# producción: WAL para que las lecturas no esperen a las escrituras,
+# synchronous=NORMAL (seguro con WAL), 256 MB de mmap, 64 MB de caché de
+# páginas, tablas temporales en memoria y 5 s de espera ante un lock.
+
+SQLITE_PRAGMA_DEFAULTS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": "268435456",
+    "cache_size": "-64000",
+    "temp_store": "MEMORY",
+    "busy_timeout": "5000",
+}
+
+SQLITE_PRAGMAS = {}
+for _pragma, _default in SQLITE_PRAGMA_DEFAULTS.items():
+    _value = os.environ.get(f"SQLITE_{_pragma.upper()}") or (_default if DB_PRODUCTION else "")
+    if _value:
+        SQLITE_PRAGMAS[_pragma] = _value
+
+# Escrituras (ver app/writes.py): se reintentan hasta WRITE_RETRIES veces si la
+# base está bloqueada, esperando entre WRITE_RETRY_BASE_DELAY y
+# WRITE_RETRY_MAX_DELAY segundos (con jitter). Con VETSOFT_WRITE_QUEUE=1 las
+# escrituras de cada proceso pasan por un único hilo escritor.
+
+WRITE_RETRIES = int(os.environ.get("WRITE_RETRIES") or 5)
+
+WRITE_RETRY_BASE_DELAY = 0.05
+
+WRITE_RETRY_MAX_DELAY = 1.0
+
+WRITE_QUEUE = os.environ.get("VETSOFT_WRITE_QUEUE", "") == "1"
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -119,7 +170,201 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+STATIC_ROOT = BASE_DIR / "staticfiles"
+
+# Bootstrap y Bootstrap Icons están en app/static/vendor, así que las páginas
+# no dependen de una CDN. Sin DEBUG, `collectstatic` reduce los CSS de
+# PURGE_CSS_FILES a las clases que aparecen en PURGE_CSS_CONTENT, agrega un
+# hash del contenido al nombre de cada archivo y genera las versiones .gz y
+# .br (ver app/storage.py). WhiteNoise sirve los archivos con hash con caché
+# de un año y elige la versión comprimida según Accept-Encoding.
+
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        if DEBUG
+        else "app.storage.PurgedManifestStaticFilesStorage",
+    },
+}
+
+PURGE_CSS_FILES = (
+    "vendor/bootstrap/css/bootstrap.min.css",
+    "vendor/bootstrap-icons/bootstrap-icons.min.css",
+)
+
+# Archivos (relativos a BASE_DIR) en los que se buscan las clases usadas.
+PURGE_CSS_CONTENT = (
+    "app/templates/**/*.html",
+    "app/*.py",
+)
+
+# Clases que no aparecen en esos archivos: las que se arman en los templates,
+# como `alert-{{ message.tags }}`, y las que agrega el JavaScript de Bootstrap
+# al desplegar el menú.
+PURGE_CSS_SAFELIST = ("alert-*", "collapsing")
+
+# En desarrollo STATIC_ROOT no existe hasta correr collectstatic, y WhiteNoise
+# sirve los archivos desde app/static.
+warnings.filterwarnings("ignore", message="No directory at", module="whitenoise.base")
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+
+# Repository pagination
+# Tamaño de página por defecto y máximo de las vistas de repositorio (paginación por cursor).
+
+REPOSITORY_PAGE_SIZE = 25
+
+REPOSITORY_MAX_PAGE_SIZE = 200
+
+# Cantidad de filas que se leen y renderizan por bloque en el modo streaming (?stream=1).
+
+STREAMING_CHUNK_SIZE = 500
+
+
+# Bulk import
+# Filas por bloque de inserción y cantidad máxima de errores a informar por importación.
+
+IMPORT_CHUNK_SIZE = 5000
+
+IMPORT_MAX_ERRORS = 1000
+
+# Filas leídas por vez de la base de datos al exportar.
+
+EXPORT_CHUNK_SIZE = 5000
+
+# Mascotas actualizadas por bloque al vincularlas con su dueño y su
+# veterinario con `manage.py backfill_pet_links` (ver app/pet_links.py).
+
+PET_LINKS_BATCH_SIZE = 5000
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Por defecto se usa una caché en memoria por proceso; con varios procesos
+# conviene una caché compartida (por ejemplo CACHE_BACKEND=
+# django.core.cache.backends.redis.RedisCache y CACHE_LOCATION=redis://...).
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("CACHE_BACKEND")
+        or "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": os.environ.get("CACHE_LOCATION") or "vetsoft",
+    },
+}
+
+REPOSITORY_CACHE_ALIAS = "default"
+
+# Segundos que se guarda cada página de repositorio y tiempo máximo de espera
+# mientras otra solicitud la reconstruye.
+
+REPOSITORY_CACHE_TIMEOUT = 300
+
+REPOSITORY_CACHE_LOCK_TIMEOUT = 5
+
+
+# Vistas asíncronas
+# Si VETSOFT_ASYNC_VIEWS=1, los repositorios, formularios y stock usan las
+# vistas de app/async_views.py. vetsoft/asgi.py lo activa por defecto, así que
+# al servir con un servidor ASGI (uvicorn vetsoft.asgi:application) las
+# solicitudes que esperan a la base de datos no ocupan un hilo cada una.
+
+ASYNC_VIEWS = os.environ.get("VETSOFT_ASYNC_VIEWS", "") == "1"
+
+
+# Medición de solicitudes (ver app/middleware.py)
+# Cada respuesta lleva un encabezado Server-Timing con las consultas y los
+# tiempos de la base de datos, los templates y la vista, y se registra en el
+# logger "vetsoft.requests": como advertencia si supera alguno de los límites
+# y, con VETSOFT_LOG_LEVEL=INFO, todas las solicitudes.
+
+REQUEST_TIMING = os.environ.get("VETSOFT_REQUEST_TIMING", "1") == "1"
+
+REQUEST_QUERY_BUDGET = int(os.environ.get("REQUEST_QUERY_BUDGET") or 20)
+
+REQUEST_TIME_BUDGET_MS = int(os.environ.get("REQUEST_TIME_BUDGET_MS") or 500)
+
+REQUEST_REPEATED_QUERY_LIMIT = int(os.environ.get("REQUEST_REPEATED_QUERY_LIMIT") or 5)
+
+# Métricas de /metrics (ver app/metrics.py). Con varios procesos, cada uno
+# guarda sus métricas en VETSOFT_METRICS_DIR cada METRICS_FLUSH_INTERVAL
+# segundos y /metrics suma las de todos. Al iniciar el servidor se borran los
+# archivos de un arranque anterior (ver `metrics.clear_process_metrics`).
+
+METRICS_DIR = os.environ.get("VETSOFT_METRICS_DIR", "")
+
+METRICS_FLUSH_INTERVAL = 5
+
+# Perfilado a pedido (ver app/profiling.py). Con VETSOFT_PROFILING=1 un
+# usuario staff puede perfilar una solicitud con ?_profile=cprofile o
+# ?_profile=sample; los resultados se guardan en VETSOFT_PROFILE_DIR.
+
+PROFILING = os.environ.get("VETSOFT_PROFILING", "") == "1"
+
+PROFILE_DIR = os.environ.get("VETSOFT_PROFILE_DIR", "")
+
+PROFILE_SAMPLE_INTERVAL = 0.001
+
+PROFILE_TOP = 40
+
+# Log de consultas lentas (ver app/slow_queries.py): las consultas que tardan
+# SLOW_QUERY_MS milisegundos o más se registran en SLOW_QUERY_LOG, que rota al
+# llegar a SLOW_QUERY_LOG_MAX_BYTES. `python manage.py slow_queries_report`
+# muestra las más costosas.
+
+SLOW_QUERY_MS = float(os.environ.get("SLOW_QUERY_MS") or 200)
+
+SLOW_QUERY_LOG = os.environ.get("VETSOFT_SLOW_QUERY_LOG") or BASE_DIR / "slow_queries.log"
+
+SLOW_QUERY_LOG_MAX_BYTES = 10 * 1024 * 1024
+
+SLOW_QUERY_LOG_BACKUPS = 5
+
+# Calentamiento de cada proceso al iniciar (ver app/warmup.py): resuelve las
+# URL, compila los templates y abre la conexión a la base de datos antes de
+# atender solicitudes. /ready responde 503 hasta que termina.
+
+WARMUP = os.environ.get("VETSOFT_WARMUP", "1") == "1"
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "plain": {"format": "%(asctime)s %(levelname)s %(name)s %(message)s"},
+        "message": {"format": "%(message)s"},
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "plain"},
+        "slow_queries": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": SLOW_QUERY_LOG,
+            "maxBytes": SLOW_QUERY_LOG_MAX_BYTES,
+            "backupCount": SLOW_QUERY_LOG_BACKUPS,
+            "delay": True,
+            "formatter": "message",
+        },
+    },
+    "loggers": {
+        "vetsoft": {
+            "handlers": ["console"],
+            "level": os.environ.get("VETSOFT_LOG_LEVEL") or "WARNING",
+            "propagate": False,
+        },
+        "vetsoft.warmup": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
+        "vetsoft.slow_queries": {
+            "handlers": ["slow_queries"],
+            "level": "WARNING",
+            "propagate": False,
+        },
+    },
+}
@@ -0,0 +1,45 @@
+"""
+Django settings for running vetsoft in production (see gunicorn.conf.py).
+
+They are the settings of vetsoft/settings.py with DEBUG off, the production
+database profile (DB_PROFILE=production) and hashed, compressed static
+files. The secret key and the allowed hosts come from the environment.
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+# Se definen antes de cargar settings.py, que decide con ellas DEBUG, el perfil
+# de la base de datos y el almacenamiento de los archivos estáticos.
+os.environ.setdefault("VETSOFT_DEBUG", "0")
+os.environ.setdefault("DB_PROFILE", "production")
+
+from .settings import *  # noqa: E402, F403
+
+SECRET_KEY = os.environ.get("DJANGO_SECRET_KEY", "")
+if not SECRET_KEY:
+    raise ImproperlyConfigured("Falta la variable de entorno DJANGO_SECRET_KEY.")
+
+# Nombres de host (o IP) con que se accede al servidor, separados por comas.
+ALLOWED_HOSTS = [
+    host.strip()
+    for host in os.environ.get("DJANGO_ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
+    if host.strip()
+]
+
+CSRF_TRUSTED_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get("DJANGO_CSRF_TRUSTED_ORIGINS", "").split(",")
+    if origin.strip()
+]
+
+# Con VETSOFT_HTTPS=1 (detrás de un proxy que termina TLS) las cookies sólo
+# viajan por HTTPS y se redirige HTTP a HTTPS. En la red de la clínica se
+# puede servir por HTTP sin configurarla.
+if os.environ.get("VETSOFT_HTTPS", "") == "1":
+    SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
+    SECURE_SSL_REDIRECT = True
+    SESSION_COOKIE_SECURE = True
+    CSRF_COOKIE_SECURE = True
+    SECURE_HSTS_SECONDS = int(os.environ.get("VETSOFT_HSTS_SECONDS") or 0)
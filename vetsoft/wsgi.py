@@ -9,8 +9,15 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vetsoft.settings")
 
 application = get_wsgi_application()
+
+# Calienta el proceso antes de atender solicitudes (ver app/warmup.py).
+if settings.WARMUP:
+    from app.warmup import warm_up
+
+    warm_up()